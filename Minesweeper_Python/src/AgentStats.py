@@ -0,0 +1,55 @@
+class PhaseStats:
+    """per-phase call counts, cumulative time and decisions of MyAI.getAction, for one game or many"""
+
+    PHASES = ("queue", "deferred", "explore", "patterns", "guess")
+
+    def __init__(self):
+        self.games = 0
+        self.guesses = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.calls = dict.fromkeys(self.PHASES, 0)
+        self.seconds = dict.fromkeys(self.PHASES, 0.0)
+        self.decisions = dict.fromkeys(self.PHASES, 0)
+
+    def merge(self, other):
+        """adds another game's (or aggregate's) counters to these"""
+        self.games += other.games
+        self.guesses += other.guesses
+        self.cache_hits += other.cache_hits
+        self.cache_misses += other.cache_misses
+        for phase in self.PHASES:
+            self.calls[phase] += other.calls[phase]
+            self.seconds[phase] += other.seconds[phase]
+            self.decisions[phase] += other.decisions[phase]
+
+    def asDict(self):
+        """plain dict, for pickling across processes and dumping as JSON"""
+        return {"games": self.games, "guesses": self.guesses,
+                "cache_hits": self.cache_hits, "cache_misses": self.cache_misses,
+                "calls": dict(self.calls), "seconds": dict(self.seconds), "decisions": dict(self.decisions)}
+
+    @classmethod
+    def fromDict(cls, data):
+        stats = cls()
+        stats.games = data["games"]
+        stats.guesses = data["guesses"]
+        stats.cache_hits = data.get("cache_hits", 0)
+        stats.cache_misses = data.get("cache_misses", 0)
+        stats.calls.update(data["calls"])
+        stats.seconds.update(data["seconds"])
+        stats.decisions.update(data["decisions"])
+        return stats
+
+    def report(self):
+        """table of the counters, one line per phase"""
+        total = sum(self.seconds.values()) or 1.0
+        lines = ["{:<10}{:>12}{:>12}{:>8}{:>12}".format("phase", "calls", "seconds", "time", "decisions")]
+        for phase in self.PHASES:
+            lines.append("{:<10}{:>12}{:>12.3f}{:>7.1f}%{:>12}".format(
+                phase, self.calls[phase], self.seconds[phase], 100 * self.seconds[phase] / total, self.decisions[phase]))
+        lines.append("games: {} \tguesses: {}".format(self.games, self.guesses))
+        lookups = self.cache_hits + self.cache_misses
+        lines.append("component cache: {} hits \t{} misses \t{:.1f}% hit rate".format(
+            self.cache_hits, self.cache_misses, 100 * self.cache_hits / lookups if lookups else 0.0))
+        return "\n".join(lines)
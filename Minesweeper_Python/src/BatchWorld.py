@@ -0,0 +1,230 @@
+# Vectorized multi-board engine: N worlds of the same dimensions held as
+# stacked NumPy arrays (mines, covered, flags, numbers, one row per board,
+# tile (c, r) at column c * rows + r as in World), stepped together with
+# one action per board per step.
+#
+# Scoring and move accounting are those of World.run: invalid actions are
+# skipped without counting as a move, uncovering a mine or LEAVE ends the
+# game, and a game ends once it has made more than rows * cols * 2 moves.
+#
+# Agents that play many boards at once implement
+#	getActions(boards, percepts) -> (moves, xs, ys)
+# where boards are the indices of the boards still playing, percepts their
+# last percepts, and moves the AI.Action values; PerBoardAgents gives any
+# getAction agent that interface, one agent per board.
+#
+# Syntax:	python3 BatchWorld.py (-f InputPath | -g R C M COUNT SEED) [--batch N] [-r | --bitboard]
+
+import argparse
+try:
+	import numpy
+except ImportError:
+	numpy = None
+from AI import AI
+from MyAI import MyAI
+from RandomAI import RandomAI
+from BitboardAI import BitboardAI
+from Scoring import boardValue
+from WorldStream import addWorldArguments, worldRecords, worldSource
+
+AGENTS = {"myai": MyAI, "random": RandomAI, "bitboard": BitboardAI}
+LEAVE = AI.Action.LEAVE.value
+UNCOVER = AI.Action.UNCOVER.value
+FLAG = AI.Action.FLAG.value
+UNFLAG = AI.Action.UNFLAG.value
+
+
+class PerBoardAgents():
+	""" Batch interface over one getAction agent per board """
+
+	def __init__(self, records: "list of WorldRecords", aiType: str = "myai"):
+		agent = AGENTS[aiType]
+		self.__agents = [agent(record.rows, record.cols, record.totalMines, record.startX, record.startY)
+						 for record in records]
+
+
+	def getActions(self, boards: "numpy array", percepts: "numpy array") -> "tuple of numpy arrays":
+		moves = numpy.empty(len(boards), dtype=numpy.int64)
+		xs = numpy.empty(len(boards), dtype=numpy.int64)
+		ys = numpy.empty(len(boards), dtype=numpy.int64)
+		agents = self.__agents
+		for i, (board, percept) in enumerate(zip(boards.tolist(), percepts.tolist())):
+			action = agents[board].getAction(percept)
+			moves[i] = action.getMove().value
+			xs[i] = action.getX()
+			ys[i] = action.getY()
+		return moves, xs, ys
+
+
+class BatchWorld():
+
+	def __init__(self, records: "list of WorldRecords", agent: "str or batch agent" = "myai"):
+		if numpy is None:
+			raise ImportError("BatchWorld needs NumPy")
+		if not records:
+			raise ValueError("A batch needs at least one world")
+		rows = records[0].rows
+		cols = records[0].cols
+		if any(record.rows != rows or record.cols != cols for record in records):
+			raise ValueError("Every world of a batch must have the same dimensions")
+
+		count = len(records)
+		size = rows * cols
+		self.__rowDimension = rows
+		self.__colDimension = cols
+		self.__movesLimit = size * 2
+		self.__agent = PerBoardAgents(records, agent) if isinstance(agent, str) else agent
+
+		self.__mines = numpy.frombuffer(b"".join(bytes(record.mines) for record in records),
+										dtype=numpy.uint8).reshape(count, size).astype(bool)
+		self.__numbers = self.__countNeighbours()
+		self.__covered = numpy.ones((count, size), dtype=bool)
+		self.__flags = numpy.zeros((count, size), dtype=bool)
+		self.__totalMines = numpy.array([record.totalMines for record in records], dtype=numpy.int64)
+		self.__flagsLeft = self.__totalMines.copy()
+		self.__score = numpy.zeros(count, dtype=numpy.int64)
+		self.__movesMade = numpy.zeros(count, dtype=numpy.int64)
+		self.__active = numpy.ones(count, dtype=bool)
+		self.__percepts = numpy.zeros(count, dtype=numpy.int64)
+
+		# Every world starts with its first tile uncovered
+		boards = numpy.arange(count)
+		starts = numpy.array([record.startX * rows + record.startY for record in records], dtype=numpy.int64)
+		self.__uncover(boards, starts)
+
+
+	def __len__(self) -> int:
+		return len(self.__score)
+
+
+	def run(self) -> "numpy array":
+		""" Play every board to the end, returning the scores World.run would give """
+		while self.__active.any():
+			self.step()
+		return self.getScores()
+
+
+	def step(self) -> None:
+		""" Ask the agent for one action per board still playing and apply them all """
+		rows = self.__rowDimension
+		boards = numpy.flatnonzero(self.__active)
+		moves, xs, ys = self.__agent.getActions(boards, self.__percepts[boards])
+
+		valid = (xs >= 0) & (xs < self.__colDimension) & (ys >= 0) & (ys < rows) & (moves >= LEAVE) & (moves <= UNFLAG)
+		boards = boards[valid]
+		moves = moves[valid]
+		tiles = xs[valid] * rows + ys[valid]
+		self.__movesMade[boards] += 1
+
+		self.__active[boards[moves == LEAVE]] = False
+
+		uncovering = moves == UNCOVER
+		uncoverBoards = boards[uncovering]
+		uncoverTiles = tiles[uncovering]
+		hit = self.__mines[uncoverBoards, uncoverTiles]
+		self.__active[uncoverBoards[hit]] = False
+		self.__uncover(uncoverBoards[~hit], uncoverTiles[~hit])
+
+		flagging = moves == FLAG
+		self.__flag(boards[flagging], tiles[flagging])
+		unflagging = moves == UNFLAG
+		self.__unflag(boards[unflagging], tiles[unflagging])
+
+		self.__active &= self.__movesMade <= self.__movesLimit
+
+
+	def getScores(self) -> "numpy array":
+		""" Score of every board so far, as World's __handleGameover computes it """
+		rows = self.__rowDimension
+		cols = self.__colDimension
+		won = self.__score == rows * cols - self.__totalMines
+		return numpy.where(won, boardValue(rows, cols), 0)
+
+
+	def getMovesMade(self) -> "numpy array":
+		return self.__movesMade.copy()
+
+
+	def __countNeighbours(self) -> "numpy array":
+		""" Hint numbers of every board as 3x3 neighbourhood sums, like World.__addNumbersVectorized """
+		count = self.__mines.shape[0]
+		rows = self.__rowDimension
+		cols = self.__colDimension
+		mines = self.__mines.reshape(count, cols, rows).astype(numpy.int64)
+		padded = numpy.pad(mines, ((0, 0), (1, 1), (1, 1)))
+		numbers = -mines
+		for dc in range(3):
+			for dr in range(3):
+				numbers = numbers + padded[:, dc:dc+cols, dr:dr+rows]
+		return numbers.reshape(count, rows * cols)
+
+
+	def __uncover(self, boards: "numpy array", tiles: "numpy array") -> None:
+		newly = self.__covered[boards, tiles]
+		self.__covered[boards, tiles] = False
+		self.__score[boards[newly]] += 1
+		self.__percepts[boards] = self.__numbers[boards, tiles]
+
+
+	def __flag(self, boards: "numpy array", tiles: "numpy array") -> None:
+		placed = self.__covered[boards, tiles] & ~self.__flags[boards, tiles] & (self.__flagsLeft[boards] > 0)
+		self.__flags[boards[placed], tiles[placed]] = True
+		self.__flagsLeft[boards[placed]] -= 1
+		self.__percepts[boards] = -1
+
+
+	def __unflag(self, boards: "numpy array", tiles: "numpy array") -> None:
+		# World caps the flags left at 10 when unflagging; kept for identical behaviour
+		removed = self.__covered[boards, tiles] & self.__flags[boards, tiles]
+		self.__flags[boards[removed], tiles[removed]] = False
+		self.__flagsLeft[boards] = numpy.minimum(self.__flagsLeft[boards] + removed, 10)
+		self.__percepts[boards] = -1
+
+
+def runBatches(records: "iterable of WorldRecords", batchSize: int, aiType: str = "myai") -> "list of ints":
+	""" Play every world in batches of up to batchSize same-size worlds, returning the scores in world order """
+	scores = []
+	pending = {}
+
+	def flush(dimensions):
+		batch = pending.pop(dimensions)
+		for (position, _), score in zip(batch, BatchWorld([record for _, record in batch], aiType).run().tolist()):
+			scores.append((position, score))
+
+	for position, record in enumerate(records):
+		dimensions = (record.rows, record.cols)
+		pending.setdefault(dimensions, []).append((position, record))
+		if len(pending[dimensions]) >= batchSize:
+			flush(dimensions)
+	for dimensions in list(pending):
+		flush(dimensions)
+	return [score for _, score in sorted(scores)]
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Play many Minesweeper worlds at once on stacked boards",
+									 prog="BatchWorld.py")
+	addWorldArguments(parser)
+	parser.add_argument("--batch", help="boards stepped together", type=int, default=1000)
+	parser.add_argument("-r", help="use RandomAI instead of MyAI", action="store_true")
+	parser.add_argument("--bitboard", help="use BitboardAI instead of MyAI", action="store_true")
+	args = parser.parse_args()
+
+	try:
+		spec = worldSource(args)
+	except ValueError as e:
+		print("ERROR: " + str(e))
+		return
+	if numpy is None:
+		print("ERROR: BatchWorld.py needs NumPy")
+		return
+
+	aiType = "random" if args.r else "bitboard" if args.bitboard else "myai"
+	scores = runBatches(worldRecords(args.f, spec), max(1, args.batch), aiType)
+	print("---------------Your agent's results:---------------")
+	print("Beginner: {} \tIntermediate: {} \tExpert: {}".format(scores.count(1), scores.count(2), scores.count(3)))
+	print("Cumulative Score: " + str(sum(scores)))
+
+
+if __name__ == "__main__":
+	main()
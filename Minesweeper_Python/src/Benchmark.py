@@ -0,0 +1,209 @@
+# Microbenchmarks for the agent and referee hot paths.
+#
+# Every benchmark runs on the same seeded worlds (see WorldStream.py) at
+# beginner, intermediate and expert sizes, and reports calls, ops/sec and
+# mean per-call latency:
+#
+#	getAction				MyAI.getAction over whole games
+#	getAdjacentCells		MyAI.getAdjacentCells on every cell of the board
+#	processDeferredQueue	MyAI.processDeferredQueue on agent states saved
+#							from real games just before that phase ran
+#	one_one_and_variations	same, for the pattern phase
+#	doMove					World.__doMove replaying the moves of real games
+#
+# Syntax:	python3 Benchmark.py [--worlds N] [--seed S] [--only NAME ...]
+#								 [--save FILE] [--compare FILE] [--threshold X]
+#
+#			--save writes the results as a JSON baseline, --compare prints
+#			each result against such a baseline and flags slowdowns by
+#			more than --threshold (default 1.10) as regressions.
+
+import argparse
+import copy
+import json
+import sys
+import time
+from World import World
+from MyAI import MyAI
+from ComponentCache import shared_cache
+from WorldStream import StreamSpec, streamRecord
+
+SIZES = (("beginner", 8, 8, 10), ("intermediate", 16, 16, 40), ("expert", 16, 30, 99))
+# Agent phases timed on saved agent states
+PHASES = ("processDeferredQueue", "one_one_and_variations")
+BENCHMARKS = ("getAction", "getAdjacentCells", "doMove") + PHASES
+SNAPSHOTS_PER_WORLD = 20
+REGRESSION_THRESHOLD = 1.10
+
+
+def records(spec: StreamSpec) -> "list of WorldRecords":
+    """ The seeded worlds of one board size """
+    return [streamRecord(spec, i) for i in range(1, spec.count+1)]
+
+
+def copyAgent(agent: MyAI) -> MyAI:
+    """ Deep copy of an agent that shares the process-wide component cache instead of copying it """
+    return copy.deepcopy(agent, {id(shared_cache): shared_cache})
+
+
+def recordSnapshots(record: "WorldRecord", phases: "tuple of strings") -> dict:
+    """ Play one game, saving copies of the agent just before each of the given phases runs """
+    world = World(record=record, headless=True)
+    agent = world._World__ai
+    snapshots = {phase: [] for phase in phases}
+
+    for phase in phases:
+        method = getattr(agent, phase)
+
+        def recorder(*args, boundPhase=phase, boundMethod=method, **kwargs):
+            if len(snapshots[boundPhase]) < SNAPSHOTS_PER_WORLD:
+                snapshots[boundPhase].append(copyAgent(agent))
+            return boundMethod(*args, **kwargs)
+        setattr(agent, phase, recorder)
+
+    world.run()
+    return snapshots
+
+
+def timeGetAction(record: "WorldRecord") -> "tuple":
+    """ Play one game, returning the actions taken and the latency of every getAction call """
+    world = World(record=record, headless=True)
+    agent = world._World__ai
+    getAction = agent.getAction
+    actions = []
+    latencies = []
+
+    def timedGetAction(number):
+        start = time.perf_counter()
+        action = getAction(number)
+        latencies.append(time.perf_counter() - start)
+        actions.append(action)
+        return action
+    agent.getAction = timedGetAction
+
+    world.run()
+    return actions, latencies
+
+
+def timePhase(snapshots: "list of MyAIs", phase: str) -> "list of floats":
+    """ Time phase on a fresh copy of every snapshot; copying is not timed """
+    latencies = []
+    for snapshot in snapshots:
+        agent = copyAgent(snapshot)
+        # The recording wrappers live on the instance; time the class method
+        method = getattr(MyAI, phase)
+        start = time.perf_counter()
+        method(agent)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def timeAdjacentCells(record: "WorldRecord", rounds: int = 20) -> "list of floats":
+    """ Time getAdjacentCells on every cell of a board """
+    agent = MyAI(record.rows, record.cols, record.totalMines, record.startX, record.startY)
+    cells = [(col, row) for col in range(record.cols) for row in range(record.rows)]
+    getAdjacentCells = agent.getAdjacentCells
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for col, row in cells:
+            getAdjacentCells(col, row)
+    elapsed = time.perf_counter() - start
+    calls = rounds * len(cells)
+    return [elapsed / calls] * calls
+
+
+def timeDoMove(record: "WorldRecord", actions: "list of Actions", rounds: int = 5) -> "list of floats":
+    """ Time World.__doMove replaying the actions of a recorded game, on a fresh world each round """
+    latencies = []
+    for _ in range(rounds):
+        doMove = World(record=record, headless=True)._World__doMove
+        for action in actions:
+            start = time.perf_counter()
+            over = doMove(action)
+            latencies.append(time.perf_counter() - start)
+            if over:
+                break
+    return latencies
+
+
+def summarize(latencies: "list of floats") -> dict:
+    """ Calls, ops/sec and mean latency in microseconds """
+    total = sum(latencies)
+    calls = len(latencies)
+    return {"calls": calls,
+            "ops_per_sec": calls / total if total else 0.0,
+            "latency_us": total / calls * 1e6 if calls else 0.0}
+
+
+def runBenchmarks(numWorlds: int, seed: int, only: "list of strings" = None) -> dict:
+    """ Run every benchmark, or only those named, at every size, returning {"name/size": summary} """
+    selected = [name for name in BENCHMARKS if not only or name in only]
+    phases = tuple(phase for phase in PHASES if phase in selected)
+    results = {}
+    for size, rows, cols, mines in SIZES:
+        latencies = {name: [] for name in selected}
+        for record in records(StreamSpec(rows, cols, mines, numWorlds, seed)):
+            # Every game starts from an empty component cache, so timings don't depend on the games before
+            if "getAction" in latencies or "doMove" in latencies:
+                shared_cache.clear()
+                actions, getActionLatencies = timeGetAction(record)
+                if "getAction" in latencies:
+                    latencies["getAction"] += getActionLatencies
+                if "doMove" in latencies:
+                    latencies["doMove"] += timeDoMove(record, actions)
+            if "getAdjacentCells" in latencies:
+                latencies["getAdjacentCells"] += timeAdjacentCells(record)
+            if phases:
+                shared_cache.clear()
+                snapshots = recordSnapshots(record, phases)
+                for phase in phases:
+                    latencies[phase] += timePhase(snapshots[phase], phase)
+        for name, values in latencies.items():
+            results[name + "/" + size] = summarize(values)
+    return results
+
+
+def printResults(results: dict, baseline: dict = None, threshold: float = REGRESSION_THRESHOLD) -> None:
+    """ Print one line per benchmark, with the change against the baseline if there is one """
+    print("{:<38}{:>10}{:>14}{:>14}".format("benchmark", "calls", "ops/sec", "latency us") +
+          ("{:>10}".format("vs base") if baseline else ""))
+    for name, result in results.items():
+        line = "{:<38}{:>10}{:>14.0f}{:>14.2f}".format(name, result["calls"], result["ops_per_sec"], result["latency_us"])
+        if baseline and name in baseline and result["latency_us"]:
+            ratio = baseline[name]["latency_us"] / result["latency_us"]
+            line += "{:>9.2f}x".format(ratio)
+            if ratio * threshold < 1:
+                line += "  REGRESSION"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Microbenchmarks for MyAI and World hot paths", prog="Benchmark.py")
+    parser.add_argument("--worlds", help="worlds per board size", type=int, default=20)
+    parser.add_argument("--seed", help="seed of the benchmark worlds", type=int, default=1)
+    parser.add_argument("--only", help="only run these benchmarks", nargs="+", choices=BENCHMARKS)
+    parser.add_argument("--save", help="write the results to this baseline file")
+    parser.add_argument("--compare", help="compare the results against this baseline file")
+    parser.add_argument("--threshold", help="slowdown factor reported as a regression", type=float,
+                        default=REGRESSION_THRESHOLD)
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        try:
+            with open(args.compare) as file:
+                baseline = json.load(file)["results"]
+        except (OSError, ValueError, KeyError):
+            print("ERROR: Could not read baseline " + args.compare)
+            sys.exit(1)
+
+    results = runBenchmarks(args.worlds, args.seed, args.only)
+    printResults(results, baseline, args.threshold)
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump({"worlds": args.worlds, "seed": args.seed, "results": results}, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
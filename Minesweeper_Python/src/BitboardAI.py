@@ -0,0 +1,261 @@
+from AI import AI
+from Action import Action
+from FrontierSolver import FrontierSolver
+from Neighbours import neighbourMasks, flatPartnerTable
+from PatternCompiler import (pattern_key, ONLY_A_SAFE, ONLY_A_MINES, ONLY_B_SAFE, ONLY_B_MINES,
+                             SHARED_SAFE, SHARED_MINES)
+from PatternTable import PATTERNS
+from heapq import heappush, heappop
+
+
+if hasattr(int, "bit_count"):
+    popcount = int.bit_count
+else:
+    # int.bit_count is Python 3.10+
+    def popcount(mask):
+        """number of set bits of mask"""
+        return bin(mask).count("1")
+
+
+def bits(mask):
+    """indices of the set bits of mask, lowest first"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class BitboardAI(AI):
+    """MyAI's deductions and guesses on int bitsets instead of a grid and sets of tuples
+
+    bit col * rowDimension + row of every set stands for cell (col, row), the layout World uses;
+    neighbour counts are popcounts of the cell's precomputed neighbour mask ANDed with a set
+    """
+
+    def __init__(self, rowDimension, colDimension, totalMines, startX, startY):
+        self.row_dimension = rowDimension
+        self.col_dimension = colDimension
+        self.total_mines = totalMines
+        self.total_cells = rowDimension * colDimension
+        self.all_cells = (1 << self.total_cells) - 1
+        self.masks = neighbourMasks(colDimension, rowDimension)
+        self.partners = flatPartnerTable(colDimension, rowDimension)
+
+        start = startX * rowDimension + startY
+        self.numbers = [None] * self.total_cells
+        self.safe = 1 << start  # revealed, or queued to be uncovered
+        self.flagged = 0  # known mines, flagged or queued to be
+        self.revealed = 0
+        self.frontier = 0  # revealed hints that may still border undecided cells
+        self.dirty = 0  # frontier hints whose neighbourhood changed since the basic rule last ran on them
+        self.dirty_patterns = 0  # same, for the pattern table
+        self.queue = []
+        self.last_batch = [(start, True)]  # (cell, uncovered) of the moves the next percepts answer
+        self.guesses = 0
+        self.solver = FrontierSolver()
+
+    def cell(self, index):
+        """(col, row) of a bit index"""
+        return divmod(index, self.row_dimension)
+
+    def reveal(self, index, number):
+        """records the hint of an uncovered cell"""
+        bit = 1 << index
+        if self.revealed & bit:
+            return
+        self.revealed |= bit
+        if not self.safe & bit:
+            # Uncovered by a flood fill rather than by us
+            self.safe |= bit
+            self.touch(bit)
+        self.numbers[index] = number
+        if number == 0:
+            self.mark_safe(self.masks[index], 0)
+        elif number > 0:
+            self.frontier |= bit
+            self.dirty |= bit
+            self.dirty_patterns |= bit
+
+    def touch(self, mask):
+        """cells in mask were decided, so the frontier hints around them need another look"""
+        near = 0
+        for index in bits(mask):
+            near |= self.masks[index]
+        near &= self.frontier
+        self.dirty |= near
+        self.dirty_patterns |= near
+
+    def mark_safe(self, mask, priority):
+        """queues every undecided cell of mask to be uncovered"""
+        new = mask & ~(self.safe | self.flagged)
+        if new:
+            self.safe |= new
+            for index in bits(new):
+                heappush(self.queue, (priority, index, AI.Action.UNCOVER.value))
+            self.touch(new)
+        return new
+
+    def mark_mines(self, mask, priority):
+        """queues every undecided cell of mask to be flagged"""
+        new = mask & ~(self.safe | self.flagged)
+        if new:
+            self.flagged |= new
+            for index in bits(new):
+                heappush(self.queue, (priority, index, AI.Action.FLAG.value))
+            self.touch(new)
+        return new
+
+    def constraint(self, index):
+        """(undecided neighbours, mines still missing around them) of a hint"""
+        mask = self.masks[index]
+        return mask & ~(self.safe | self.flagged), self.numbers[index] - popcount(mask & self.flagged)
+
+    def run_queue(self):
+        """pops the next queued move that still needs making"""
+        while self.queue:
+            _, index, move = heappop(self.queue)
+            if move == AI.Action.UNCOVER.value and self.revealed >> index & 1:
+                continue
+            col, row = self.cell(index)
+            return Action(AI.Action(move), col, row)
+        return None
+
+    def check_hints(self):
+        """the basic rule on every dirty hint: all missing mines or no missing mines among its undecided cells"""
+        dirty = self.dirty
+        self.dirty = 0
+        for index in bits(dirty & self.frontier):
+            undecided, need = self.constraint(index)
+            if not undecided:
+                self.frontier &= ~(1 << index)
+            elif need == 0:
+                self.mark_safe(undecided, self.numbers[index])
+            elif need == popcount(undecided):
+                self.mark_mines(undecided, self.numbers[index])
+
+    def check_patterns(self):
+        """looks dirty hints up against their nearby hints in the pattern table, True once one matches"""
+        frontier = self.frontier
+        for index in bits(self.dirty_patterns & frontier):
+            self.dirty_patterns &= ~(1 << index)
+            cells_a, need_a = self.constraint(index)
+            if not cells_a:
+                continue
+            matched = False
+            for partner in self.partners[index]:
+                if not frontier >> partner & 1:
+                    continue
+                cells_b, need_b = self.constraint(partner)
+                shared = cells_a & cells_b
+                if not shared:
+                    continue
+                only_a = cells_a & ~shared
+                only_b = cells_b & ~shared
+                entry = PATTERNS.get(pattern_key(popcount(only_a), popcount(only_b), popcount(shared),
+                                                 need_a, need_b))
+                if entry:
+                    for cells, safe_bit, mines_bit in ((only_a, ONLY_A_SAFE, ONLY_A_MINES),
+                                                       (shared, SHARED_SAFE, SHARED_MINES),
+                                                       (only_b, ONLY_B_SAFE, ONLY_B_MINES)):
+                        if entry & safe_bit:
+                            self.mark_safe(cells, 1)
+                        elif entry & mines_bit:
+                            self.mark_mines(cells, 1)
+                    matched = True
+            if matched:
+                return True
+        self.dirty_patterns = 0
+        return False
+
+    def guess(self):
+        """flags certain mines and queues all provably safe cells, else the least likely mine; False if none is left"""
+        undecided = self.all_cells & ~(self.safe | self.flagged)
+        if not undecided:
+            return False
+        # The frontier solver and its component cache work on (col, row) cells, whose rotations and
+        # reflections the cache keys on, so guessing unpacks the frontier; it only runs once the bitset rules are stuck
+        constraints = []
+        constrained = 0
+        for index in bits(self.frontier):
+            cells, need = self.constraint(index)
+            if cells:
+                constraints.append((tuple(self.cell(i) for i in bits(cells)), need))
+                constrained |= cells
+        interior = undecided & ~constrained
+        probabilities, interior_probability = self.solver.global_probabilities(
+            constraints, self.total_mines - popcount(self.flagged), popcount(interior))
+        if interior_probability is not None:
+            for index in bits(interior):
+                probabilities[self.cell(index)] = interior_probability
+
+        rows = self.row_dimension
+        mines = 0
+        safe = 0
+        for (col, row), probability in probabilities.items():
+            if probability == 1:
+                mines |= 1 << (col * rows + row)
+            elif probability == 0:
+                safe |= 1 << (col * rows + row)
+        self.mark_mines(mines, 0)
+        if safe:
+            return bool(self.mark_safe(safe, 0))
+        candidates = [cell for cell, probability in probabilities.items() if probability < 1]
+        if not candidates:
+            return bool(mines)
+        self.guesses += 1
+        col, row = min(candidates, key=lambda cell: (probabilities[cell], cell[1], cell[0]))
+        return bool(self.mark_safe(1 << (col * rows + row), 0))
+
+    def decide(self):
+        """picks the next move once every percept has been taken in"""
+        while True:
+            action = self.run_queue()
+            if action:
+                return action
+            if self.dirty:
+                self.check_hints()
+            elif not (self.dirty_patterns and self.check_patterns()) and not self.guess():
+                return Action(AI.Action.LEAVE)
+
+    def isComplete(self):
+        """every safe cell has been uncovered"""
+        return popcount(self.revealed) == self.total_cells - self.total_mines
+
+    def remember(self, actions):
+        """keeps which cells the percepts of the next call answer"""
+        rows = self.row_dimension
+        self.last_batch = [(action.getX() * rows + action.getY(), action.getMove() == AI.Action.UNCOVER)
+                           for action in actions]
+
+    def getAction(self, number: int) -> "Action Object":
+        index, uncovered = self.last_batch[0]
+        if uncovered:
+            self.reveal(index, number)
+        if self.isComplete():
+            return Action(AI.Action.LEAVE)
+        action = self.decide()
+        self.remember([action])
+        return action
+
+    def revealBatch(self, reveals):
+        """takes the (col, row, number) cells the world uncovered by flood fill since the last action"""
+        rows = self.row_dimension
+        for col, row, number in reveals:
+            self.reveal(col * rows + row, number)
+
+    def getActionBatch(self, percepts):
+        """batch form of getAction: percepts answer the previous batch in order, returns every move already certain"""
+        for (index, uncovered), number in zip(self.last_batch, percepts):
+            if uncovered and number is not None:
+                self.reveal(index, number)
+        if self.isComplete():
+            return [Action(AI.Action.LEAVE)]
+
+        actions = [self.decide()]
+        if actions[0].getMove() != AI.Action.LEAVE:
+            action = self.run_queue()
+            while action:
+                actions.append(action)
+                action = self.run_queue()
+        self.remember(actions)
+        return actions
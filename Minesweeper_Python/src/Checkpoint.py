@@ -0,0 +1,67 @@
+# Checkpoint journal for long tournament runs: one JSON line per finished
+# world, {"task": key, "score": score}, appended with a single write on a
+# file opened with O_APPEND so that an interrupted run leaves at worst one
+# torn last line, which loading skips.
+#
+# Keys identify a task, not a world's contents (see Main.taskKey), so a
+# journal only makes sense resumed with the same input.
+
+import json
+import os
+
+
+def loadJournal(path: str) -> dict:
+	""" Return {task key: score} for every complete entry of the journal, {} if there is none """
+	scores = {}
+	try:
+		with open(path, "r") as file:
+			for line in file:
+				try:
+					entry = json.loads(line)
+					scores[entry["task"]] = entry["score"]
+				except (ValueError, KeyError, TypeError):
+					continue
+	except FileNotFoundError:
+		pass
+	return scores
+
+
+def hasTornLine(path: str) -> bool:
+	""" True if the file's last line was cut off by an interrupted run, i.e. it doesn't end with a newline """
+	with open(path, "rb") as file:
+		file.seek(0, os.SEEK_END)
+		if file.tell() == 0:
+			return False
+		file.seek(-1, os.SEEK_END)
+		return file.read(1) != b"\n"
+
+
+class CheckpointJournal():
+
+	def __init__(self, path: str, resume: bool = False):
+		""" Open the journal, keeping its entries when resuming and truncating it otherwise """
+		flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND
+		if not resume:
+			flags |= os.O_TRUNC
+		self.__fd = os.open(path, flags, 0o644)
+		# Terminate a line torn by an interrupted run so the next entry starts on its own line
+		if resume and hasTornLine(path):
+			os.write(self.__fd, b"\n")
+
+
+	def record(self, key: str, score: int) -> None:
+		""" Append one finished task """
+		os.write(self.__fd, (json.dumps({"task": key, "score": score}) + "\n").encode("utf-8"))
+
+
+	def close(self) -> None:
+		os.fsync(self.__fd)
+		os.close(self.__fd)
+
+
+	def __enter__(self) -> "CheckpointJournal":
+		return self
+
+
+	def __exit__(self, *exc) -> None:
+		self.close()
@@ -0,0 +1,90 @@
+from collections import OrderedDict
+
+# The eight symmetries of the square, applied to (col, row) offsets
+SYMMETRIES = (
+    lambda x, y: (x, y), lambda x, y: (-x, y), lambda x, y: (x, -y), lambda x, y: (-x, -y),
+    lambda x, y: (y, x), lambda x, y: (-y, x), lambda x, y: (y, -x), lambda x, y: (-y, -x),
+)
+
+
+class ComponentCache:
+    """bounded LRU memo of solved frontier components, shared by every game in the process
+
+    a component is keyed by its constraints after translation to the origin and the rotation or
+    reflection giving the smallest encoding, so a shape solved once anywhere, in any orientation,
+    is never enumerated again; cached cells are stored in that canonical frame
+
+    the memo is bounded by the numbers it stores rather than by its entries: a component of n
+    cells keeps (n + 1) * (n + 2) counts, so a few large components weigh as much as thousands
+    of small ones; the default of a million numbers keeps the memo to some tens of MB per process
+    """
+
+    def __init__(self, max_numbers=1000000):
+        self.max_numbers = max_numbers
+        self.numbers = 0
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def weight(stored):
+        """count of numbers a stored result holds"""
+        if stored is None:
+            return 1
+        cells, counts, cell_counts = stored
+        return len(cells) + len(counts) + sum(len(row) for row in cell_counts)
+
+    def canonical(self, constraints):
+        """returns (key, frame) where frame maps each cell to its coordinates in the canonical frame"""
+        cells = {cell for cells_of, _ in constraints for cell in cells_of}
+        best = None
+        for symmetry in SYMMETRIES:
+            moved = {cell: symmetry(*cell) for cell in cells}
+            min_x = min(x for x, _ in moved.values())
+            min_y = min(y for _, y in moved.values())
+            frame = {cell: (x - min_x, y - min_y) for cell, (x, y) in moved.items()}
+            key = tuple(sorted((tuple(sorted(frame[cell] for cell in cells_of)), mines)
+                               for cells_of, mines in constraints))
+            if best is None or key < best[0]:
+                best = (key, frame)
+        return best
+
+    def solve(self, constraints, solve_component):
+        """solve_component(constraints), answered from the memo when the shape has been seen before"""
+        key, frame = self.canonical(constraints)
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            result = entry[0]
+            if result is None:
+                return None
+            canonical_cells, counts, cell_counts = result
+            cell_of = {position: cell for cell, position in frame.items()}
+            return [cell_of[position] for position in canonical_cells], counts, cell_counts
+
+        self.misses += 1
+        result = solve_component(constraints)
+        # Stored with its weight, so that an over-budget None is cached too
+        stored = None if result is None else ([frame[cell] for cell in result[0]], result[1], result[2])
+        weight = self.weight(stored)
+        if weight <= self.max_numbers:
+            self.entries[key] = (stored, weight)
+            self.numbers += weight
+            while self.numbers > self.max_numbers:
+                self.numbers -= self.entries.popitem(last=False)[1][1]
+        return result
+
+    def clear(self):
+        """forgets every entry and resets the counters"""
+        self.entries.clear()
+        self.numbers = 0
+        self.hits = 0
+        self.misses = 0
+
+    def statistics(self):
+        """hits, misses and current size of the memo, in entries and stored numbers"""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.entries), "numbers": self.numbers}
+
+
+shared_cache = ComponentCache()
@@ -0,0 +1,256 @@
+# Sequential evaluation: play the worlds of a tournament interleaved across
+# difficulties and stop as soon as the answer is known, instead of running
+# the whole corpus.
+#
+# The win rate of every difficulty is tracked with a Wilson confidence
+# interval. A difficulty stops getting worlds once its interval is narrower
+# than --width (and it has --min-games games), and the run stops when every
+# difficulty is done.
+#
+# With --versus, both agents play every world (paired games) and a
+# sequential probability ratio test on the worlds only one of them wins
+# decides which agent is better: it tests "A wins such a world with
+# probability 1/2 + delta" against "1/2 - delta" with error rates --alpha
+# and --beta. The run then also stops as soon as the test decides.
+#
+# Agents are "myai", "bitboard", "random" or "module:Class" for any agent
+# class taking MyAI's constructor arguments (e.g. a copy of an older MyAI).
+#
+# Syntax:	python3 Evaluation.py (-f InputPath | -g R C M COUNT SEED) [--agent A] [--versus B]
+#								  [--width W] [--confidence C] [--min-games N] [--delta D]
+#								  [--alpha A] [--beta B] [-j [N]]
+
+import argparse
+import importlib
+import math
+import os
+import time
+from collections import deque
+from multiprocessing import Pool, cpu_count
+from statistics import NormalDist
+from Main import listWorlds, runWorld
+from Scoring import DIFFICULTY_NAMES, difficultyName
+from WorldCorpus import isCorpus, openCorpus
+from WorldStream import StreamSpec, addWorldArguments, worldSource
+
+
+def agentType(spec: str) -> "str or class":
+    """ World aiType for an agent spec: a built-in name, or module:Class """
+    if ":" not in spec:
+        return spec
+    module, name = spec.split(":", 1)
+    return getattr(importlib.import_module(module), name)
+
+
+def groupWorlds(inputPath: str = None, spec: StreamSpec = None) -> dict:
+    """ {difficulty: list of (source, index)} for every world, in input order within a difficulty """
+    groups = {}
+    if spec:
+        groups[difficultyName(spec.rows, spec.cols)] = [(spec, i) for i in range(1, spec.count+1)]
+    elif isCorpus(inputPath):
+        corpus = openCorpus(inputPath)
+        for i in range(len(corpus)):
+            record = corpus.record(i)
+            groups.setdefault(difficultyName(record.rows, record.cols), []).append((inputPath, i))
+    else:
+        paths = listWorlds(inputPath) if os.path.isdir(inputPath) else [inputPath]
+        for path in paths:
+            with open(path) as file:
+                rows, cols = [int(x) for x in file.readline().split()]
+            groups.setdefault(difficultyName(rows, cols), []).append((path, None))
+    # Beginner, Intermediate, Expert first, then any other sizes
+    ranks = {name: rank for rank, name in enumerate(DIFFICULTY_NAMES)}
+    return dict(sorted(groups.items(), key=lambda item: ranks.get(item[0], len(ranks))))
+
+
+def wilsonInterval(wins: int, games: int, z: float) -> "tuple of floats":
+    """ Wilson score interval of a win rate """
+    if games == 0:
+        return 0.0, 1.0
+    p = wins / games
+    denominator = 1 + z * z / games
+    centre = (p + z * z / (2 * games)) / denominator
+    half = z * math.sqrt(p * (1 - p) / games + z * z / (4 * games * games)) / denominator
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+def playWorld(task: "tuple") -> "tuple":
+    """ Play one world with every agent, possibly in a worker process, returning whether each won """
+    source, index, agents = task
+    return tuple(runWorld((source, index, {"aiType": agent, "headless": True}))["won"] for agent in agents)
+
+
+class SequentialTest():
+    """ Wald's sequential probability ratio test on the worlds only one of two agents wins """
+
+    def __init__(self, delta: float, alpha: float, beta: float):
+        self.__step = math.log((0.5 + delta) / (0.5 - delta))
+        self.__upper = math.log((1 - beta) / alpha)
+        self.__lower = math.log(beta / (1 - alpha))
+        self.__llr = 0.0
+        self.onlyA = 0
+        self.onlyB = 0
+
+
+    def add(self, wonA: bool, wonB: bool) -> None:
+        if wonA and not wonB:
+            self.onlyA += 1
+            self.__llr += self.__step
+        elif wonB and not wonA:
+            self.onlyB += 1
+            self.__llr -= self.__step
+
+
+    def decision(self) -> str:
+        """ "A" or "B" once the test has decided which agent is better, None before """
+        if self.__llr >= self.__upper:
+            return "A"
+        if self.__llr <= self.__lower:
+            return "B"
+        return None
+
+
+class Evaluation():
+
+    def __init__(self, groups: dict, agents: "list", width: float, confidence: float, minGames: int,
+                 test: SequentialTest = None):
+        self.__queues = {name: deque(worlds) for name, worlds in groups.items()}
+        self.__order = list(groups)
+        self.__next = 0
+        self.__agents = agents
+        self.__width = width
+        self.__z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        self.__minGames = minGames
+        self.__test = test
+        self.total = sum(len(worlds) for worlds in groups.values())
+        self.games = {name: 0 for name in groups}
+        self.wins = {name: [0] * len(agents) for name in groups}
+
+
+    def interval(self, name: str, agent: int) -> "tuple of floats":
+        return wilsonInterval(self.wins[name][agent], self.games[name], self.__z)
+
+
+    def isSettled(self, name: str) -> bool:
+        """ Every agent's win rate on this difficulty is known closely enough """
+        if self.games[name] < self.__minGames:
+            return False
+        return all(high - low <= self.__width
+                   for low, high in (self.interval(name, agent) for agent in range(len(self.__agents))))
+
+
+    def isDone(self) -> bool:
+        if self.__test and self.__test.decision():
+            return True
+        return all(self.isSettled(name) or not self.__queues[name] for name in self.__order)
+
+
+    def nextTask(self) -> "tuple":
+        """ Next world, taking the difficulties that still need games in turn; None if there are none """
+        for _ in range(len(self.__order)):
+            name = self.__order[self.__next]
+            self.__next = (self.__next + 1) % len(self.__order)
+            if self.__queues[name] and not self.isSettled(name):
+                source, index = self.__queues[name].popleft()
+                return name, (source, index, self.__agents)
+        return None
+
+
+    def add(self, name: str, won: "tuple of bools") -> None:
+        self.games[name] += 1
+        for agent, result in enumerate(won):
+            self.wins[name][agent] += result
+        if self.__test:
+            self.__test.add(*won)
+
+
+    def run(self, jobs: int) -> None:
+        """ Play worlds until done, keeping up to 2 * jobs of them in flight on a pool when jobs > 1 """
+        if jobs <= 1:
+            while not self.isDone():
+                task = self.nextTask()
+                if task is None:
+                    return
+                self.add(task[0], playWorld(task[1]))
+            return
+
+        pool = Pool(processes=jobs)
+        pending = deque()
+        try:
+            while True:
+                while len(pending) < 2 * jobs and not self.isDone():
+                    task = self.nextTask()
+                    if task is None:
+                        break
+                    pending.append((task[0], pool.apply_async(playWorld, (task[1],))))
+                if not pending:
+                    return
+                # Results are taken in submission order, so a run is the same whatever the timing
+                name, result = pending.popleft()
+                self.add(name, result.get())
+                if self.isDone():
+                    return
+        finally:
+            pool.terminate()
+            pool.join()
+
+
+def printReport(evaluation: Evaluation, agents: "list of strings", test: SequentialTest, seconds: float) -> None:
+    for name in evaluation.games:
+        for agent, label in enumerate(agents):
+            low, high = evaluation.interval(name, agent)
+            games = evaluation.games[name]
+            wins = evaluation.wins[name][agent]
+            print("{:<14}{:<20}{:>7} games{:>7} wins{:>8.1%}  [{:.1%}, {:.1%}]".format(
+                name, label, games, wins, wins / games if games else 0.0, low, high))
+    if test:
+        decision = test.decision()
+        verdict = {"A": agents[0] + " is better", "B": agents[1] + " is better", None: "undecided"}[decision]
+        print("Worlds only {} won: {} \tonly {} won: {} \tsequential test: {}".format(
+            agents[0], test.onlyA, agents[1], test.onlyB, verdict))
+    played = sum(evaluation.games.values())
+    saved = evaluation.total - played
+    print("Played {} of {} worlds in {:.1f}s, saved {} games ({:.0%})".format(
+        played, evaluation.total, seconds, saved, saved / evaluation.total if evaluation.total else 0.0))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate agents with early stopping", prog="Evaluation.py")
+    addWorldArguments(parser)
+    parser.add_argument("--agent", help="agent to evaluate", default="myai")
+    parser.add_argument("--versus", help="second agent, played on the same worlds and tested against the first")
+    parser.add_argument("--width", help="target width of the win rate confidence intervals", type=float, default=0.1)
+    parser.add_argument("--confidence", help="confidence level of the intervals", type=float, default=0.95)
+    parser.add_argument("--min-games", help="games per difficulty before it may stop", type=int, default=30)
+    parser.add_argument("--delta", help="win probability edge the sequential test looks for", type=float,
+                        default=0.1)
+    parser.add_argument("--alpha", help="chance of wrongly calling the first agent better", type=float, default=0.05)
+    parser.add_argument("--beta", help="chance of wrongly calling the second agent better", type=float, default=0.05)
+    parser.add_argument("-j", help="number of worker processes", nargs='?', type=int, const=0, default=1)
+    args = parser.parse_args()
+
+    try:
+        spec = worldSource(args)
+    except ValueError as e:
+        print("ERROR: " + str(e))
+        return
+    if not 0 < args.delta < 0.5 or not 0 < args.alpha < 1 or not 0 < args.beta < 1:
+        print("ERROR: --delta must be in (0, 0.5), --alpha and --beta in (0, 1)!")
+        return
+
+    labels = [args.agent] + ([args.versus] if args.versus else [])
+    try:
+        agents = [agentType(label) for label in labels]
+    except (ImportError, AttributeError) as e:
+        print("ERROR: Could not load agent! \n\t" + str(e))
+        return
+    test = SequentialTest(args.delta, args.alpha, args.beta) if args.versus else None
+    evaluation = Evaluation(groupWorlds(args.f, spec), agents, args.width, args.confidence, args.min_games, test)
+
+    start = time.perf_counter()
+    evaluation.run(args.j if args.j >= 1 else cpu_count())
+    printReport(evaluation, labels, test, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
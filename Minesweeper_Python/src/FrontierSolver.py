@@ -0,0 +1,217 @@
+from math import comb
+from ComponentCache import shared_cache
+
+
+def binomial_window(n, low, high):
+    """C(n, m) for m = low..high, 0 outside 0..n: only the mine counts the frontier can leave to n interior cells"""
+    row = []
+    value = None
+    for m in range(low, high + 1):
+        if m < 0 or m > n:
+            value = None
+            row.append(0)
+            continue
+        value = comb(n, m) if value is None else value * (n - m + 1) // m
+        row.append(value)
+    return row
+
+
+def convolve(a, b):
+    """layout counts by mine total of two independent groups of cells, from the counts of each"""
+    result = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b):
+                result[i + j] += x * y
+    return result
+
+
+# How far from 0 and 1 a probability resting on an estimate is kept, so that it is guessed on, never acted on as certain
+APPROXIMATE_MARGIN = 1e-9
+
+
+def approximate(probability):
+    """a probability that may be off: kept strictly between 0 and 1"""
+    return min(max(probability, APPROXIMATE_MARGIN), 1 - APPROXIMATE_MARGIN)
+
+
+class FrontierSolver:
+    """exact mine probabilities for the frontier, solved one connected component at a time"""
+
+    def __init__(self, max_nodes=200000, cache=shared_cache):
+        # Search budget per component; larger components fall back to the local average
+        self.max_nodes = max_nodes
+        # Memo of solved components, None to always enumerate
+        self.cache = cache
+
+    def components(self, constraints):
+        """splits (cells, mines) constraints into groups that share no cells"""
+        parent = {}
+
+        def find(cell):
+            root = cell
+            while parent[root] != root:
+                root = parent[root]
+            while parent[cell] != root:
+                parent[cell], cell = root, parent[cell]
+            return root
+
+        for cells, _ in constraints:
+            for cell in cells:
+                parent.setdefault(cell, cell)
+            first = find(cells[0])
+            for cell in cells[1:]:
+                other = find(cell)
+                if other != first:
+                    parent[other] = first
+
+        groups = {}
+        for constraint in constraints:
+            groups.setdefault(find(constraint[0][0]), []).append(constraint)
+        return list(groups.values())
+
+    def solve_cached(self, constraints):
+        """solve_component through the memo, if there is one"""
+        if self.cache is None:
+            return self.solve_component(constraints)
+        return self.cache.solve(constraints, self.solve_component)
+
+    def solve_component(self, constraints):
+        """enumerates every mine layout of one component
+
+        returns (cells, counts, cell_counts) where counts[k] is the number of layouts with k mines
+        and cell_counts[k][i] the number of those in which cells[i] is a mine, or None over budget
+        """
+        # Order cells so that each constraint is closed off as early as possible
+        cells = []
+        seen = set()
+        for cells_of, _ in sorted(constraints, key=lambda constraint: len(constraint[0])):
+            for cell in cells_of:
+                if cell not in seen:
+                    seen.add(cell)
+                    cells.append(cell)
+        index = {cell: i for i, cell in enumerate(cells)}
+
+        need = [mines for _, mines in constraints]
+        remaining = [len(cells_of) for cells_of, _ in constraints]
+        if any(n < 0 or n > r for n, r in zip(need, remaining)):
+            return cells, [], []
+        touching = [[] for _ in cells]
+        for j, (cells_of, _) in enumerate(constraints):
+            for cell in cells_of:
+                touching[index[cell]].append(j)
+
+        size = len(cells)
+        counts = [0] * (size + 1)
+        cell_counts = [[0] * size for _ in range(size + 1)]
+        layout = [0] * size
+        nodes = [0]
+
+        def assign(i, mines):
+            if i == size:
+                counts[mines] += 1
+                row = cell_counts[mines]
+                for k in range(size):
+                    if layout[k]:
+                        row[k] += 1
+                return True
+            nodes[0] += 1
+            if nodes[0] > self.max_nodes:
+                return False
+            for value in (0, 1):
+                feasible = True
+                for j in touching[i]:
+                    need[j] -= value
+                    remaining[j] -= 1
+                    if need[j] < 0 or need[j] > remaining[j]:
+                        feasible = False
+                layout[i] = value
+                finished = not feasible or assign(i + 1, mines + value)
+                for j in touching[i]:
+                    need[j] += value
+                    remaining[j] += 1
+                if not finished:
+                    return False
+            layout[i] = 0
+            return True
+
+        if not assign(0, 0):
+            return None
+        return cells, counts, cell_counts
+
+    def global_probabilities(self, constraints, mines_left, interior):
+        """mine probabilities weighted by the mines left on the whole board
+
+        every frontier layout with k mines is weighted by C(interior, mines_left - k), the number of ways to
+        place the other mines among the interior cells, which touch no hint. Returns the probabilities of the
+        constrained cells and that of any single interior cell (None if there are none)
+
+        once a component is too large to enumerate, the mines left for the others are only estimated, so
+        a 0 or 1 that doesn't hold in every layout of its own component is made approximate
+        """
+        probabilities = {}
+        solved = []
+        estimated = False
+        for component in self.components(constraints):
+            result = self.solve_cached(component)
+            if result is None or not any(result[1]):
+                # Too large to enumerate: keep the local estimate and set aside the mines it expects
+                average = self.local_average(component)
+                probabilities.update(average)
+                mines_left -= round(sum(average.values()))
+                estimated = True
+            else:
+                solved.append(result)
+
+        # Layout counts of all components but one, from prefix and suffix products
+        prefix = [[1]]
+        for _, counts, _ in solved:
+            prefix.append(convolve(prefix[-1], counts))
+        suffix = [[1]]
+        for _, counts, _ in reversed(solved):
+            suffix.append(convolve(suffix[-1], counts))
+        suffix.reverse()
+
+        everything = prefix[-1]
+        # The frontier holds 0..len(everything)-1 mines, so only that window of interior counts is ever weighed
+        low = mines_left - (len(everything) - 1)
+        binomials = binomial_window(interior, low, mines_left)
+
+        def weight(k):
+            return binomials[mines_left - k - low] if 0 <= k < len(everything) else 0
+        total = sum(count * weight(k) for k, count in enumerate(everything))
+        if total == 0:
+            # No layout fits the mine count (only possible after a local estimate): fall back to the components alone
+            for cells, counts, cell_counts in solved:
+                layouts = sum(counts)
+                for i, cell in enumerate(cells):
+                    probabilities[cell] = sum(row[i] for row in cell_counts) / layouts
+            return probabilities, approximate(mines_left / interior) if interior else None
+
+        for c, (cells, counts, cell_counts) in enumerate(solved):
+            others = convolve(prefix[c], suffix[c + 1])
+            weights = [sum(count * weight(k + j) for j, count in enumerate(others)) for k in range(len(counts))]
+            layouts = sum(counts)
+            for i, cell in enumerate(cells):
+                probability = sum(row[i] * w for row, w in zip(cell_counts, weights)) / total
+                if estimated and probability in (0, 1):
+                    mine_layouts = sum(row[i] for row in cell_counts)
+                    if 0 < mine_layouts < layouts:
+                        probability = approximate(probability)
+                probabilities[cell] = probability
+
+        if not interior:
+            return probabilities, None
+        interior_mines = sum(count * weight(k) * (mines_left - k) for k, count in enumerate(everything))
+        interior_probability = interior_mines / (total * interior)
+        return probabilities, approximate(interior_probability) if estimated else interior_probability
+
+    def local_average(self, constraints):
+        """fallback for components too large to enumerate: averages (mines / cells) over each cell's constraints"""
+        sums = {}
+        for cells, mines in constraints:
+            share = mines / len(cells)
+            for cell in cells:
+                total, count = sums.get(cell, (0.0, 0))
+                sums[cell] = (total + share, count + 1)
+        return {cell: total / count for cell, (total, count) in sums.items()}
@@ -0,0 +1,40 @@
+from heapq import heappush, heappop
+
+
+class IndexedPriorityQueue:
+    """min-priority queue holding each item at most once, with membership tests and decrease-key
+
+    decrease-key is lazy: the item is pushed again at its new priority and the older heap
+    entry is skipped when it reaches the top
+    """
+
+    def __init__(self):
+        self.heap = []
+        self.priorities = dict()
+
+    def __len__(self):
+        return len(self.priorities)
+
+    def __contains__(self, item):
+        return item in self.priorities
+
+    def push(self, item, priority):
+        """adds item, or lowers its priority if it is already queued at a higher one"""
+        current = self.priorities.get(item)
+        if current is not None and current <= priority:
+            return
+        self.priorities[item] = priority
+        heappush(self.heap, (priority, item))
+
+    def pop(self):
+        """removes and returns the (priority, item) pair with the lowest priority"""
+        while self.heap:
+            priority, item = heappop(self.heap)
+            if self.priorities.get(item) == priority:
+                del self.priorities[item]
+                return priority, item
+        raise IndexError("pop from an empty priority queue")
+
+    def discard(self, item):
+        """removes item if it is queued; its heap entry becomes stale"""
+        self.priorities.pop(item, None)
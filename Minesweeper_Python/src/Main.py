@@ -17,9 +17,12 @@
 #					Options:
 #						-m Use ManualAI instead of MyAI.
 #						-r Use RandomAI instead of MyAI.
+#						--bitboard Use BitboardAI instead of MyAI: the same
+#						   deductions and guesses, on int bitsets.
 #						-f [InputPath] [OutputFile]
 #						   First is absolute path to Minesweeper World file or 
-#						   directory containing Minesweeper World files.
+#						   directory containing Minesweeper World files, or
+#						   a packed corpus file (see WorldCorpus.py).
 #						   Second is the file name of the .txt file you wish
 #						   to write your results to.
 #						-v Verbose mode displays the name of the Minesweeper
@@ -27,6 +30,33 @@
 #						-d Debug mode will display the game board after
 #						   every move. Useless when used with -m.
 #						-o Path to output file which results are written to.
+#						-j [N] Run a directory, corpus or -g stream of
+#						   worlds on N processes.
+#						-s [StatsFile] Print how often each phase of MyAI
+#						   ran, how long it took and how many moves it
+#						   decided, plus the number of guesses. With a
+#						   file, also dump them per world as JSON.
+#						-l [LogFile] Write one JSON object per world to
+#						   LogFile as soon as the world finishes: world,
+#						   rows, cols, mines, won, score, moves, guesses and
+#						   seconds of wall time.
+#						-p [ReplayFile] Log the actions of every world to
+#						   ReplayFile; "ReplayLog.py ReplayFile -f
+#						   InputPath" re-scores them without the agent.
+#						-c [Journal] Append every finished world and its
+#						   score to a checkpoint journal as it finishes.
+#						--resume Skip the worlds already in the -c journal
+#						   and count their scores in the totals, to carry
+#						   on an interrupted run of the same input. The -l
+#						   and -p logs are appended to instead of emptied.
+#						-g [Rows] [Cols] [Mines] [Count] [Seed]
+#						   Run Count worlds generated in memory from Seed,
+#						   the same worlds "WorldGenerator.py --seed"
+#						   writes. No world files are read or written.
+#						-z Flood-fill zero regions in one move for agents
+#						   that accept revealed tiles in a batch.
+#						-b Let agents that support it return a list of
+#						   actions per turn instead of a single one.
 #						-h Displays help menu and quits.
 #
 #				- The default AI type is MyAI.
@@ -36,7 +66,12 @@
 #				  [OutputPath] is useless.
 #
 #				- If both -m and -r are turned on, -r will be turned off.
+#				  Likewise -m or -r turn --bitboard off.
 #				- -v used without -f is useless.
+#				- -j [N] runs the worlds of a directory, corpus or -g
+#				  stream on N worker processes (default: one per
+#				  core). It is ignored with -m or -d, which need the
+#				  console.
 #
 #				- DO NOT MAKE CHANGES TO THIS FILE.
 # ==============================CS-199==================================
@@ -44,12 +79,128 @@
 import sys
 import os
 import argparse
+import json
+import time
+from multiprocessing import Pool, cpu_count
 from World import World
+from WorldCorpus import isCorpus, openCorpus
+from WorldStream import StreamSpec, streamName, streamRecord, streamSpec
+from Checkpoint import CheckpointJournal, loadJournal
+from AgentStats import PhaseStats
+from ResultsLog import ResultsLog
+from ReplayLog import ReplayWriter
 from ManualAI import ManualAI
 from RandomAI import RandomAI
 from MyAI import MyAI
 
 
+def taskKey(task: "tuple") -> str:
+    """ Name of a task that stays the same between runs on the same input, for the checkpoint journal """
+    source, index, _ = task
+    if index is None:
+        return source
+    elif isinstance(source, StreamSpec):
+        return streamName(source, index)
+    return source + "#" + str(index)
+
+
+def runWorld(task: "tuple") -> dict:
+    """ Run a single world, possibly in a worker process, and return its result """
+    """ {"task", "world", "rows", "cols", "mines", "won", "score", "moves", "guesses", "seconds", "stats", """
+    """ "floodFill", "actions"}, actions being the replay log codes when recordActions is set """
+    """ A task is (filename, None, options) for a text world, (corpus, index, options) """
+    """ for a packed corpus or (StreamSpec, index, options) for a seeded in-memory stream """
+    source, index, worldOptions = task
+    start = time.perf_counter()
+    if index is None:
+        world = World(filename=source, **worldOptions)
+    elif isinstance(source, StreamSpec):
+        world = World(record=streamRecord(source, index), **worldOptions)
+    else:
+        world = World(record=openCorpus(source).record(index), **worldOptions)
+    score = world.run()
+    return {"task": taskKey(task), "world": world.getName(), "rows": world.getRowDimension(), "cols": world.getColDimension(),
+            "mines": world.getTotalMines(), "won": score > 0, "score": score, "moves": world.getMovesMade(),
+            "guesses": world.getGuesses(), "seconds": round(time.perf_counter() - start, 6),
+            "stats": world.getAgentStats(), "floodFill": world.getFloodFill(), "actions": world.getActionLog()}
+
+
+def runTournament(tasks: "iterable of tuples", numTasks: int, jobs: int, onResult: "callable" = None,
+                  priorScores: "iterable of ints" = ()) -> "tuple of ints":
+    """ Run every task, on a pool of jobs processes when jobs > 1, passing each result to onResult """
+    """ Return (scoreBeg, scoreInt, scoreExp, sumScores), the same whatever the number of jobs, """
+    """ counting priorScores (of worlds finished by an earlier run) as well """
+    sumScores = 0
+
+    scoreBeg = 0
+    scoreInt = 0
+    scoreExp = 0
+
+    for score in priorScores:
+        if score == 1:
+            scoreBeg += 1
+        elif score == 2:
+            scoreInt += 1
+        elif score == 3:
+            scoreExp += 1
+
+        sumScores += score
+
+    if jobs > 1 and numTasks > 1:
+        pool = Pool(processes=jobs)
+        chunksize = max(1, numTasks // (jobs * 8))
+        results = pool.imap_unordered(runWorld, tasks, chunksize)
+    else:
+        pool = None
+        results = (runWorld(task) for task in tasks)
+
+    try:
+        for result in results:
+            if onResult:
+                onResult(result)
+            score = result["score"]
+            if score == 1:
+                scoreBeg += 1
+            elif score == 2:
+                scoreInt += 1
+            elif score == 3:
+                scoreExp += 1
+
+            sumScores += score
+    except BaseException:
+        # On an interrupt, don't wait for the worlds still queued on the workers
+        if pool:
+            pool.terminate()
+        raise
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+
+    return scoreBeg, scoreInt, scoreExp, sumScores
+
+
+def listWorlds(inputDir: str) -> "list of strings":
+    """ Return the path of every world file under inputDir, in os.walk order """
+    worlds = []
+    for dirpath, _, filenames in os.walk(inputDir):
+        for filename in filenames:
+            worlds.append(os.path.join(dirpath, filename))
+    return worlds
+
+
+def printStats(aggregateStats: PhaseStats, gameStats: dict, statsFile: "string or True") -> None:
+    """ Print the aggregate agent stats and, if statsFile is a path, dump them with every game's stats as JSON """
+    print("---------------Agent phase stats:---------------")
+    print(aggregateStats.report())
+    if isinstance(statsFile, str):
+        try:
+            with open(statsFile, 'w') as file:
+                json.dump({"aggregate": aggregateStats.asDict(), "games": gameStats}, file, indent=1)
+        except:
+            print("ERROR: Could not open file for writing!")
+
+
 def main():
     # Create parser
     parser = argparse.ArgumentParser(description="", prog="Main.py", usage="%(prog)s [options]",
@@ -59,8 +210,24 @@ def main():
     parser.add_argument("-f", "-F", help="file or directory name", nargs='*')  # File path
     parser.add_argument("-m", "-M", help="enable ManualAI mode", action="store_true")  # ManualAI
     parser.add_argument("-r", "-R", help="enable RandomAI mode", action="store_true")  # RandomAI
+    parser.add_argument("--bitboard", help="use BitboardAI, MyAI's strategy on int bitsets", action="store_true")
     parser.add_argument("-v", "-V", help="enable verbose mode", action="store_true")  # Verbose
     parser.add_argument("-d", "-D", help="enable debug mode", action="store_true")  # Debug
+    parser.add_argument("-z", "-Z", help="flood-fill zero regions in one move", action="store_true")  # Flood fill
+    parser.add_argument("-b", "-B", help="let agents hand over all certain moves at once", action="store_true")  # Batch
+    parser.add_argument("-g", "-G", help="run a seeded in-memory stream of worlds", nargs=5, type=int,
+                        metavar=("ROWS", "COLS", "MINES", "COUNT", "SEED"))  # Generated worlds
+    parser.add_argument("-s", "-S", help="print per-phase agent stats, and dump them as JSON to a file if given",
+                        nargs='?', const=True, default=None, metavar="FILE")  # Stats
+    parser.add_argument("-l", "-L", help="write one JSON line of results per world to this file",
+                        metavar="FILE")  # Results log
+    parser.add_argument("-p", "-P", help="write a replay log of every world's actions to this file",
+                        metavar="FILE")  # Replay log
+    parser.add_argument("-c", "-C", help="record every finished world in this checkpoint journal",
+                        metavar="FILE")  # Checkpoint
+    parser.add_argument("--resume", help="skip the worlds already in the checkpoint journal", action="store_true")
+    parser.add_argument("-j", "-J", help="number of worker processes for a directory, corpus or -g stream of worlds",
+                        nargs='?', type=int, const=0, default=1)  # Jobs
 
     args = parser.parse_args()
 
@@ -78,80 +245,140 @@ def main():
             return
     verbose = args.v
     debug = args.d
+    jobs = args.j
+    headless = not debug and not args.m
+    if jobs < 1:
+        jobs = cpu_count()
 
     if args.m:
         aiType = "manual"
     elif args.r:
         aiType = "random"
+    elif args.bitboard:
+        aiType = "bitboard"
     elif not args.m and not args.r:
         aiType = "myai"
 
-    if inputFile:
-        # If inputFile is a directory
-        if (os.path.isdir(inputFile)):
-            listOfWorlds = None
+    worldOptions = {"aiType": aiType, "verbose": verbose, "debug": debug, "headless": headless,
+                    "floodFill": args.z, "batchActions": args.b, "collectStats": args.s is not None,
+                    "recordActions": args.p is not None}
+
+    if aiType == "manual" or debug:
+        jobs = 1
 
+    tasks = None
+    if args.g:
+        try:
+            spec = streamSpec(args.g)
+        except ValueError as e:
+            print("ERROR: " + str(e))
+            return
+        tasks = ((spec, i, worldOptions) for i in range(1, spec.count+1))
+        numTasks = spec.count
+
+    # If inputFile is a directory or a packed corpus of worlds
+    elif inputFile and (os.path.isdir(inputFile) or isCorpus(inputFile)):
+        try:
+            if os.path.isdir(inputFile):
+                tasks = [(f, None, worldOptions) for f in listWorlds(inputFile)]
+            else:
+                tasks = [(inputFile, i, worldOptions) for i in range(len(openCorpus(inputFile)))]
+        except:
+            print("ERROR: Failed to open directory")
+            return
+        numTasks = len(tasks)
+
+    if tasks is not None and args.resume and not args.c:
+        print("ERROR: --resume needs a checkpoint journal given with -c!")
+        return
+
+    if tasks is not None:
+        priorScores = {}
+        if args.resume:
+            priorScores = loadJournal(args.c)
+            tasks = (task for task in tasks if taskKey(task) not in priorScores)
+            numTasks = max(0, numTasks - len(priorScores))
+            print("Resuming: " + str(len(priorScores)) + " worlds already done")
+
+        aggregateStats = PhaseStats()
+        gameStats = {}
+
+        resultsLog = None
+        journal = None
+        replayLog = None
+        try:
+            if args.l:
+                resultsLog = ResultsLog(args.l, args.resume)
+            if args.c:
+                journal = CheckpointJournal(args.c, args.resume)
+            if args.p:
+                replayLog = ReplayWriter(args.p, args.resume)
+        except (OSError, ValueError):
+            print("ERROR: Could not open results log, checkpoint journal or replay log for writing!")
+            for log in (resultsLog, journal):
+                if log:
+                    log.close()
+            return
+
+        def onResult(result):
+            if journal:
+                journal.record(result["task"], result["score"])
+            if resultsLog:
+                resultsLog.write(result)
+            if replayLog:
+                replayLog.add(result["world"], result["rows"], result["cols"], result["mines"], result["floodFill"],
+                              result["score"], result["actions"])
+            if result["stats"]:
+                aggregateStats.merge(PhaseStats.fromDict(result["stats"]))
+                if isinstance(args.s, str):
+                    gameStats[result["world"]] = result["stats"]
+
+        try:
+            scoreBeg, scoreInt, scoreExp, sumScores = runTournament(tasks, numTasks, jobs, onResult,
+                                                                    priorScores.values())
+        finally:
+            if resultsLog:
+                resultsLog.close()
+            if journal:
+                journal.close()
+            if replayLog:
+                replayLog.close()
+
+        print("---------------Your agent's results:---------------")
+        print("Beginner: {} \tIntermediate: {} \tExpert: {}".format(scoreBeg, scoreInt, scoreExp))
+        print("Cumulative Score: " + str(sumScores))
+
+        if outputFile:
+            currDirectory = os.path.dirname(__file__)
+            outputFilePath = os.path.join(currDirectory, outputFile)
+            print(outputFilePath)
             try:
-                directory = os.walk(inputFile)
+                with open(outputFilePath, 'w') as file:
+                    file.write("easy: " + str(scoreBeg) + "\n")
+                    file.write("medium: " + str(scoreInt) + "\n")
+                    file.write("expert: " + str(scoreExp) + "\n")
+                    file.write("score: " + str(sumScores))
             except:
-                print("ERROR: Failed to open directory")
-                return
-
-            numScores = 0
-            sumScores = 0
-
-            scoreBeg = 0
-            scoreInt = 0
-            scoreExp = 0
-            for dirpath, _, filenames in directory:
-                for filename in filenames:
-                    f = os.path.join(dirpath, filename)
-
-                    world = World(filename=f, aiType=aiType, verbose=verbose, debug=debug)
-
-                    score = world.run()
-                    if score == 1:
-                        scoreBeg += 1
-                    elif score == 2:
-                        scoreInt += 1
-                    elif score == 3:
-                        scoreExp += 1
-
-                    numScores += 1
-                    sumScores += score
-
-            print("---------------Your agent's results:---------------")
-            print("Beginner: {} \tIntermediate: {} \tExpert: {}".format(scoreBeg, scoreInt, scoreExp))
-            print("Cumulative Score: " + str(sumScores))
-
-            if outputFile:
-                currDirectory = os.path.dirname(__file__)
-                outputFilePath = os.path.join(currDirectory, outputFile)
-                print(outputFilePath)
-                try:
-                    with open(outputFilePath, 'w') as file:
-                        file.write("easy: " + str(scoreBeg) + "\n")
-                        file.write("medium: " + str(scoreInt) + "\n")
-                        file.write("expert: " + str(scoreExp) + "\n")
-                        file.write("score: " + str(sumScores))
-                except:
-                    print("ERROR: Could not open file for writing!")
-
-        # If inputFile is a world file
-        elif (os.path.isfile(inputFile)):
-            world = World(filename=inputFile, aiType=aiType, verbose=verbose, debug=debug)
-            score = world.run()
-            if score > 0:
-                print("WORLD COMPLETE")
-            else:
-                print("WORLD INCOMPLETE")
+                print("ERROR: Could not open file for writing!")
+
+        if args.s is not None:
+            printStats(aggregateStats, gameStats, args.s)
 
-        # If inputFileis an invalid path
+    # If inputFile is a world file
+    elif inputFile and os.path.isfile(inputFile):
+        world = World(filename=inputFile, **worldOptions)
+        score = world.run()
+        if score > 0:
+            print("WORLD COMPLETE")
         else:
-            print("ERROR: Directory or file does not exist!")
+            print("WORLD INCOMPLETE")
+
+    # If inputFileis an invalid path
+    elif inputFile:
+        print("ERROR: Directory or file does not exist!")
 
     else:
-        world = World(aiType=aiType, verbose=verbose, debug=debug)
+        world = World(**worldOptions)
         score = world.run()
         print("Your AI scored: " + str(score))
         if score == 0:
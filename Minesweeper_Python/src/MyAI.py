@@ -1,7 +1,15 @@
 from AI import AI
 from Action import Action
+from AgentStats import PhaseStats
+from FrontierSolver import FrontierSolver
+from IndexedPriorityQueue import IndexedPriorityQueue
+from Neighbours import neighbourTable, partnerTable
+from PatternCompiler import (pattern_key, ONLY_A_SAFE, ONLY_A_MINES, ONLY_B_SAFE, ONLY_B_MINES,
+                             SHARED_SAFE, SHARED_MINES)
+from PatternTable import PATTERNS
 from heapq import heappush, heappop
 import random
+from time import perf_counter
 
 
 class MyAI(AI):
@@ -19,60 +27,59 @@ class MyAI(AI):
         # Initialize the board with covered cells
         self.board = [["?" for _ in range(self.col_dimension)] for _ in range(self.row_dimension)]
         self.queue = []
-        self.deferred_queue = []
-        self.uncovered = set()
+        self.deferred_queue = IndexedPriorityQueue()  # each hint cell deferred at most once
+        self.uncovered = {(startX, startY)}  # the world uncovers the start cell for us
         self.bombs = set()
-        self.covered = dict()
-        self.uncovered_count = 0
-        self.processed_patterns = set()
+        self.revealed = {(startX, startY)}  # cells uncovered in the world, by us or by a flood fill
+        self.last_batch = [(startX, startY)]
+        self.guesses = 0
+
+        # getAction tries these phases in order until one produces an action; enableStats swaps in timed versions
+        self.stats = None
+        self.phases = [self.queuePhase, self.deferredPhase, self.explorePhase, self.patternsPhase, self.guessPhase]
+        self.solver = FrontierSolver()
+        self.neighbours = neighbourTable(colDimension, rowDimension)
+        self.partners = partnerTable(colDimension, rowDimension)
+
+        # Incremental frontier: revealed hint cells that may still border undecided cells,
+        # plus the constraints whose neighbourhood changed since they were last evaluated
+        self.frontier = set()
+        self.dirty = set()
+        self.dirty_patterns = set()
 
     def getAdjacentCells(self, col, row):
-        """gets surrounding cells"""
-        directions = [(-1, -1), (-1, 0), (-1, 1),
-                      (0, -1), (0, 1),
-                      (1, -1), (1, 0), (1, 1)]
-        return [(col + dc, row + dr) for dc, dr in directions if self.inBounds(col + dc, row + dr)]
+        """gets surrounding cells from the shared table for this board size"""
+        return self.neighbours[(col, row)]
 
     def inBounds(self, x, y):
         """bounds check"""
         return 0 <= x < self.col_dimension and 0 <= y < self.row_dimension
 
-    def checkCells(self, directions, number):
+    def checkCells(self, directions):
         """returns uncovered cells and known bomb cells"""
         adj_bombs = []
         adj_covered = []
 
+        bombs = self.bombs
+        uncovered = self.uncovered
         for cell in directions:
-            new_col, new_row = cell
-            if self.inBounds(new_col, new_row):
-                if (new_col, new_row) in self.bombs:
-                    adj_bombs.append((new_col, new_row))
-                elif (new_col, new_row) not in self.uncovered:
-                    adj_covered.append((new_col, new_row))
-
-        # updating cells probability
-        if adj_covered:
-            probability_of_mine = (number - len(adj_bombs)) / len(adj_covered)
-
-            for cell in adj_covered:
-                if cell not in self.covered:
-                    self.covered[cell] = (probability_of_mine, 1)
-                else:
-                    current_prob, count = self.covered[cell]
-                    new_prob = (current_prob * count + probability_of_mine) / (count + 1)
-                    self.covered[cell] = (new_prob, count + 1)
+            if cell in bombs:
+                adj_bombs.append(cell)
+            elif cell not in uncovered:
+                adj_covered.append(cell)
 
         return adj_covered, adj_bombs
 
-    def zero_action(self):
+    def zero_action(self, col, row):
         """adds to queue to uncover all adjacent cells if n is 0"""
-        cells = self.getAdjacentCells(self.x, self.y)
+        cells = self.getAdjacentCells(col, row)
         self.addActionsToQueue(0, self.ACTION_UNCOVER, cells)
 
     def hint_action(self, number, col, row, deferred=False):
         """adds to queue when n > 0, flags cells if known bombs + cells = num or uncovers cells if known bombs = num"""
+        self.dirty.discard((col, row))
         directions = self.getAdjacentCells(col, row)
-        uncovered, bombs = self.checkCells(directions, number)
+        uncovered, bombs = self.checkCells(directions)
 
         if len(uncovered) + len(bombs) == number:
             self.addActionsToQueue(number, self.ACTION_FLAG, uncovered)
@@ -80,7 +87,7 @@ class MyAI(AI):
             self.addActionsToQueue(number, self.ACTION_UNCOVER, uncovered)
         else:
             if not deferred:
-                heappush(self.deferred_queue, (number, (col, row)))
+                self.deferred_queue.push((col, row), number)
 
     def bomb_action(self, number, col, row):
         """adds to deferred queue when n is -1, adds adjacent cells"""
@@ -91,12 +98,12 @@ class MyAI(AI):
                 # Get the number from the board for the uncovered cell
                 cell_number = self.board[new_row][new_col]
                 if isinstance(cell_number, int):
-                    heappush(self.deferred_queue, (cell_number, (new_col, new_row)))
+                    self.deferred_queue.push((new_col, new_row), cell_number)
 
     def action_decider(self, number, col, row, deferred=False):
         """do action based on n"""
         if number == 0:
-            self.zero_action()
+            self.zero_action(col, row)
         elif number > 0:
             self.hint_action(number, col, row, deferred)
         else:
@@ -110,17 +117,52 @@ class MyAI(AI):
                 if action == self.ACTION_UNCOVER and (new_col, new_row) not in self.uncovered:
                     heappush(self.queue, (priority, (action, new_col, new_row)))
                     self.uncovered.add((new_col, new_row))
+                    self.markNeighboursDirty(new_col, new_row)
                 elif action == self.ACTION_FLAG and (new_col, new_row) not in self.bombs:
                     heappush(self.queue, (priority, (action, new_col, new_row)))
                     self.bombs.add((new_col, new_row))
+                    self.markNeighboursDirty(new_col, new_row)
+
+    def markNeighboursDirty(self, col, row):
+        """a cell was decided, so the frontier constraints around it need another look"""
+        for cell in self.neighbours[(col, row)]:
+            if cell in self.frontier:
+                self.dirty.add(cell)
+                self.dirty_patterns.add(cell)
+
+    def revealCell(self, number, col, row):
+        """records the hint of a revealed cell and puts it on the frontier"""
+        self.board[row][col] = number
+        if isinstance(number, int) and number > 0 and (col, row) in self.uncovered:
+            self.frontier.add((col, row))
+            self.dirty.add((col, row))
+            self.dirty_patterns.add((col, row))
+
+    def revealBatch(self, reveals):
+        """takes the (col, row, number) cells the world uncovered by flood fill since the last action"""
+        for col, row, number in reveals:
+            self.revealed.add((col, row))
+            if (col, row) not in self.uncovered:
+                self.uncovered.add((col, row))
+                self.markNeighboursDirty(col, row)
+            self.revealCell(number, col, row)
+        for col, row, number in reveals:
+            if number > 0:
+                self.hint_action(number, col, row)
+
+    def isUndecided(self, cell):
+        """cell is neither known safe nor known bomb"""
+        return cell not in self.uncovered and cell not in self.bombs
 
     def runQueue(self):
         """completes action in queue based on priority of n (0 has highest)"""
-        if self.queue:
+        while self.queue:
             priority, (action, col, row) = heappop(self.queue)
 
             if action == self.ACTION_UNCOVER:
-                self.uncovered_count += 1
+                if (col, row) in self.revealed:
+                    continue  # already revealed by a flood fill
+                self.revealed.add((col, row))
             self.x, self.y = col, row
             return Action(AI.Action[action], col, row)
         return None
@@ -130,7 +172,7 @@ class MyAI(AI):
         revisited = []
 
         while self.deferred_queue:
-            deferred_number, (col, row) = heappop(self.deferred_queue)
+            deferred_number, (col, row) = self.deferred_queue.pop()
             directions = self.getAdjacentCells(col, row)
             if any((c, r) in self.uncovered for c, r in directions):
                 self.action_decider(deferred_number, col, row, True)
@@ -140,117 +182,176 @@ class MyAI(AI):
             else:
                 revisited.append((deferred_number, (col, row)))
 
-        for item in revisited:
-            heappush(self.deferred_queue, item)
+        for deferred_number, cell in revisited:
+            self.deferred_queue.push(cell, deferred_number)
 
         return None
 
     def exploreUnexploredCells(self):
-        """finds all unexplored cells and adds to deferred queue"""
-        unexplored_cells = [(col, row) for row in range(self.row_dimension)
-                            for col in range(self.col_dimension) if self.board[row][col] == "?"]
-
-        # adds hints near unexplored cells to deferred queue
-        for col, row in unexplored_cells:
-            adj_cells = self.getAdjacentCells(col, row)
-            if any((adj_col, adj_row) in self.uncovered for adj_col, adj_row in adj_cells):
-                for adj_col, adj_row in adj_cells:
-                    if (adj_col, adj_row) in self.uncovered:
-                        cell_number = self.board[adj_row][adj_col]
-                        if isinstance(cell_number, int):
-                            heappush(self.deferred_queue, (cell_number, (adj_col, adj_row)))
+        """adds the dirty frontier hints to the deferred queue, dropping hints with nothing left to decide"""
+        for col, row in self.dirty:
+            if any(self.isUndecided(cell) for cell in self.getAdjacentCells(col, row)):
+                self.deferred_queue.push((col, row), self.board[row][col])
+            else:
+                self.frontier.discard((col, row))
+        self.dirty.clear()
+
+    def frontierConstraints(self):
+        """builds (undecided cells, mines left) for every frontier hint"""
+        constraints = []
+        for col, row in self.frontier:
+            undecided, bombs = self.checkCells(self.getAdjacentCells(col, row))
+            if undecided:
+                constraints.append((tuple(undecided), self.board[row][col] - len(bombs)))
+        return constraints
 
     def educated_guess(self):
-        to_delete = []
-
-        for coord in self.covered:
-            if coord in self.uncovered or coord in self.bombs:
-                to_delete.append(coord)
-
-        for coord in to_delete:
-            del self.covered[coord]
-
-        if self.covered:
-            guess = min(self.covered, key=self.covered.get)
-            return guess
+        """flags certain mines and returns the cells to uncover: all provably safe cells, else the least likely mine
+
+        frontier and interior cells are ranked together, weighted by the number of mines left on the board
+        """
+        constraints = self.frontierConstraints()
+        constrained = {cell for cells, _ in constraints for cell in cells}
+        interior = [cell for cell in self.neighbours if self.isUndecided(cell) and cell not in constrained]
+        probabilities, interior_probability = self.solver.global_probabilities(
+            constraints, self.total_mines - len(self.bombs), len(interior))
+        if interior_probability is not None:
+            probabilities.update(dict.fromkeys(interior, interior_probability))
+        if not probabilities:
+            return []
+
+        mines = [cell for cell, probability in probabilities.items() if probability == 1]
+        self.addActionsToQueue(0, self.ACTION_FLAG, mines)
+
+        safe = [cell for cell, probability in probabilities.items() if probability == 0]
+        if safe:
+            return safe
+        candidates = [cell for cell, probability in probabilities.items() if probability < 1]
+        if not candidates:
+            return []
+        self.guesses += 1
+        return [min(candidates, key=lambda cell: (probabilities[cell], cell[1], cell[0]))]
 
     def one_one_and_variations(self):
-        for row in range(self.row_dimension):
-            for col in range(self.col_dimension):
-                if self.board[row][col] == 1:
-                    # Get adjacent cells
-                    adj_cells = self.getAdjacentCells(col, row)
-                    unexplored = [cell for cell in adj_cells if cell not in self.uncovered]
-
-                    # Skip if the pattern for this cell has already been processed
-                    if len(unexplored) >= 2:
-                        pattern_id = (row, col, tuple(sorted(unexplored)))
-                        if pattern_id in self.processed_patterns:
-                            continue
-
-                        # Mark pattern as processed
-                        self.processed_patterns.add(pattern_id)
-
-                        for adj_col, adj_row in adj_cells:
-                            hint_number = self.board[adj_row][adj_col]
-                            other_adj_cells = self.getAdjacentCells(adj_col, adj_row)
-                            other_unexplored = [cell for cell in other_adj_cells if cell not in self.uncovered]
-
-                            if len(other_unexplored) >= 3 and set(unexplored).issubset(set(other_unexplored)):
-                                if hint_number == 1:
-                                    safe = set(other_unexplored).difference(set(unexplored))
-
-                                    self.addActionsToQueue(
-                                        priority=1, action=self.ACTION_UNCOVER, directions=safe
-                                    )
-                                    return
-
-                                else:
-                                    if hint_number != "?":
-                                        bombs = set(other_unexplored).difference(set(unexplored))
-                                        if len(bombs) == hint_number - 1:
-                                            self.addActionsToQueue(
-                                                priority=1, action=self.ACTION_FLAG, directions=bombs
-                                            )
-                                            return
+        """matches changed frontier hints against the hints near them in the compiled pattern table"""
+        constraints = {}
+
+        def constraint(cell):
+            # (undecided cells, mines still missing) of a hint, worked out once per call
+            if cell not in constraints:
+                col, row = cell
+                undecided, bombs = self.checkCells(self.getAdjacentCells(col, row))
+                constraints[cell] = (frozenset(undecided), self.board[row][col] - len(bombs))
+            return constraints[cell]
+
+        # Only hints whose neighbourhood changed since they were last checked can match a new pattern
+        for cell in sorted(self.dirty_patterns, key=lambda cell: (cell[1], cell[0])):
+            self.dirty_patterns.discard(cell)
+            if cell not in self.frontier:
+                continue
+            cells_a, need_a = constraint(cell)
+            if not cells_a:
+                continue
+
+            matched = False
+            for partner in self.partners[cell]:
+                if partner not in self.frontier:
+                    continue
+                cells_b, need_b = constraint(partner)
+                shared = cells_a & cells_b
+                if not shared:
+                    continue
+                only_a = cells_a - shared
+                only_b = cells_b - shared
+                entry = PATTERNS.get(pattern_key(len(only_a), len(only_b), len(shared), need_a, need_b))
+                if entry:
+                    self.apply_pattern(entry, only_a, shared, only_b)
+                    matched = True
+            if matched:
+                return
+
+    def apply_pattern(self, entry, only_a, shared, only_b):
+        """queues the moves a pattern table entry decides"""
+        safe = []
+        mines = []
+        for cells, safe_bit, mines_bit in ((only_a, ONLY_A_SAFE, ONLY_A_MINES), (shared, SHARED_SAFE, SHARED_MINES),
+                                           (only_b, ONLY_B_SAFE, ONLY_B_MINES)):
+            if entry & safe_bit:
+                safe.extend(cells)
+            elif entry & mines_bit:
+                mines.extend(cells)
+        self.addActionsToQueue(priority=1, action=self.ACTION_UNCOVER, directions=sorted(safe))
+        self.addActionsToQueue(priority=1, action=self.ACTION_FLAG, directions=sorted(mines))
+
+    def isComplete(self):
+        """every safe cell has been uncovered"""
+        return self.total_cells - self.total_mines == len(self.revealed)
+
+    def observe(self, number, col, row):
+        """takes the percept for the cell of an earlier action"""
+        # Update board with the current cell's number
+        self.revealCell(number, col, row)
+
+        # Decide next actions based on the number hint
+        self.action_decider(number, col, row)
 
     def getAction(self, number: int) -> "Action Object":
         # World Complete Check
-        if self.total_cells - self.total_mines == self.uncovered_count:
+        if self.isComplete():
             return Action(AI.Action.LEAVE)
 
-        # Update board with the current cell's number
-        self.board[self.y][self.x] = number
+        self.observe(number, self.x, self.y)
+        return self.decide()
 
-        # Decide next actions based on the number hint
-        self.action_decider(number, self.x, self.y)
+    def getActionBatch(self, percepts):
+        """batch form of getAction: percepts answer the previous batch in order, returns every move already certain"""
+        for (col, row), number in zip(self.last_batch, percepts):
+            # None answers an action the world skipped as invalid
+            if number is not None:
+                self.observe(number, col, row)
 
+        if self.isComplete():
+            return [Action(AI.Action.LEAVE)]
+
+        actions = [self.decide()]
+        if actions[0].getMove() != AI.Action.LEAVE:
+            action = self.runQueue()
+            while action:
+                actions.append(action)
+                action = self.runQueue()
+            if self.stats is not None:
+                self.stats.decisions["queue"] += len(actions) - 1
+        self.last_batch = [(action.getX(), action.getY()) for action in actions]
+        return actions
+
+    def decide(self):
+        """picks the next action once every percept has been taken in"""
+        for phase in self.phases:
+            action = phase()
+            if action:
+                return action
+        return Action(AI.Action.LEAVE)
+
+    def queuePhase(self):
         # Run actions from the main queue
-        action = self.runQueue()
-        if action:
-            return action
+        return self.runQueue()
 
+    def deferredPhase(self):
         # If main queue is empty, try deferred actions
-        action = self.processDeferredQueue()
-        if action:
-            return action
+        return self.processDeferredQueue()
 
+    def explorePhase(self):
         self.exploreUnexploredCells()
-        action = self.processDeferredQueue()
-        if action:
-            return action
+        return self.processDeferredQueue()
 
+    def patternsPhase(self):
         self.one_one_and_variations()
-        action = self.runQueue()
-        if action:
-            return action
+        return self.runQueue()
 
+    def guessPhase(self):
         # Explore remaining cells if no actions are queued
         if len(self.bombs) < self.total_mines:
-            min_guess = self.educated_guess()
-            if min_guess:
-                del self.covered[min_guess]
-                self.addActionsToQueue(0, self.ACTION_UNCOVER, [min_guess])
+            self.addActionsToQueue(0, self.ACTION_UNCOVER, self.educated_guess())
 
         # uncover rest of cells if no mines
         else:
@@ -260,8 +361,38 @@ class MyAI(AI):
             for col, row in unexplored_cells:
                 heappush(self.queue, (0, (self.ACTION_UNCOVER, col, row)))
 
-        action = self.runQueue()
-        if action:
+        return self.runQueue()
+
+    def enableStats(self):
+        """times every phase of getAction and counts the decisions it makes, into self.stats"""
+        self.stats = PhaseStats()
+        self.stats.games = 1
+        # The component cache is shared with earlier games, so only count its lookups from here on
+        cache = self.solver.cache
+        self.cache_baseline = (cache.hits, cache.misses) if cache is not None else (0, 0)
+        self.phases = [self.timedPhase(name, phase) for name, phase in zip(PhaseStats.PHASES, self.phases)]
+
+    def timedPhase(self, name, phase):
+        """wraps one phase so that its calls, time and decisions are recorded"""
+        stats = self.stats
+
+        def timed():
+            start = perf_counter()
+            action = phase()
+            stats.seconds[name] += perf_counter() - start
+            stats.calls[name] += 1
+            if action:
+                stats.decisions[name] += 1
             return action
-
-        return Action(AI.Action.LEAVE)
+        return timed
+
+    def getStats(self):
+        """this game's stats as a plain dict, or None if they were not enabled"""
+        if self.stats is None:
+            return None
+        self.stats.guesses = self.guesses
+        cache = self.solver.cache
+        if cache is not None:
+            self.stats.cache_hits = cache.hits - self.cache_baseline[0]
+            self.stats.cache_misses = cache.misses - self.cache_baseline[1]
+        return self.stats.asDict()
@@ -0,0 +1,50 @@
+from functools import lru_cache
+
+# Same order as MyAI has always walked a cell's neighbours
+DIRECTIONS = ((-1, -1), (-1, 0), (-1, 1),
+              (0, -1), (0, 1),
+              (1, -1), (1, 0), (1, 1))
+
+
+@lru_cache(maxsize=None)
+def neighbourTable(colDimension, rowDimension):
+    """maps every (col, row) to the tuple of its in-bounds neighbours, built once per board size"""
+    table = {}
+    for col in range(colDimension):
+        for row in range(rowDimension):
+            table[(col, row)] = tuple((col + dc, row + dr) for dc, dr in DIRECTIONS
+                                      if 0 <= col + dc < colDimension and 0 <= row + dr < rowDimension)
+    return table
+
+
+@lru_cache(maxsize=None)
+def flatNeighbourTable(colDimension, rowDimension):
+    """same as neighbourTable, for boards stored flat at index col * rowDimension + row"""
+    table = neighbourTable(colDimension, rowDimension)
+    return tuple(tuple(c * rowDimension + r for c, r in table[(col, row)])
+                 for col in range(colDimension) for row in range(rowDimension))
+
+
+@lru_cache(maxsize=None)
+def partnerTable(colDimension, rowDimension):
+    """maps every (col, row) to the in-bounds cells at most two columns and rows away, whose neighbours can overlap its own"""
+    table = {}
+    for col in range(colDimension):
+        for row in range(rowDimension):
+            table[(col, row)] = tuple((col + dc, row + dr) for dc in range(-2, 3) for dr in range(-2, 3)
+                                      if (dc or dr) and 0 <= col + dc < colDimension and 0 <= row + dr < rowDimension)
+    return table
+
+
+@lru_cache(maxsize=None)
+def neighbourMasks(colDimension, rowDimension):
+    """neighbours of every cell as an int bitset, bit col * rowDimension + row standing for (col, row)"""
+    return tuple(sum(1 << i for i in cells) for cells in flatNeighbourTable(colDimension, rowDimension))
+
+
+@lru_cache(maxsize=None)
+def flatPartnerTable(colDimension, rowDimension):
+    """same as partnerTable, for boards stored flat at index col * rowDimension + row"""
+    table = partnerTable(colDimension, rowDimension)
+    return tuple(tuple(c * rowDimension + r for c, r in table[(col, row)])
+                 for col in range(colDimension) for row in range(rowDimension))
@@ -0,0 +1,84 @@
+# Builds PatternTable.py, the table of local patterns used by
+# MyAI.one_one_and_variations.
+#
+# A pattern is two overlapping hint constraints: hint A has only_a undecided
+# cells of its own, hint B has only_b, they share shared undecided cells,
+# and need_a and need_b mines are still missing around them. Enumerating
+# every split of the mines between the three groups tells which groups
+# are certainly safe or certainly mines. 1-1, 1-2, and chained along a
+# wall 1-2-1 and 1-2-2-1, are all instances.
+#
+# Syntax:	python3 PatternCompiler.py
+#			rewrites PatternTable.py next to this file.
+
+import os
+
+# Two hint cells within two columns and rows of each other share at most four cells
+MAX_SHARED = 4
+MAX_CELLS = 8
+
+# Bits of a table entry
+ONLY_A_SAFE = 1
+ONLY_A_MINES = 2
+ONLY_B_SAFE = 4
+ONLY_B_MINES = 8
+SHARED_SAFE = 16
+SHARED_MINES = 32
+
+
+def pattern_key(only_a, only_b, shared, need_a, need_b):
+    """packs a pattern into one int, four bits per field"""
+    return only_a | only_b << 4 | shared << 8 | need_a << 12 | need_b << 16
+
+
+def deduce(only_a, only_b, shared, need_a, need_b):
+    """entry bits for a pattern, from every count of mines among the shared cells that fits both hints"""
+    splits = [(need_a - x, x, need_b - x) for x in range(shared + 1)
+              if 0 <= need_a - x <= only_a and 0 <= need_b - x <= only_b]
+    if not splits:
+        return 0
+    entry = 0
+    for group, (size, safe_bit, mines_bit) in enumerate(((only_a, ONLY_A_SAFE, ONLY_A_MINES),
+                                                         (shared, SHARED_SAFE, SHARED_MINES),
+                                                         (only_b, ONLY_B_SAFE, ONLY_B_MINES))):
+        if size == 0:
+            continue
+        if all(split[group] == 0 for split in splits):
+            entry |= safe_bit
+        elif all(split[group] == size for split in splits):
+            entry |= mines_bit
+    return entry
+
+
+def compile_table():
+    """maps the key of every pattern that decides some cells to its entry"""
+    table = {}
+    for shared in range(1, MAX_SHARED + 1):
+        for only_a in range(MAX_CELLS - shared + 1):
+            for only_b in range(MAX_CELLS - shared + 1):
+                for need_a in range(only_a + shared + 1):
+                    for need_b in range(only_b + shared + 1):
+                        entry = deduce(only_a, only_b, shared, need_a, need_b)
+                        if entry:
+                            table[pattern_key(only_a, only_b, shared, need_a, need_b)] = entry
+    return table
+
+
+def write_table(path):
+    table = compile_table()
+    with open(path, "w") as file:
+        file.write("# Generated by PatternCompiler.py, do not edit\n\n")
+        file.write("PATTERNS = {\n")
+        for key in sorted(table):
+            file.write("    {}: {},\n".format(key, table[key]))
+        file.write("}\n")
+    return len(table)
+
+
+def main():
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "PatternTable.py")
+    print("Wrote " + str(write_table(path)) + " patterns to " + path)
+
+
+if __name__ == "__main__":
+    main()
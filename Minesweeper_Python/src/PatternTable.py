@@ -0,0 +1,2776 @@
+# Generated by PatternCompiler.py, do not edit
+
+PATTERNS = {
+    256: 16,
+    257: 17,
+    258: 17,
+    259: 17,
+    260: 17,
+    261: 17,
+    262: 17,
+    263: 17,
+    272: 20,
+    273: 21,
+    274: 21,
+    275: 21,
+    276: 21,
+    277: 21,
+    278: 21,
+    279: 21,
+    288: 20,
+    289: 21,
+    290: 21,
+    291: 21,
+    292: 21,
+    293: 21,
+    294: 21,
+    295: 21,
+    304: 20,
+    305: 21,
+    306: 21,
+    307: 21,
+    308: 21,
+    309: 21,
+    310: 21,
+    311: 21,
+    320: 20,
+    321: 21,
+    322: 21,
+    323: 21,
+    324: 21,
+    325: 21,
+    326: 21,
+    327: 21,
+    336: 20,
+    337: 21,
+    338: 21,
+    339: 21,
+    340: 21,
+    341: 21,
+    342: 21,
+    343: 21,
+    352: 20,
+    353: 21,
+    354: 21,
+    355: 21,
+    356: 21,
+    357: 21,
+    358: 21,
+    359: 21,
+    368: 20,
+    369: 21,
+    370: 21,
+    371: 21,
+    372: 21,
+    373: 21,
+    374: 21,
+    375: 21,
+    512: 16,
+    513: 17,
+    514: 17,
+    515: 17,
+    516: 17,
+    517: 17,
+    518: 17,
+    528: 20,
+    529: 21,
+    530: 21,
+    531: 21,
+    532: 21,
+    533: 21,
+    534: 21,
+    544: 20,
+    545: 21,
+    546: 21,
+    547: 21,
+    548: 21,
+    549: 21,
+    550: 21,
+    560: 20,
+    561: 21,
+    562: 21,
+    563: 21,
+    564: 21,
+    565: 21,
+    566: 21,
+    576: 20,
+    577: 21,
+    578: 21,
+    579: 21,
+    580: 21,
+    581: 21,
+    582: 21,
+    592: 20,
+    593: 21,
+    594: 21,
+    595: 21,
+    596: 21,
+    597: 21,
+    598: 21,
+    608: 20,
+    609: 21,
+    610: 21,
+    611: 21,
+    612: 21,
+    613: 21,
+    614: 21,
+    768: 16,
+    769: 17,
+    770: 17,
+    771: 17,
+    772: 17,
+    773: 17,
+    784: 20,
+    785: 21,
+    786: 21,
+    787: 21,
+    788: 21,
+    789: 21,
+    800: 20,
+    801: 21,
+    802: 21,
+    803: 21,
+    804: 21,
+    805: 21,
+    816: 20,
+    817: 21,
+    818: 21,
+    819: 21,
+    820: 21,
+    821: 21,
+    832: 20,
+    833: 21,
+    834: 21,
+    835: 21,
+    836: 21,
+    837: 21,
+    848: 20,
+    849: 21,
+    850: 21,
+    851: 21,
+    852: 21,
+    853: 21,
+    1024: 16,
+    1025: 17,
+    1026: 17,
+    1027: 17,
+    1028: 17,
+    1040: 20,
+    1041: 21,
+    1042: 21,
+    1043: 21,
+    1044: 21,
+    1056: 20,
+    1057: 21,
+    1058: 21,
+    1059: 21,
+    1060: 21,
+    1072: 20,
+    1073: 21,
+    1074: 21,
+    1075: 21,
+    1076: 21,
+    1088: 20,
+    1089: 21,
+    1090: 21,
+    1091: 21,
+    1092: 21,
+    4353: 18,
+    4354: 16,
+    4355: 16,
+    4356: 16,
+    4357: 16,
+    4358: 16,
+    4359: 16,
+    4369: 22,
+    4370: 20,
+    4371: 20,
+    4372: 20,
+    4373: 20,
+    4374: 20,
+    4375: 20,
+    4385: 22,
+    4386: 20,
+    4387: 20,
+    4388: 20,
+    4389: 20,
+    4390: 20,
+    4391: 20,
+    4401: 22,
+    4402: 20,
+    4403: 20,
+    4404: 20,
+    4405: 20,
+    4406: 20,
+    4407: 20,
+    4417: 22,
+    4418: 20,
+    4419: 20,
+    4420: 20,
+    4421: 20,
+    4422: 20,
+    4423: 20,
+    4433: 22,
+    4434: 20,
+    4435: 20,
+    4436: 20,
+    4437: 20,
+    4438: 20,
+    4439: 20,
+    4449: 22,
+    4450: 20,
+    4451: 20,
+    4452: 20,
+    4453: 20,
+    4454: 20,
+    4455: 20,
+    4465: 22,
+    4466: 20,
+    4467: 20,
+    4468: 20,
+    4469: 20,
+    4470: 20,
+    4471: 20,
+    4609: 18,
+    4610: 16,
+    4611: 16,
+    4612: 16,
+    4613: 16,
+    4614: 16,
+    4625: 22,
+    4626: 20,
+    4627: 20,
+    4628: 20,
+    4629: 20,
+    4630: 20,
+    4641: 22,
+    4642: 20,
+    4643: 20,
+    4644: 20,
+    4645: 20,
+    4646: 20,
+    4657: 22,
+    4658: 20,
+    4659: 20,
+    4660: 20,
+    4661: 20,
+    4662: 20,
+    4673: 22,
+    4674: 20,
+    4675: 20,
+    4676: 20,
+    4677: 20,
+    4678: 20,
+    4689: 22,
+    4690: 20,
+    4691: 20,
+    4692: 20,
+    4693: 20,
+    4694: 20,
+    4705: 22,
+    4706: 20,
+    4707: 20,
+    4708: 20,
+    4709: 20,
+    4710: 20,
+    4865: 18,
+    4866: 16,
+    4867: 16,
+    4868: 16,
+    4869: 16,
+    4881: 22,
+    4882: 20,
+    4883: 20,
+    4884: 20,
+    4885: 20,
+    4897: 22,
+    4898: 20,
+    4899: 20,
+    4900: 20,
+    4901: 20,
+    4913: 22,
+    4914: 20,
+    4915: 20,
+    4916: 20,
+    4917: 20,
+    4929: 22,
+    4930: 20,
+    4931: 20,
+    4932: 20,
+    4933: 20,
+    4945: 22,
+    4946: 20,
+    4947: 20,
+    4948: 20,
+    4949: 20,
+    5121: 18,
+    5122: 16,
+    5123: 16,
+    5124: 16,
+    5137: 22,
+    5138: 20,
+    5139: 20,
+    5140: 20,
+    5153: 22,
+    5154: 20,
+    5155: 20,
+    5156: 20,
+    5169: 22,
+    5170: 20,
+    5171: 20,
+    5172: 20,
+    5185: 22,
+    5186: 20,
+    5187: 20,
+    5188: 20,
+    8450: 18,
+    8451: 16,
+    8452: 16,
+    8453: 16,
+    8454: 16,
+    8455: 16,
+    8466: 22,
+    8467: 20,
+    8468: 20,
+    8469: 20,
+    8470: 20,
+    8471: 20,
+    8482: 22,
+    8483: 20,
+    8484: 20,
+    8485: 20,
+    8486: 20,
+    8487: 20,
+    8498: 22,
+    8499: 20,
+    8500: 20,
+    8501: 20,
+    8502: 20,
+    8503: 20,
+    8514: 22,
+    8515: 20,
+    8516: 20,
+    8517: 20,
+    8518: 20,
+    8519: 20,
+    8530: 22,
+    8531: 20,
+    8532: 20,
+    8533: 20,
+    8534: 20,
+    8535: 20,
+    8546: 22,
+    8547: 20,
+    8548: 20,
+    8549: 20,
+    8550: 20,
+    8551: 20,
+    8562: 22,
+    8563: 20,
+    8564: 20,
+    8565: 20,
+    8566: 20,
+    8567: 20,
+    8706: 18,
+    8707: 16,
+    8708: 16,
+    8709: 16,
+    8710: 16,
+    8722: 22,
+    8723: 20,
+    8724: 20,
+    8725: 20,
+    8726: 20,
+    8738: 22,
+    8739: 20,
+    8740: 20,
+    8741: 20,
+    8742: 20,
+    8754: 22,
+    8755: 20,
+    8756: 20,
+    8757: 20,
+    8758: 20,
+    8770: 22,
+    8771: 20,
+    8772: 20,
+    8773: 20,
+    8774: 20,
+    8786: 22,
+    8787: 20,
+    8788: 20,
+    8789: 20,
+    8790: 20,
+    8802: 22,
+    8803: 20,
+    8804: 20,
+    8805: 20,
+    8806: 20,
+    8962: 18,
+    8963: 16,
+    8964: 16,
+    8965: 16,
+    8978: 22,
+    8979: 20,
+    8980: 20,
+    8981: 20,
+    8994: 22,
+    8995: 20,
+    8996: 20,
+    8997: 20,
+    9010: 22,
+    9011: 20,
+    9012: 20,
+    9013: 20,
+    9026: 22,
+    9027: 20,
+    9028: 20,
+    9029: 20,
+    9042: 22,
+    9043: 20,
+    9044: 20,
+    9045: 20,
+    9218: 18,
+    9219: 16,
+    9220: 16,
+    9234: 22,
+    9235: 20,
+    9236: 20,
+    9250: 22,
+    9251: 20,
+    9252: 20,
+    9266: 22,
+    9267: 20,
+    9268: 20,
+    9282: 22,
+    9283: 20,
+    9284: 20,
+    12547: 18,
+    12548: 16,
+    12549: 16,
+    12550: 16,
+    12551: 16,
+    12563: 22,
+    12564: 20,
+    12565: 20,
+    12566: 20,
+    12567: 20,
+    12579: 22,
+    12580: 20,
+    12581: 20,
+    12582: 20,
+    12583: 20,
+    12595: 22,
+    12596: 20,
+    12597: 20,
+    12598: 20,
+    12599: 20,
+    12611: 22,
+    12612: 20,
+    12613: 20,
+    12614: 20,
+    12615: 20,
+    12627: 22,
+    12628: 20,
+    12629: 20,
+    12630: 20,
+    12631: 20,
+    12643: 22,
+    12644: 20,
+    12645: 20,
+    12646: 20,
+    12647: 20,
+    12659: 22,
+    12660: 20,
+    12661: 20,
+    12662: 20,
+    12663: 20,
+    12803: 18,
+    12804: 16,
+    12805: 16,
+    12806: 16,
+    12819: 22,
+    12820: 20,
+    12821: 20,
+    12822: 20,
+    12835: 22,
+    12836: 20,
+    12837: 20,
+    12838: 20,
+    12851: 22,
+    12852: 20,
+    12853: 20,
+    12854: 20,
+    12867: 22,
+    12868: 20,
+    12869: 20,
+    12870: 20,
+    12883: 22,
+    12884: 20,
+    12885: 20,
+    12886: 20,
+    12899: 22,
+    12900: 20,
+    12901: 20,
+    12902: 20,
+    13059: 18,
+    13060: 16,
+    13061: 16,
+    13075: 22,
+    13076: 20,
+    13077: 20,
+    13091: 22,
+    13092: 20,
+    13093: 20,
+    13107: 22,
+    13108: 20,
+    13109: 20,
+    13123: 22,
+    13124: 20,
+    13125: 20,
+    13139: 22,
+    13140: 20,
+    13141: 20,
+    13315: 18,
+    13316: 16,
+    13331: 22,
+    13332: 20,
+    13347: 22,
+    13348: 20,
+    13363: 22,
+    13364: 20,
+    13379: 22,
+    13380: 20,
+    16644: 18,
+    16645: 16,
+    16646: 16,
+    16647: 16,
+    16660: 22,
+    16661: 20,
+    16662: 20,
+    16663: 20,
+    16676: 22,
+    16677: 20,
+    16678: 20,
+    16679: 20,
+    16692: 22,
+    16693: 20,
+    16694: 20,
+    16695: 20,
+    16708: 22,
+    16709: 20,
+    16710: 20,
+    16711: 20,
+    16724: 22,
+    16725: 20,
+    16726: 20,
+    16727: 20,
+    16740: 22,
+    16741: 20,
+    16742: 20,
+    16743: 20,
+    16756: 22,
+    16757: 20,
+    16758: 20,
+    16759: 20,
+    16900: 18,
+    16901: 16,
+    16902: 16,
+    16916: 22,
+    16917: 20,
+    16918: 20,
+    16932: 22,
+    16933: 20,
+    16934: 20,
+    16948: 22,
+    16949: 20,
+    16950: 20,
+    16964: 22,
+    16965: 20,
+    16966: 20,
+    16980: 22,
+    16981: 20,
+    16982: 20,
+    16996: 22,
+    16997: 20,
+    16998: 20,
+    17156: 18,
+    17157: 16,
+    17172: 22,
+    17173: 20,
+    17188: 22,
+    17189: 20,
+    17204: 22,
+    17205: 20,
+    17220: 22,
+    17221: 20,
+    17236: 22,
+    17237: 20,
+    17412: 18,
+    17428: 22,
+    17444: 22,
+    17460: 22,
+    17476: 22,
+    20741: 18,
+    20742: 16,
+    20743: 16,
+    20757: 22,
+    20758: 20,
+    20759: 20,
+    20773: 22,
+    20774: 20,
+    20775: 20,
+    20789: 22,
+    20790: 20,
+    20791: 20,
+    20805: 22,
+    20806: 20,
+    20807: 20,
+    20821: 22,
+    20822: 20,
+    20823: 20,
+    20837: 22,
+    20838: 20,
+    20839: 20,
+    20853: 22,
+    20854: 20,
+    20855: 20,
+    20997: 18,
+    20998: 16,
+    21013: 22,
+    21014: 20,
+    21029: 22,
+    21030: 20,
+    21045: 22,
+    21046: 20,
+    21061: 22,
+    21062: 20,
+    21077: 22,
+    21078: 20,
+    21093: 22,
+    21094: 20,
+    21253: 18,
+    21269: 22,
+    21285: 22,
+    21301: 22,
+    21317: 22,
+    21333: 22,
+    24838: 18,
+    24839: 16,
+    24854: 22,
+    24855: 20,
+    24870: 22,
+    24871: 20,
+    24886: 22,
+    24887: 20,
+    24902: 22,
+    24903: 20,
+    24918: 22,
+    24919: 20,
+    24934: 22,
+    24935: 20,
+    24950: 22,
+    24951: 20,
+    25094: 18,
+    25110: 22,
+    25126: 22,
+    25142: 22,
+    25158: 22,
+    25174: 22,
+    25190: 22,
+    28935: 18,
+    28951: 22,
+    28967: 22,
+    28983: 22,
+    28999: 22,
+    29015: 22,
+    29031: 22,
+    29047: 22,
+    65808: 24,
+    65809: 25,
+    65810: 25,
+    65811: 25,
+    65812: 25,
+    65813: 25,
+    65814: 25,
+    65815: 25,
+    65824: 16,
+    65825: 17,
+    65826: 17,
+    65827: 17,
+    65828: 17,
+    65829: 17,
+    65830: 17,
+    65831: 17,
+    65840: 16,
+    65841: 17,
+    65842: 17,
+    65843: 17,
+    65844: 17,
+    65845: 17,
+    65846: 17,
+    65847: 17,
+    65856: 16,
+    65857: 17,
+    65858: 17,
+    65859: 17,
+    65860: 17,
+    65861: 17,
+    65862: 17,
+    65863: 17,
+    65872: 16,
+    65873: 17,
+    65874: 17,
+    65875: 17,
+    65876: 17,
+    65877: 17,
+    65878: 17,
+    65879: 17,
+    65888: 16,
+    65889: 17,
+    65890: 17,
+    65891: 17,
+    65892: 17,
+    65893: 17,
+    65894: 17,
+    65895: 17,
+    65904: 16,
+    65905: 17,
+    65906: 17,
+    65907: 17,
+    65908: 17,
+    65909: 17,
+    65910: 17,
+    65911: 17,
+    66064: 24,
+    66065: 25,
+    66066: 25,
+    66067: 25,
+    66068: 25,
+    66069: 25,
+    66070: 25,
+    66080: 16,
+    66081: 17,
+    66082: 17,
+    66083: 17,
+    66084: 17,
+    66085: 17,
+    66086: 17,
+    66096: 16,
+    66097: 17,
+    66098: 17,
+    66099: 17,
+    66100: 17,
+    66101: 17,
+    66102: 17,
+    66112: 16,
+    66113: 17,
+    66114: 17,
+    66115: 17,
+    66116: 17,
+    66117: 17,
+    66118: 17,
+    66128: 16,
+    66129: 17,
+    66130: 17,
+    66131: 17,
+    66132: 17,
+    66133: 17,
+    66134: 17,
+    66144: 16,
+    66145: 17,
+    66146: 17,
+    66147: 17,
+    66148: 17,
+    66149: 17,
+    66150: 17,
+    66320: 24,
+    66321: 25,
+    66322: 25,
+    66323: 25,
+    66324: 25,
+    66325: 25,
+    66336: 16,
+    66337: 17,
+    66338: 17,
+    66339: 17,
+    66340: 17,
+    66341: 17,
+    66352: 16,
+    66353: 17,
+    66354: 17,
+    66355: 17,
+    66356: 17,
+    66357: 17,
+    66368: 16,
+    66369: 17,
+    66370: 17,
+    66371: 17,
+    66372: 17,
+    66373: 17,
+    66384: 16,
+    66385: 17,
+    66386: 17,
+    66387: 17,
+    66388: 17,
+    66389: 17,
+    66576: 24,
+    66577: 25,
+    66578: 25,
+    66579: 25,
+    66580: 25,
+    66592: 16,
+    66593: 17,
+    66594: 17,
+    66595: 17,
+    66596: 17,
+    66608: 16,
+    66609: 17,
+    66610: 17,
+    66611: 17,
+    66612: 17,
+    66624: 16,
+    66625: 17,
+    66626: 17,
+    66627: 17,
+    66628: 17,
+    69888: 32,
+    69889: 33,
+    69890: 33,
+    69891: 33,
+    69892: 33,
+    69893: 33,
+    69894: 33,
+    69895: 33,
+    69904: 36,
+    69920: 36,
+    69936: 36,
+    69952: 36,
+    69968: 36,
+    69984: 36,
+    70000: 36,
+    70145: 1,
+    70146: 1,
+    70147: 1,
+    70148: 1,
+    70149: 1,
+    70150: 1,
+    70160: 4,
+    70176: 4,
+    70192: 4,
+    70208: 4,
+    70224: 4,
+    70240: 4,
+    70401: 1,
+    70402: 1,
+    70403: 1,
+    70404: 1,
+    70405: 1,
+    70416: 4,
+    70432: 4,
+    70448: 4,
+    70464: 4,
+    70480: 4,
+    70657: 1,
+    70658: 1,
+    70659: 1,
+    70660: 1,
+    70672: 4,
+    70688: 4,
+    70704: 4,
+    70720: 4,
+    73985: 34,
+    73986: 32,
+    73987: 32,
+    73988: 32,
+    73989: 32,
+    73990: 32,
+    73991: 32,
+    74001: 38,
+    74017: 38,
+    74033: 38,
+    74049: 38,
+    74065: 38,
+    74081: 38,
+    74097: 38,
+    74241: 2,
+    74257: 6,
+    74273: 6,
+    74289: 6,
+    74305: 6,
+    74321: 6,
+    74337: 6,
+    74497: 2,
+    74513: 6,
+    74529: 6,
+    74545: 6,
+    74561: 6,
+    74577: 6,
+    74753: 2,
+    74769: 6,
+    74785: 6,
+    74801: 6,
+    74817: 6,
+    78082: 34,
+    78083: 32,
+    78084: 32,
+    78085: 32,
+    78086: 32,
+    78087: 32,
+    78098: 38,
+    78114: 38,
+    78130: 38,
+    78146: 38,
+    78162: 38,
+    78178: 38,
+    78194: 38,
+    78338: 2,
+    78354: 6,
+    78370: 6,
+    78386: 6,
+    78402: 6,
+    78418: 6,
+    78434: 6,
+    78594: 2,
+    78610: 6,
+    78626: 6,
+    78642: 6,
+    78658: 6,
+    78674: 6,
+    78850: 2,
+    78866: 6,
+    78882: 6,
+    78898: 6,
+    78914: 6,
+    82179: 34,
+    82180: 32,
+    82181: 32,
+    82182: 32,
+    82183: 32,
+    82195: 38,
+    82211: 38,
+    82227: 38,
+    82243: 38,
+    82259: 38,
+    82275: 38,
+    82291: 38,
+    82435: 2,
+    82451: 6,
+    82467: 6,
+    82483: 6,
+    82499: 6,
+    82515: 6,
+    82531: 6,
+    82691: 2,
+    82707: 6,
+    82723: 6,
+    82739: 6,
+    82755: 6,
+    82771: 6,
+    82947: 2,
+    82963: 6,
+    82979: 6,
+    82995: 6,
+    83011: 6,
+    86276: 34,
+    86277: 32,
+    86278: 32,
+    86279: 32,
+    86292: 38,
+    86308: 38,
+    86324: 38,
+    86340: 38,
+    86356: 38,
+    86372: 38,
+    86388: 38,
+    86532: 2,
+    86548: 6,
+    86564: 6,
+    86580: 6,
+    86596: 6,
+    86612: 6,
+    86628: 6,
+    86788: 2,
+    86804: 6,
+    86820: 6,
+    86836: 6,
+    86852: 6,
+    86868: 6,
+    87044: 2,
+    87060: 6,
+    87076: 6,
+    87092: 6,
+    87108: 6,
+    90373: 34,
+    90374: 32,
+    90375: 32,
+    90389: 38,
+    90405: 38,
+    90421: 38,
+    90437: 38,
+    90453: 38,
+    90469: 38,
+    90485: 38,
+    90629: 2,
+    90645: 6,
+    90661: 6,
+    90677: 6,
+    90693: 6,
+    90709: 6,
+    90725: 6,
+    90885: 2,
+    90901: 6,
+    90917: 6,
+    90933: 6,
+    90949: 6,
+    90965: 6,
+    94470: 34,
+    94471: 32,
+    94486: 38,
+    94502: 38,
+    94518: 38,
+    94534: 38,
+    94550: 38,
+    94566: 38,
+    94582: 38,
+    94726: 2,
+    94742: 6,
+    94758: 6,
+    94774: 6,
+    94790: 6,
+    94806: 6,
+    94822: 6,
+    98567: 34,
+    98583: 38,
+    98599: 38,
+    98615: 38,
+    98631: 38,
+    98647: 38,
+    98663: 38,
+    98679: 38,
+    131360: 24,
+    131361: 25,
+    131362: 25,
+    131363: 25,
+    131364: 25,
+    131365: 25,
+    131366: 25,
+    131367: 25,
+    131376: 16,
+    131377: 17,
+    131378: 17,
+    131379: 17,
+    131380: 17,
+    131381: 17,
+    131382: 17,
+    131383: 17,
+    131392: 16,
+    131393: 17,
+    131394: 17,
+    131395: 17,
+    131396: 17,
+    131397: 17,
+    131398: 17,
+    131399: 17,
+    131408: 16,
+    131409: 17,
+    131410: 17,
+    131411: 17,
+    131412: 17,
+    131413: 17,
+    131414: 17,
+    131415: 17,
+    131424: 16,
+    131425: 17,
+    131426: 17,
+    131427: 17,
+    131428: 17,
+    131429: 17,
+    131430: 17,
+    131431: 17,
+    131440: 16,
+    131441: 17,
+    131442: 17,
+    131443: 17,
+    131444: 17,
+    131445: 17,
+    131446: 17,
+    131447: 17,
+    131616: 24,
+    131617: 25,
+    131618: 25,
+    131619: 25,
+    131620: 25,
+    131621: 25,
+    131622: 25,
+    131632: 16,
+    131633: 17,
+    131634: 17,
+    131635: 17,
+    131636: 17,
+    131637: 17,
+    131638: 17,
+    131648: 16,
+    131649: 17,
+    131650: 17,
+    131651: 17,
+    131652: 17,
+    131653: 17,
+    131654: 17,
+    131664: 16,
+    131665: 17,
+    131666: 17,
+    131667: 17,
+    131668: 17,
+    131669: 17,
+    131670: 17,
+    131680: 16,
+    131681: 17,
+    131682: 17,
+    131683: 17,
+    131684: 17,
+    131685: 17,
+    131686: 17,
+    131872: 24,
+    131873: 25,
+    131874: 25,
+    131875: 25,
+    131876: 25,
+    131877: 25,
+    131888: 16,
+    131889: 17,
+    131890: 17,
+    131891: 17,
+    131892: 17,
+    131893: 17,
+    131904: 16,
+    131905: 17,
+    131906: 17,
+    131907: 17,
+    131908: 17,
+    131909: 17,
+    131920: 16,
+    131921: 17,
+    131922: 17,
+    131923: 17,
+    131924: 17,
+    131925: 17,
+    132128: 24,
+    132129: 25,
+    132130: 25,
+    132131: 25,
+    132132: 25,
+    132144: 16,
+    132145: 17,
+    132146: 17,
+    132147: 17,
+    132148: 17,
+    132160: 16,
+    132161: 17,
+    132162: 17,
+    132163: 17,
+    132164: 17,
+    135440: 40,
+    135441: 41,
+    135442: 41,
+    135443: 41,
+    135444: 41,
+    135445: 41,
+    135446: 41,
+    135447: 41,
+    135456: 32,
+    135472: 32,
+    135488: 32,
+    135504: 32,
+    135520: 32,
+    135536: 32,
+    135696: 8,
+    135697: 9,
+    135698: 9,
+    135699: 9,
+    135700: 9,
+    135701: 9,
+    135702: 9,
+    135952: 8,
+    135953: 9,
+    135954: 9,
+    135955: 9,
+    135956: 9,
+    135957: 9,
+    136208: 8,
+    136209: 9,
+    136210: 9,
+    136211: 9,
+    136212: 9,
+    139537: 42,
+    139538: 40,
+    139539: 40,
+    139540: 40,
+    139541: 40,
+    139542: 40,
+    139543: 40,
+    139553: 34,
+    139569: 34,
+    139585: 34,
+    139601: 34,
+    139617: 34,
+    139633: 34,
+    139776: 32,
+    139777: 33,
+    139778: 33,
+    139779: 33,
+    139780: 33,
+    139781: 33,
+    139782: 33,
+    139792: 36,
+    139808: 36,
+    139824: 36,
+    139840: 36,
+    139856: 36,
+    139872: 36,
+    140033: 1,
+    140034: 1,
+    140035: 1,
+    140036: 1,
+    140037: 1,
+    140048: 4,
+    140064: 4,
+    140080: 4,
+    140096: 4,
+    140112: 4,
+    140289: 1,
+    140290: 1,
+    140291: 1,
+    140292: 1,
+    140304: 4,
+    140320: 4,
+    140336: 4,
+    140352: 4,
+    143634: 42,
+    143635: 40,
+    143636: 40,
+    143637: 40,
+    143638: 40,
+    143639: 40,
+    143650: 34,
+    143666: 34,
+    143682: 34,
+    143698: 34,
+    143714: 34,
+    143730: 34,
+    143873: 34,
+    143874: 32,
+    143875: 32,
+    143876: 32,
+    143877: 32,
+    143878: 32,
+    143889: 38,
+    143905: 38,
+    143921: 38,
+    143937: 38,
+    143953: 38,
+    143969: 38,
+    144129: 2,
+    144145: 6,
+    144161: 6,
+    144177: 6,
+    144193: 6,
+    144209: 6,
+    144385: 2,
+    144401: 6,
+    144417: 6,
+    144433: 6,
+    144449: 6,
+    147731: 42,
+    147732: 40,
+    147733: 40,
+    147734: 40,
+    147735: 40,
+    147747: 34,
+    147763: 34,
+    147779: 34,
+    147795: 34,
+    147811: 34,
+    147827: 34,
+    147970: 34,
+    147971: 32,
+    147972: 32,
+    147973: 32,
+    147974: 32,
+    147986: 38,
+    148002: 38,
+    148018: 38,
+    148034: 38,
+    148050: 38,
+    148066: 38,
+    148226: 2,
+    148242: 6,
+    148258: 6,
+    148274: 6,
+    148290: 6,
+    148306: 6,
+    148482: 2,
+    148498: 6,
+    148514: 6,
+    148530: 6,
+    148546: 6,
+    151828: 42,
+    151829: 40,
+    151830: 40,
+    151831: 40,
+    151844: 34,
+    151860: 34,
+    151876: 34,
+    151892: 34,
+    151908: 34,
+    151924: 34,
+    152067: 34,
+    152068: 32,
+    152069: 32,
+    152070: 32,
+    152083: 38,
+    152099: 38,
+    152115: 38,
+    152131: 38,
+    152147: 38,
+    152163: 38,
+    152323: 2,
+    152339: 6,
+    152355: 6,
+    152371: 6,
+    152387: 6,
+    152403: 6,
+    152579: 2,
+    152595: 6,
+    152611: 6,
+    152627: 6,
+    152643: 6,
+    155925: 42,
+    155926: 40,
+    155927: 40,
+    155941: 34,
+    155957: 34,
+    155973: 34,
+    155989: 34,
+    156005: 34,
+    156021: 34,
+    156164: 34,
+    156165: 32,
+    156166: 32,
+    156180: 38,
+    156196: 38,
+    156212: 38,
+    156228: 38,
+    156244: 38,
+    156260: 38,
+    156420: 2,
+    156436: 6,
+    156452: 6,
+    156468: 6,
+    156484: 6,
+    156500: 6,
+    156676: 2,
+    156692: 6,
+    156708: 6,
+    156724: 6,
+    156740: 6,
+    160022: 42,
+    160023: 40,
+    160038: 34,
+    160054: 34,
+    160070: 34,
+    160086: 34,
+    160102: 34,
+    160118: 34,
+    160261: 34,
+    160262: 32,
+    160277: 38,
+    160293: 38,
+    160309: 38,
+    160325: 38,
+    160341: 38,
+    160357: 38,
+    160517: 2,
+    160533: 6,
+    160549: 6,
+    160565: 6,
+    160581: 6,
+    160597: 6,
+    164119: 42,
+    164135: 34,
+    164151: 34,
+    164167: 34,
+    164183: 34,
+    164199: 34,
+    164215: 34,
+    164358: 34,
+    164374: 38,
+    164390: 38,
+    164406: 38,
+    164422: 38,
+    164438: 38,
+    164454: 38,
+    196912: 24,
+    196913: 25,
+    196914: 25,
+    196915: 25,
+    196916: 25,
+    196917: 25,
+    196918: 25,
+    196919: 25,
+    196928: 16,
+    196929: 17,
+    196930: 17,
+    196931: 17,
+    196932: 17,
+    196933: 17,
+    196934: 17,
+    196935: 17,
+    196944: 16,
+    196945: 17,
+    196946: 17,
+    196947: 17,
+    196948: 17,
+    196949: 17,
+    196950: 17,
+    196951: 17,
+    196960: 16,
+    196961: 17,
+    196962: 17,
+    196963: 17,
+    196964: 17,
+    196965: 17,
+    196966: 17,
+    196967: 17,
+    196976: 16,
+    196977: 17,
+    196978: 17,
+    196979: 17,
+    196980: 17,
+    196981: 17,
+    196982: 17,
+    196983: 17,
+    197168: 24,
+    197169: 25,
+    197170: 25,
+    197171: 25,
+    197172: 25,
+    197173: 25,
+    197174: 25,
+    197184: 16,
+    197185: 17,
+    197186: 17,
+    197187: 17,
+    197188: 17,
+    197189: 17,
+    197190: 17,
+    197200: 16,
+    197201: 17,
+    197202: 17,
+    197203: 17,
+    197204: 17,
+    197205: 17,
+    197206: 17,
+    197216: 16,
+    197217: 17,
+    197218: 17,
+    197219: 17,
+    197220: 17,
+    197221: 17,
+    197222: 17,
+    197424: 24,
+    197425: 25,
+    197426: 25,
+    197427: 25,
+    197428: 25,
+    197429: 25,
+    197440: 16,
+    197441: 17,
+    197442: 17,
+    197443: 17,
+    197444: 17,
+    197445: 17,
+    197456: 16,
+    197457: 17,
+    197458: 17,
+    197459: 17,
+    197460: 17,
+    197461: 17,
+    197680: 24,
+    197681: 25,
+    197682: 25,
+    197683: 25,
+    197684: 25,
+    197696: 16,
+    197697: 17,
+    197698: 17,
+    197699: 17,
+    197700: 17,
+    200992: 40,
+    200993: 41,
+    200994: 41,
+    200995: 41,
+    200996: 41,
+    200997: 41,
+    200998: 41,
+    200999: 41,
+    201008: 32,
+    201024: 32,
+    201040: 32,
+    201056: 32,
+    201072: 32,
+    201248: 8,
+    201249: 9,
+    201250: 9,
+    201251: 9,
+    201252: 9,
+    201253: 9,
+    201254: 9,
+    201504: 8,
+    201505: 9,
+    201506: 9,
+    201507: 9,
+    201508: 9,
+    201509: 9,
+    201760: 8,
+    201761: 9,
+    201762: 9,
+    201763: 9,
+    201764: 9,
+    205089: 42,
+    205090: 40,
+    205091: 40,
+    205092: 40,
+    205093: 40,
+    205094: 40,
+    205095: 40,
+    205105: 34,
+    205121: 34,
+    205137: 34,
+    205153: 34,
+    205169: 34,
+    205328: 40,
+    205329: 41,
+    205330: 41,
+    205331: 41,
+    205332: 41,
+    205333: 41,
+    205334: 41,
+    205344: 32,
+    205360: 32,
+    205376: 32,
+    205392: 32,
+    205408: 32,
+    205584: 8,
+    205585: 9,
+    205586: 9,
+    205587: 9,
+    205588: 9,
+    205589: 9,
+    205840: 8,
+    205841: 9,
+    205842: 9,
+    205843: 9,
+    205844: 9,
+    209186: 42,
+    209187: 40,
+    209188: 40,
+    209189: 40,
+    209190: 40,
+    209191: 40,
+    209202: 34,
+    209218: 34,
+    209234: 34,
+    209250: 34,
+    209266: 34,
+    209425: 42,
+    209426: 40,
+    209427: 40,
+    209428: 40,
+    209429: 40,
+    209430: 40,
+    209441: 34,
+    209457: 34,
+    209473: 34,
+    209489: 34,
+    209505: 34,
+    209664: 32,
+    209665: 33,
+    209666: 33,
+    209667: 33,
+    209668: 33,
+    209669: 33,
+    209680: 36,
+    209696: 36,
+    209712: 36,
+    209728: 36,
+    209744: 36,
+    209921: 1,
+    209922: 1,
+    209923: 1,
+    209924: 1,
+    209936: 4,
+    209952: 4,
+    209968: 4,
+    209984: 4,
+    213283: 42,
+    213284: 40,
+    213285: 40,
+    213286: 40,
+    213287: 40,
+    213299: 34,
+    213315: 34,
+    213331: 34,
+    213347: 34,
+    213363: 34,
+    213522: 42,
+    213523: 40,
+    213524: 40,
+    213525: 40,
+    213526: 40,
+    213538: 34,
+    213554: 34,
+    213570: 34,
+    213586: 34,
+    213602: 34,
+    213761: 34,
+    213762: 32,
+    213763: 32,
+    213764: 32,
+    213765: 32,
+    213777: 38,
+    213793: 38,
+    213809: 38,
+    213825: 38,
+    213841: 38,
+    214017: 2,
+    214033: 6,
+    214049: 6,
+    214065: 6,
+    214081: 6,
+    217380: 42,
+    217381: 40,
+    217382: 40,
+    217383: 40,
+    217396: 34,
+    217412: 34,
+    217428: 34,
+    217444: 34,
+    217460: 34,
+    217619: 42,
+    217620: 40,
+    217621: 40,
+    217622: 40,
+    217635: 34,
+    217651: 34,
+    217667: 34,
+    217683: 34,
+    217699: 34,
+    217858: 34,
+    217859: 32,
+    217860: 32,
+    217861: 32,
+    217874: 38,
+    217890: 38,
+    217906: 38,
+    217922: 38,
+    217938: 38,
+    218114: 2,
+    218130: 6,
+    218146: 6,
+    218162: 6,
+    218178: 6,
+    221477: 42,
+    221478: 40,
+    221479: 40,
+    221493: 34,
+    221509: 34,
+    221525: 34,
+    221541: 34,
+    221557: 34,
+    221716: 42,
+    221717: 40,
+    221718: 40,
+    221732: 34,
+    221748: 34,
+    221764: 34,
+    221780: 34,
+    221796: 34,
+    221955: 34,
+    221956: 32,
+    221957: 32,
+    221971: 38,
+    221987: 38,
+    222003: 38,
+    222019: 38,
+    222035: 38,
+    222211: 2,
+    222227: 6,
+    222243: 6,
+    222259: 6,
+    222275: 6,
+    225574: 42,
+    225575: 40,
+    225590: 34,
+    225606: 34,
+    225622: 34,
+    225638: 34,
+    225654: 34,
+    225813: 42,
+    225814: 40,
+    225829: 34,
+    225845: 34,
+    225861: 34,
+    225877: 34,
+    225893: 34,
+    226052: 34,
+    226053: 32,
+    226068: 38,
+    226084: 38,
+    226100: 38,
+    226116: 38,
+    226132: 38,
+    226308: 2,
+    226324: 6,
+    226340: 6,
+    226356: 6,
+    226372: 6,
+    229671: 42,
+    229687: 34,
+    229703: 34,
+    229719: 34,
+    229735: 34,
+    229751: 34,
+    229910: 42,
+    229926: 34,
+    229942: 34,
+    229958: 34,
+    229974: 34,
+    229990: 34,
+    230149: 34,
+    230165: 38,
+    230181: 38,
+    230197: 38,
+    230213: 38,
+    230229: 38,
+    262464: 24,
+    262465: 25,
+    262466: 25,
+    262467: 25,
+    262468: 25,
+    262469: 25,
+    262470: 25,
+    262471: 25,
+    262480: 16,
+    262481: 17,
+    262482: 17,
+    262483: 17,
+    262484: 17,
+    262485: 17,
+    262486: 17,
+    262487: 17,
+    262496: 16,
+    262497: 17,
+    262498: 17,
+    262499: 17,
+    262500: 17,
+    262501: 17,
+    262502: 17,
+    262503: 17,
+    262512: 16,
+    262513: 17,
+    262514: 17,
+    262515: 17,
+    262516: 17,
+    262517: 17,
+    262518: 17,
+    262519: 17,
+    262720: 24,
+    262721: 25,
+    262722: 25,
+    262723: 25,
+    262724: 25,
+    262725: 25,
+    262726: 25,
+    262736: 16,
+    262737: 17,
+    262738: 17,
+    262739: 17,
+    262740: 17,
+    262741: 17,
+    262742: 17,
+    262752: 16,
+    262753: 17,
+    262754: 17,
+    262755: 17,
+    262756: 17,
+    262757: 17,
+    262758: 17,
+    262976: 24,
+    262977: 25,
+    262978: 25,
+    262979: 25,
+    262980: 25,
+    262981: 25,
+    262992: 16,
+    262993: 17,
+    262994: 17,
+    262995: 17,
+    262996: 17,
+    262997: 17,
+    263232: 24,
+    263233: 25,
+    263234: 25,
+    263235: 25,
+    263236: 25,
+    266544: 40,
+    266545: 41,
+    266546: 41,
+    266547: 41,
+    266548: 41,
+    266549: 41,
+    266550: 41,
+    266551: 41,
+    266560: 32,
+    266576: 32,
+    266592: 32,
+    266608: 32,
+    266800: 8,
+    266801: 9,
+    266802: 9,
+    266803: 9,
+    266804: 9,
+    266805: 9,
+    266806: 9,
+    267056: 8,
+    267057: 9,
+    267058: 9,
+    267059: 9,
+    267060: 9,
+    267061: 9,
+    267312: 8,
+    267313: 9,
+    267314: 9,
+    267315: 9,
+    267316: 9,
+    270641: 42,
+    270642: 40,
+    270643: 40,
+    270644: 40,
+    270645: 40,
+    270646: 40,
+    270647: 40,
+    270657: 34,
+    270673: 34,
+    270689: 34,
+    270705: 34,
+    270880: 40,
+    270881: 41,
+    270882: 41,
+    270883: 41,
+    270884: 41,
+    270885: 41,
+    270886: 41,
+    270896: 32,
+    270912: 32,
+    270928: 32,
+    270944: 32,
+    271136: 8,
+    271137: 9,
+    271138: 9,
+    271139: 9,
+    271140: 9,
+    271141: 9,
+    271392: 8,
+    271393: 9,
+    271394: 9,
+    271395: 9,
+    271396: 9,
+    274738: 42,
+    274739: 40,
+    274740: 40,
+    274741: 40,
+    274742: 40,
+    274743: 40,
+    274754: 34,
+    274770: 34,
+    274786: 34,
+    274802: 34,
+    274977: 42,
+    274978: 40,
+    274979: 40,
+    274980: 40,
+    274981: 40,
+    274982: 40,
+    274993: 34,
+    275009: 34,
+    275025: 34,
+    275041: 34,
+    275216: 40,
+    275217: 41,
+    275218: 41,
+    275219: 41,
+    275220: 41,
+    275221: 41,
+    275232: 32,
+    275248: 32,
+    275264: 32,
+    275280: 32,
+    275472: 8,
+    275473: 9,
+    275474: 9,
+    275475: 9,
+    275476: 9,
+    278835: 42,
+    278836: 40,
+    278837: 40,
+    278838: 40,
+    278839: 40,
+    278851: 34,
+    278867: 34,
+    278883: 34,
+    278899: 34,
+    279074: 42,
+    279075: 40,
+    279076: 40,
+    279077: 40,
+    279078: 40,
+    279090: 34,
+    279106: 34,
+    279122: 34,
+    279138: 34,
+    279313: 42,
+    279314: 40,
+    279315: 40,
+    279316: 40,
+    279317: 40,
+    279329: 34,
+    279345: 34,
+    279361: 34,
+    279377: 34,
+    279552: 32,
+    279553: 33,
+    279554: 33,
+    279555: 33,
+    279556: 33,
+    279568: 36,
+    279584: 36,
+    279600: 36,
+    279616: 36,
+    282932: 42,
+    282933: 40,
+    282934: 40,
+    282935: 40,
+    282948: 34,
+    282964: 34,
+    282980: 34,
+    282996: 34,
+    283171: 42,
+    283172: 40,
+    283173: 40,
+    283174: 40,
+    283187: 34,
+    283203: 34,
+    283219: 34,
+    283235: 34,
+    283410: 42,
+    283411: 40,
+    283412: 40,
+    283413: 40,
+    283426: 34,
+    283442: 34,
+    283458: 34,
+    283474: 34,
+    283649: 34,
+    283650: 32,
+    283651: 32,
+    283652: 32,
+    283665: 38,
+    283681: 38,
+    283697: 38,
+    283713: 38,
+    287029: 42,
+    287030: 40,
+    287031: 40,
+    287045: 34,
+    287061: 34,
+    287077: 34,
+    287093: 34,
+    287268: 42,
+    287269: 40,
+    287270: 40,
+    287284: 34,
+    287300: 34,
+    287316: 34,
+    287332: 34,
+    287507: 42,
+    287508: 40,
+    287509: 40,
+    287523: 34,
+    287539: 34,
+    287555: 34,
+    287571: 34,
+    287746: 34,
+    287747: 32,
+    287748: 32,
+    287762: 38,
+    287778: 38,
+    287794: 38,
+    287810: 38,
+    291126: 42,
+    291127: 40,
+    291142: 34,
+    291158: 34,
+    291174: 34,
+    291190: 34,
+    291365: 42,
+    291366: 40,
+    291381: 34,
+    291397: 34,
+    291413: 34,
+    291429: 34,
+    291604: 42,
+    291605: 40,
+    291620: 34,
+    291636: 34,
+    291652: 34,
+    291668: 34,
+    291843: 34,
+    291844: 32,
+    291859: 38,
+    291875: 38,
+    291891: 38,
+    291907: 38,
+    295223: 42,
+    295239: 34,
+    295255: 34,
+    295271: 34,
+    295287: 34,
+    295462: 42,
+    295478: 34,
+    295494: 34,
+    295510: 34,
+    295526: 34,
+    295701: 42,
+    295717: 34,
+    295733: 34,
+    295749: 34,
+    295765: 34,
+    295940: 34,
+    295956: 38,
+    295972: 38,
+    295988: 38,
+    296004: 38,
+    328016: 24,
+    328017: 25,
+    328018: 25,
+    328019: 25,
+    328020: 25,
+    328021: 25,
+    328022: 25,
+    328023: 25,
+    328032: 16,
+    328033: 17,
+    328034: 17,
+    328035: 17,
+    328036: 17,
+    328037: 17,
+    328038: 17,
+    328039: 17,
+    328048: 16,
+    328049: 17,
+    328050: 17,
+    328051: 17,
+    328052: 17,
+    328053: 17,
+    328054: 17,
+    328055: 17,
+    328272: 24,
+    328273: 25,
+    328274: 25,
+    328275: 25,
+    328276: 25,
+    328277: 25,
+    328278: 25,
+    328288: 16,
+    328289: 17,
+    328290: 17,
+    328291: 17,
+    328292: 17,
+    328293: 17,
+    328294: 17,
+    328528: 24,
+    328529: 25,
+    328530: 25,
+    328531: 25,
+    328532: 25,
+    328533: 25,
+    332096: 40,
+    332097: 41,
+    332098: 41,
+    332099: 41,
+    332100: 41,
+    332101: 41,
+    332102: 41,
+    332103: 41,
+    332112: 32,
+    332128: 32,
+    332144: 32,
+    332352: 8,
+    332353: 9,
+    332354: 9,
+    332355: 9,
+    332356: 9,
+    332357: 9,
+    332358: 9,
+    332608: 8,
+    332609: 9,
+    332610: 9,
+    332611: 9,
+    332612: 9,
+    332613: 9,
+    332864: 8,
+    332865: 9,
+    332866: 9,
+    332867: 9,
+    332868: 9,
+    336193: 42,
+    336194: 40,
+    336195: 40,
+    336196: 40,
+    336197: 40,
+    336198: 40,
+    336199: 40,
+    336209: 34,
+    336225: 34,
+    336241: 34,
+    336432: 40,
+    336433: 41,
+    336434: 41,
+    336435: 41,
+    336436: 41,
+    336437: 41,
+    336438: 41,
+    336448: 32,
+    336464: 32,
+    336480: 32,
+    336688: 8,
+    336689: 9,
+    336690: 9,
+    336691: 9,
+    336692: 9,
+    336693: 9,
+    336944: 8,
+    336945: 9,
+    336946: 9,
+    336947: 9,
+    336948: 9,
+    340290: 42,
+    340291: 40,
+    340292: 40,
+    340293: 40,
+    340294: 40,
+    340295: 40,
+    340306: 34,
+    340322: 34,
+    340338: 34,
+    340529: 42,
+    340530: 40,
+    340531: 40,
+    340532: 40,
+    340533: 40,
+    340534: 40,
+    340545: 34,
+    340561: 34,
+    340577: 34,
+    340768: 40,
+    340769: 41,
+    340770: 41,
+    340771: 41,
+    340772: 41,
+    340773: 41,
+    340784: 32,
+    340800: 32,
+    340816: 32,
+    341024: 8,
+    341025: 9,
+    341026: 9,
+    341027: 9,
+    341028: 9,
+    344387: 42,
+    344388: 40,
+    344389: 40,
+    344390: 40,
+    344391: 40,
+    344403: 34,
+    344419: 34,
+    344435: 34,
+    344626: 42,
+    344627: 40,
+    344628: 40,
+    344629: 40,
+    344630: 40,
+    344642: 34,
+    344658: 34,
+    344674: 34,
+    344865: 42,
+    344866: 40,
+    344867: 40,
+    344868: 40,
+    344869: 40,
+    344881: 34,
+    344897: 34,
+    344913: 34,
+    345104: 40,
+    345105: 41,
+    345106: 41,
+    345107: 41,
+    345108: 41,
+    345120: 32,
+    345136: 32,
+    345152: 32,
+    348484: 42,
+    348485: 40,
+    348486: 40,
+    348487: 40,
+    348500: 34,
+    348516: 34,
+    348532: 34,
+    348723: 42,
+    348724: 40,
+    348725: 40,
+    348726: 40,
+    348739: 34,
+    348755: 34,
+    348771: 34,
+    348962: 42,
+    348963: 40,
+    348964: 40,
+    348965: 40,
+    348978: 34,
+    348994: 34,
+    349010: 34,
+    349201: 42,
+    349202: 40,
+    349203: 40,
+    349204: 40,
+    349217: 34,
+    349233: 34,
+    349249: 34,
+    352581: 42,
+    352582: 40,
+    352583: 40,
+    352597: 34,
+    352613: 34,
+    352629: 34,
+    352820: 42,
+    352821: 40,
+    352822: 40,
+    352836: 34,
+    352852: 34,
+    352868: 34,
+    353059: 42,
+    353060: 40,
+    353061: 40,
+    353075: 34,
+    353091: 34,
+    353107: 34,
+    353298: 42,
+    353299: 40,
+    353300: 40,
+    353314: 34,
+    353330: 34,
+    353346: 34,
+    356678: 42,
+    356679: 40,
+    356694: 34,
+    356710: 34,
+    356726: 34,
+    356917: 42,
+    356918: 40,
+    356933: 34,
+    356949: 34,
+    356965: 34,
+    357156: 42,
+    357157: 40,
+    357172: 34,
+    357188: 34,
+    357204: 34,
+    357395: 42,
+    357396: 40,
+    357411: 34,
+    357427: 34,
+    357443: 34,
+    360775: 42,
+    360791: 34,
+    360807: 34,
+    360823: 34,
+    361014: 42,
+    361030: 34,
+    361046: 34,
+    361062: 34,
+    361253: 42,
+    361269: 34,
+    361285: 34,
+    361301: 34,
+    361492: 42,
+    361508: 34,
+    361524: 34,
+    361540: 34,
+    393568: 24,
+    393569: 25,
+    393570: 25,
+    393571: 25,
+    393572: 25,
+    393573: 25,
+    393574: 25,
+    393575: 25,
+    393584: 16,
+    393585: 17,
+    393586: 17,
+    393587: 17,
+    393588: 17,
+    393589: 17,
+    393590: 17,
+    393591: 17,
+    393824: 24,
+    393825: 25,
+    393826: 25,
+    393827: 25,
+    393828: 25,
+    393829: 25,
+    393830: 25,
+    397648: 40,
+    397649: 41,
+    397650: 41,
+    397651: 41,
+    397652: 41,
+    397653: 41,
+    397654: 41,
+    397655: 41,
+    397664: 32,
+    397680: 32,
+    397904: 8,
+    397905: 9,
+    397906: 9,
+    397907: 9,
+    397908: 9,
+    397909: 9,
+    397910: 9,
+    398160: 8,
+    398161: 9,
+    398162: 9,
+    398163: 9,
+    398164: 9,
+    398165: 9,
+    401745: 42,
+    401746: 40,
+    401747: 40,
+    401748: 40,
+    401749: 40,
+    401750: 40,
+    401751: 40,
+    401761: 34,
+    401777: 34,
+    401984: 40,
+    401985: 41,
+    401986: 41,
+    401987: 41,
+    401988: 41,
+    401989: 41,
+    401990: 41,
+    402000: 32,
+    402016: 32,
+    402240: 8,
+    402241: 9,
+    402242: 9,
+    402243: 9,
+    402244: 9,
+    402245: 9,
+    402496: 8,
+    402497: 9,
+    402498: 9,
+    402499: 9,
+    402500: 9,
+    405842: 42,
+    405843: 40,
+    405844: 40,
+    405845: 40,
+    405846: 40,
+    405847: 40,
+    405858: 34,
+    405874: 34,
+    406081: 42,
+    406082: 40,
+    406083: 40,
+    406084: 40,
+    406085: 40,
+    406086: 40,
+    406097: 34,
+    406113: 34,
+    406320: 40,
+    406321: 41,
+    406322: 41,
+    406323: 41,
+    406324: 41,
+    406325: 41,
+    406336: 32,
+    406352: 32,
+    406576: 8,
+    406577: 9,
+    406578: 9,
+    406579: 9,
+    406580: 9,
+    409939: 42,
+    409940: 40,
+    409941: 40,
+    409942: 40,
+    409943: 40,
+    409955: 34,
+    409971: 34,
+    410178: 42,
+    410179: 40,
+    410180: 40,
+    410181: 40,
+    410182: 40,
+    410194: 34,
+    410210: 34,
+    410417: 42,
+    410418: 40,
+    410419: 40,
+    410420: 40,
+    410421: 40,
+    410433: 34,
+    410449: 34,
+    410656: 40,
+    410657: 41,
+    410658: 41,
+    410659: 41,
+    410660: 41,
+    410672: 32,
+    410688: 32,
+    414036: 42,
+    414037: 40,
+    414038: 40,
+    414039: 40,
+    414052: 34,
+    414068: 34,
+    414275: 42,
+    414276: 40,
+    414277: 40,
+    414278: 40,
+    414291: 34,
+    414307: 34,
+    414514: 42,
+    414515: 40,
+    414516: 40,
+    414517: 40,
+    414530: 34,
+    414546: 34,
+    414753: 42,
+    414754: 40,
+    414755: 40,
+    414756: 40,
+    414769: 34,
+    414785: 34,
+    418133: 42,
+    418134: 40,
+    418135: 40,
+    418149: 34,
+    418165: 34,
+    418372: 42,
+    418373: 40,
+    418374: 40,
+    418388: 34,
+    418404: 34,
+    418611: 42,
+    418612: 40,
+    418613: 40,
+    418627: 34,
+    418643: 34,
+    418850: 42,
+    418851: 40,
+    418852: 40,
+    418866: 34,
+    418882: 34,
+    422230: 42,
+    422231: 40,
+    422246: 34,
+    422262: 34,
+    422469: 42,
+    422470: 40,
+    422485: 34,
+    422501: 34,
+    422708: 42,
+    422709: 40,
+    422724: 34,
+    422740: 34,
+    422947: 42,
+    422948: 40,
+    422963: 34,
+    422979: 34,
+    426327: 42,
+    426343: 34,
+    426359: 34,
+    426566: 42,
+    426582: 34,
+    426598: 34,
+    426805: 42,
+    426821: 34,
+    426837: 34,
+    427044: 42,
+    427060: 34,
+    427076: 34,
+    459120: 24,
+    459121: 25,
+    459122: 25,
+    459123: 25,
+    459124: 25,
+    459125: 25,
+    459126: 25,
+    459127: 25,
+    463200: 40,
+    463201: 41,
+    463202: 41,
+    463203: 41,
+    463204: 41,
+    463205: 41,
+    463206: 41,
+    463207: 41,
+    463216: 32,
+    463456: 8,
+    463457: 9,
+    463458: 9,
+    463459: 9,
+    463460: 9,
+    463461: 9,
+    463462: 9,
+    467297: 42,
+    467298: 40,
+    467299: 40,
+    467300: 40,
+    467301: 40,
+    467302: 40,
+    467303: 40,
+    467313: 34,
+    467536: 40,
+    467537: 41,
+    467538: 41,
+    467539: 41,
+    467540: 41,
+    467541: 41,
+    467542: 41,
+    467552: 32,
+    467792: 8,
+    467793: 9,
+    467794: 9,
+    467795: 9,
+    467796: 9,
+    467797: 9,
+    471394: 42,
+    471395: 40,
+    471396: 40,
+    471397: 40,
+    471398: 40,
+    471399: 40,
+    471410: 34,
+    471633: 42,
+    471634: 40,
+    471635: 40,
+    471636: 40,
+    471637: 40,
+    471638: 40,
+    471649: 34,
+    471872: 40,
+    471873: 41,
+    471874: 41,
+    471875: 41,
+    471876: 41,
+    471877: 41,
+    471888: 32,
+    472128: 8,
+    472129: 9,
+    472130: 9,
+    472131: 9,
+    472132: 9,
+    475491: 42,
+    475492: 40,
+    475493: 40,
+    475494: 40,
+    475495: 40,
+    475507: 34,
+    475730: 42,
+    475731: 40,
+    475732: 40,
+    475733: 40,
+    475734: 40,
+    475746: 34,
+    475969: 42,
+    475970: 40,
+    475971: 40,
+    475972: 40,
+    475973: 40,
+    475985: 34,
+    476208: 40,
+    476209: 41,
+    476210: 41,
+    476211: 41,
+    476212: 41,
+    476224: 32,
+    479588: 42,
+    479589: 40,
+    479590: 40,
+    479591: 40,
+    479604: 34,
+    479827: 42,
+    479828: 40,
+    479829: 40,
+    479830: 40,
+    479843: 34,
+    480066: 42,
+    480067: 40,
+    480068: 40,
+    480069: 40,
+    480082: 34,
+    480305: 42,
+    480306: 40,
+    480307: 40,
+    480308: 40,
+    480321: 34,
+    483685: 42,
+    483686: 40,
+    483687: 40,
+    483701: 34,
+    483924: 42,
+    483925: 40,
+    483926: 40,
+    483940: 34,
+    484163: 42,
+    484164: 40,
+    484165: 40,
+    484179: 34,
+    484402: 42,
+    484403: 40,
+    484404: 40,
+    484418: 34,
+    487782: 42,
+    487783: 40,
+    487798: 34,
+    488021: 42,
+    488022: 40,
+    488037: 34,
+    488260: 42,
+    488261: 40,
+    488276: 34,
+    488499: 42,
+    488500: 40,
+    488515: 34,
+    491879: 42,
+    491895: 34,
+    492118: 42,
+    492134: 34,
+    492357: 42,
+    492373: 34,
+    492596: 42,
+    492612: 34,
+    528752: 40,
+    528753: 41,
+    528754: 41,
+    528755: 41,
+    528756: 41,
+    528757: 41,
+    528758: 41,
+    528759: 41,
+    532849: 42,
+    532850: 40,
+    532851: 40,
+    532852: 40,
+    532853: 40,
+    532854: 40,
+    532855: 40,
+    533088: 40,
+    533089: 41,
+    533090: 41,
+    533091: 41,
+    533092: 41,
+    533093: 41,
+    533094: 41,
+    536946: 42,
+    536947: 40,
+    536948: 40,
+    536949: 40,
+    536950: 40,
+    536951: 40,
+    537185: 42,
+    537186: 40,
+    537187: 40,
+    537188: 40,
+    537189: 40,
+    537190: 40,
+    537424: 40,
+    537425: 41,
+    537426: 41,
+    537427: 41,
+    537428: 41,
+    537429: 41,
+    541043: 42,
+    541044: 40,
+    541045: 40,
+    541046: 40,
+    541047: 40,
+    541282: 42,
+    541283: 40,
+    541284: 40,
+    541285: 40,
+    541286: 40,
+    541521: 42,
+    541522: 40,
+    541523: 40,
+    541524: 40,
+    541525: 40,
+    541760: 40,
+    541761: 41,
+    541762: 41,
+    541763: 41,
+    541764: 41,
+    545140: 42,
+    545141: 40,
+    545142: 40,
+    545143: 40,
+    545379: 42,
+    545380: 40,
+    545381: 40,
+    545382: 40,
+    545618: 42,
+    545619: 40,
+    545620: 40,
+    545621: 40,
+    545857: 42,
+    545858: 40,
+    545859: 40,
+    545860: 40,
+    549237: 42,
+    549238: 40,
+    549239: 40,
+    549476: 42,
+    549477: 40,
+    549478: 40,
+    549715: 42,
+    549716: 40,
+    549717: 40,
+    549954: 42,
+    549955: 40,
+    549956: 40,
+    553334: 42,
+    553335: 40,
+    553573: 42,
+    553574: 40,
+    553812: 42,
+    553813: 40,
+    554051: 42,
+    554052: 40,
+    557431: 42,
+    557670: 42,
+    557909: 42,
+    558148: 42,
+}
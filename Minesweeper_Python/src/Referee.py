@@ -0,0 +1,245 @@
+# Asyncio referee: one process hosts many concurrent games, each played by
+# an agent on the other end of a local socket.
+#
+# Protocol, one line of ASCII per message:
+#	referee -> agent	START rows cols mines startX startY
+#						(0-based start tile, the arguments of MyAI())
+#						PERCEPT number		answer to the last action
+#						END score			the game is over
+#						BYE					no worlds left, close
+#	agent -> referee	UNCOVER x y | FLAG x y | UNFLAG x y | LEAVE
+#
+# A connection plays one world after the other until the referee runs out
+# of worlds, so N connections keep N games going at once. Invalid actions
+# are skipped without counting as a move, as in World.run(); a line that
+# isn't an action at all, or a dropped connection, ends that game with the
+# score it has.
+#
+# Syntax:	python3 Referee.py serve  (--socket PATH | --port N) (-f InputPath | -g R C M COUNT SEED) [-l LogFile]
+#			python3 Referee.py client (--socket PATH | --port N) [-c Connections] [--bitboard]
+#			python3 Referee.py local  (-f InputPath | -g R C M COUNT SEED) [-c Connections] [--bitboard] [-l LogFile]
+#
+#			local runs the referee and Connections stand-in clients (MyAI, or
+#			BitboardAI, in the same event loop) over a localhost socket.
+
+import argparse
+import asyncio
+import time
+from World import World
+from AI import AI
+from Action import Action
+from MyAI import MyAI
+from BitboardAI import BitboardAI
+from ResultsLog import ResultsLog
+from WorldStream import addWorldArguments, worldRecords, worldSource
+
+AGENTS = {"myai": MyAI, "bitboard": BitboardAI}
+# Pending connections the listening socket queues; hundreds of agents may connect at once
+BACKLOG = 1024
+MOVES = {"UNCOVER": AI.Action.UNCOVER, "FLAG": AI.Action.FLAG, "UNFLAG": AI.Action.UNFLAG, "LEAVE": AI.Action.LEAVE}
+
+
+def parseAction(line: bytes) -> Action:
+	""" Action of an agent's line, None if the line isn't one """
+	words = line.decode("ascii", "replace").split()
+	if not words or words[0] not in MOVES:
+		return None
+	if words[0] == "LEAVE":
+		return Action(AI.Action.LEAVE)
+	try:
+		return Action(MOVES[words[0]], int(words[1]), int(words[2]))
+	except (IndexError, ValueError):
+		return None
+
+
+def formatAction(action: Action) -> bytes:
+	move = action.getMove()
+	if move == AI.Action.LEAVE:
+		return b"LEAVE\n"
+	return "{} {} {}\n".format(move.name, action.getX(), action.getY()).encode("ascii")
+
+
+class Referee():
+
+	def __init__(self, records: "iterator of WorldRecords", onResult: "callable" = None):
+		self.__records = iter(records)
+		self.__onResult = onResult
+		self.__games = 0
+		self.__agents = 0
+		self.__exhausted = False
+		self.__finished = asyncio.Event()
+
+
+	def getGames(self) -> int:
+		return self.__games
+
+
+	async def finished(self) -> None:
+		""" Wait until every world has been played and the last agent has gone """
+		await self.__finished.wait()
+
+
+	async def handleAgent(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+		""" Play worlds with the agent on this connection until there are none left """
+		self.__agents += 1
+		try:
+			for record in self.__records:
+				result = await self.__playWorld(record, reader, writer)
+				self.__games += 1
+				if self.__onResult:
+					self.__onResult(result)
+				if result.get("disconnected"):
+					return
+			self.__exhausted = True
+			writer.write(b"BYE\n")
+			await writer.drain()
+		except ConnectionError:
+			pass
+		finally:
+			writer.close()
+			self.__agents -= 1
+			if self.__exhausted and self.__agents == 0:
+				self.__finished.set()
+
+
+	async def __playWorld(self, record: "WorldRecord", reader: asyncio.StreamReader,
+						  writer: asyncio.StreamWriter) -> dict:
+		""" Referee one game; the result has the fields of Main.runWorld's """
+		start = time.perf_counter()
+		world = World(record=record, aiType=None, headless=True)
+		writer.write("START {} {} {} {} {}\n".format(record.rows, record.cols, record.totalMines,
+													 record.startX, record.startY).encode("ascii"))
+		disconnected = False
+		while True:
+			writer.write(b"PERCEPT " + str(world.getPercept()).encode("ascii") + b"\n")
+			await writer.drain()
+			line = await reader.readline()
+			if not line:
+				disconnected = True
+				break
+			action = parseAction(line)
+			if action is None or world.step(action):
+				break
+
+		score = world.getScore()
+		if not disconnected:
+			writer.write(b"END " + str(score).encode("ascii") + b"\n")
+		return {"world": record.name, "rows": record.rows, "cols": record.cols, "mines": record.totalMines,
+				"won": score > 0, "score": score, "moves": world.getMovesMade(), "guesses": None,
+				"seconds": round(time.perf_counter() - start, 6), "disconnected": disconnected}
+
+
+async def playAgent(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, aiType: str = "myai") -> int:
+	""" Client side adapter: play every world the referee sends with a local agent, returning the game count """
+	agent = None
+	games = 0
+	try:
+		while True:
+			line = await reader.readline()
+			words = line.split()
+			if not words or words[0] == b"BYE":
+				break
+			if words[0] == b"START":
+				agent = AGENTS[aiType](*[int(word) for word in words[1:]])
+			elif words[0] == b"PERCEPT":
+				writer.write(formatAction(agent.getAction(int(words[1]))))
+				await writer.drain()
+			elif words[0] == b"END":
+				games += 1
+	finally:
+		writer.close()
+	return games
+
+
+async def connect(socketPath: str = None, port: int = None) -> "tuple":
+	if socketPath:
+		return await asyncio.open_unix_connection(socketPath)
+	return await asyncio.open_connection("127.0.0.1", port)
+
+
+async def serve(referee: Referee, socketPath: str = None, port: int = None) -> None:
+	""" Referee every agent that connects until the worlds run out """
+	if socketPath:
+		server = await asyncio.start_unix_server(referee.handleAgent, socketPath, backlog=BACKLOG)
+	else:
+		server = await asyncio.start_server(referee.handleAgent, "127.0.0.1", port, backlog=BACKLOG)
+	async with server:
+		await referee.finished()
+
+
+async def runClients(connections: int, aiType: str, socketPath: str = None, port: int = None) -> int:
+	""" Open connections to a referee and play on all of them at once, returning the game count """
+	async def client():
+		reader, writer = await connect(socketPath, port)
+		return await playAgent(reader, writer, aiType)
+	return sum(await asyncio.gather(*[client() for _ in range(connections)]))
+
+
+async def runLocal(records: "iterator of WorldRecords", connections: int, aiType: str = "myai",
+				   onResult: "callable" = None) -> int:
+	""" Referee and stand-in clients in one event loop, over a localhost socket; returns the game count """
+	referee = Referee(records, onResult)
+	server = await asyncio.start_server(referee.handleAgent, "127.0.0.1", 0, backlog=max(BACKLOG, connections))
+	port = server.sockets[0].getsockname()[1]
+	async with server:
+		await runClients(connections, aiType, port=port)
+	return referee.getGames()
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Asyncio referee for remote Minesweeper agents", prog="Referee.py")
+	parser.add_argument("mode", choices=("serve", "client", "local"))
+	addWorldArguments(parser)
+	parser.add_argument("--socket", help="unix socket path")
+	parser.add_argument("--port", help="localhost TCP port", type=int)
+	parser.add_argument("-c", help="concurrent connections", type=int, default=100)
+	parser.add_argument("--bitboard", help="play with BitboardAI instead of MyAI", action="store_true")
+	parser.add_argument("-l", help="write one JSON line of results per world to this file", metavar="FILE")
+	args = parser.parse_args()
+	aiType = "bitboard" if args.bitboard else "myai"
+
+	if args.mode == "client":
+		if not args.socket and args.port is None:
+			print("ERROR: client needs --socket or --port!")
+			return
+		games = asyncio.run(runClients(args.c, aiType, args.socket, args.port))
+		print("Played " + str(games) + " games")
+		return
+
+	try:
+		spec = worldSource(args)
+	except ValueError as e:
+		print("ERROR: " + str(e))
+		return
+	if args.mode == "serve" and not args.socket and args.port is None:
+		print("ERROR: serve needs --socket or --port!")
+		return
+
+	scores = [0, 0, 0, 0]
+	resultsLog = ResultsLog(args.l) if args.l else None
+
+	def onResult(result):
+		scores[result["score"]] += 1
+		if resultsLog:
+			resultsLog.write(result)
+
+	records = worldRecords(args.f, spec)
+	try:
+		if args.mode == "serve":
+			# Stops once every world is done and the last agent is gone; interrupt to stop early
+			asyncio.run(serve(Referee(records, onResult), args.socket, args.port))
+		else:
+			asyncio.run(runLocal(records, args.c, aiType, onResult))
+	except KeyboardInterrupt:
+		pass
+	finally:
+		if resultsLog:
+			resultsLog.close()
+
+	print("---------------Your agent's results:---------------")
+	print("Beginner: {} \tIntermediate: {} \tExpert: {}".format(scores[1], scores[2], scores[3]))
+	print("Cumulative Score: " + str(scores[1] + 2 * scores[2] + 3 * scores[3]))
+
+
+if __name__ == "__main__":
+	main()
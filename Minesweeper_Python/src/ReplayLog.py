@@ -0,0 +1,274 @@
+# Replay logs: the actions of many games in one compact binary file, and
+# a verifier that re-scores them against their worlds without any agent.
+#
+# Layout (little endian):
+#	header		magic "MSWR", version (uint16), reserved (uint16)
+#	games		one after the other, each a fixed-width header
+#					rows, cols (uint16), mine count (uint32), options
+#					(uint8, bit 0 set if zero regions were flood-filled),
+#					recorded score (uint8), action count (uint32),
+#					name length (uint16)
+#				followed by the world name (utf-8) and the actions, one
+#				uint16 each: move (AI.Action value) << 14 | x * rows + y
+#
+# Only the actions World applied are logged (invalid ones are skipped by
+# World without counting as a move), so replaying them in order rebuilds
+# the game exactly. A run that dies partway leaves at worst one torn last
+# game, which the reader ignores and a resumed run (Main.py --resume)
+# drops before appending.
+#
+# Verifier:	python3 ReplayLog.py [LogFile] [-f InputPath]
+#			InputPath is where the worlds come from: the directory of world
+#			files or the packed corpus the games were played on. Stream
+#			worlds are rebuilt from their names and text worlds are also
+#			found by their path.
+
+import argparse
+import array
+import os
+import struct
+import sys
+import time
+from collections import namedtuple
+from AI import AI
+from Neighbours import flatNeighbourTable
+from Scoring import worldScore
+from WorldCorpus import isCorpus, openCorpus, readTextWorld
+from WorldStream import StreamSpec, streamRecord
+
+MAGIC = b"MSWR"
+VERSION = 1
+FILE_HEADER = struct.Struct("<4sHH")
+GAME_HEADER = struct.Struct("<HHIBBIH")
+FLOOD_FILL = 1
+MOVE_SHIFT = 14
+# Boards with more tiles than this don't fit the 14 bits of a logged tile
+MAX_TILES = 1 << MOVE_SHIFT
+
+LEAVE = AI.Action.LEAVE.value
+UNCOVER = AI.Action.UNCOVER.value
+FLAG = AI.Action.FLAG.value
+UNFLAG = AI.Action.UNFLAG.value
+
+# One game of a log; actions is an array of uint16 codes
+Game = namedtuple("Game", ["name", "rows", "cols", "totalMines", "floodFill", "score", "actions"])
+
+
+def actionCode(move: "AI.Action", x: int, y: int, rows: int) -> int:
+	""" Code of an action as stored in the log """
+	return move.value << MOVE_SHIFT | x * rows + y
+
+
+def checkHeader(data: "bytes-like", path: str) -> None:
+	if len(data) < FILE_HEADER.size or FILE_HEADER.unpack_from(data, 0)[:2] != (MAGIC, VERSION):
+		raise ValueError("Not a version " + str(VERSION) + " replay log: " + path)
+
+
+def gameSpans(data: "bytes-like") -> "iterator of tuples":
+	""" (header fields, start, end) of every complete game of a log's data; the name and actions are data[start:end] """
+	offset = FILE_HEADER.size
+	while offset + GAME_HEADER.size <= len(data):
+		fields = GAME_HEADER.unpack_from(data, offset)
+		start = offset + GAME_HEADER.size
+		end = start + fields[-1] + 2 * fields[-2]
+		if end > len(data):
+			return
+		yield fields, start, end
+		offset = end
+
+
+class ReplayWriter():
+
+	def __init__(self, path: str, append: bool = False):
+		""" Open the log, appending to its games when resuming an interrupted run and truncating it otherwise """
+		if append and os.path.isfile(path) and os.path.getsize(path):
+			with open(path, "rb") as file:
+				data = file.read()
+			checkHeader(data, path)
+			self.__file = open(path, "r+b")
+			# Drop a game torn by the interrupted run, which would hide every game appended after it
+			end = FILE_HEADER.size
+			for _, _, end in gameSpans(data):
+				pass
+			self.__file.truncate(end)
+			self.__file.seek(end)
+		else:
+			self.__file = open(path, "wb")
+			self.__file.write(FILE_HEADER.pack(MAGIC, VERSION, 0))
+
+
+	def add(self, name: str, rows: int, cols: int, totalMines: int, floodFill: bool, score: int,
+			actions: bytes) -> None:
+		""" Append one game; actions are the uint16 codes from World.getActionLog() """
+		encoded = name.encode("utf-8")
+		self.__file.write(GAME_HEADER.pack(rows, cols, totalMines, FLOOD_FILL if floodFill else 0, score,
+										   len(actions) // 2, len(encoded)))
+		self.__file.write(encoded)
+		self.__file.write(actions)
+		self.__file.flush()
+
+
+	def close(self) -> None:
+		self.__file.close()
+
+
+	def __enter__(self) -> "ReplayWriter":
+		return self
+
+
+	def __exit__(self, *exc) -> None:
+		self.close()
+
+
+def readGames(path: str) -> "iterator of Games":
+	""" Every complete game of a log, in order """
+	with open(path, "rb") as file:
+		data = file.read()
+	checkHeader(data, path)
+	for (rows, cols, totalMines, options, score, count, nameLength), start, end in gameSpans(data):
+		name = data[start:start + nameLength].decode("utf-8")
+		actions = array.array("H")
+		actions.frombytes(data[start + nameLength:end])
+		if sys.byteorder != "little":
+			actions.byteswap()
+		yield Game(name, rows, cols, totalMines, bool(options & FLOOD_FILL), score, actions)
+
+
+def replay(game: Game, mines: "bytes-like", startX: int, startY: int) -> "tuple":
+	""" Re-score a game from its actions alone, returning (score, error); error is None if the replay is clean """
+	rows = game.rows
+	cols = game.cols
+	size = rows * cols
+	covered = bytearray(b"\x01") * size
+	flags = bytearray(size)
+	flagsLeft = game.totalMines
+	floodFill = game.floodFill
+	neighbours = flatNeighbourTable(cols, rows) if floodFill else None
+	numbers = None
+	if floodFill:
+		numbers = [sum(mines[n] for n in neighbours[i]) for i in range(size)]
+	uncovered = 0
+	over = False
+	error = None
+
+	def uncover(i):
+		covered[i] = 0
+		found = 0 if mines[i] else 1
+		if floodFill and numbers[i] == 0:
+			stack = [i]
+			while stack:
+				for n in neighbours[stack.pop()]:
+					if covered[n] and not flags[n]:
+						covered[n] = 0
+						found += 1
+						if numbers[n] == 0:
+							stack.append(n)
+		return found
+
+	uncovered += uncover(startX * rows + startY)
+	# World ends a game once it has made more than size * 2 moves
+	movesLimit = size * 2
+	for number, code in enumerate(game.actions):
+		if over:
+			error = "{} actions after the game ended".format(len(game.actions) - number)
+			break
+		over = number + 1 > movesLimit
+		move = code >> MOVE_SHIFT
+		i = code & (MAX_TILES - 1)
+		if move != LEAVE and i >= size:
+			error = "action {} is off the board".format(number + 1)
+			break
+		if move == LEAVE:
+			over = True
+		elif move == UNCOVER:
+			if mines[i]:
+				over = True
+			elif covered[i]:
+				uncovered += uncover(i)
+		elif move == FLAG:
+			if covered[i] and not flags[i] and flagsLeft > 0:
+				flags[i] = 1
+				flagsLeft -= 1
+		elif move == UNFLAG:
+			if covered[i] and flags[i]:
+				flags[i] = 0
+				flagsLeft += 1
+			flagsLeft = min(flagsLeft, 10)
+	if error is None and not over:
+		error = "the game stops before it ended"
+	return worldScore(rows, cols, game.totalMines, uncovered), error
+
+
+class WorldFinder():
+	""" Finds the world a logged game was played on from its name """
+
+	def __init__(self, inputPath: str = None):
+		self.__inputPath = inputPath
+		self.__corpusIndex = None
+		if inputPath and isCorpus(inputPath):
+			corpus = openCorpus(inputPath)
+			self.__corpusIndex = {corpus.record(i).name: i for i in range(len(corpus))}
+
+
+	def find(self, name: str) -> "WorldRecord":
+		""" Record of the named world, None if it can't be found """
+		if name.startswith("stream:"):
+			# stream:RxCxM:seed#index, see WorldStream.streamName
+			try:
+				_, size, rest = name.split(":")
+				rows, cols, mines = [int(x) for x in size.split("x")]
+				seed, index = [int(x) for x in rest.split("#")]
+			except ValueError:
+				return None
+			return streamRecord(StreamSpec(rows, cols, mines, index, seed), index)
+		if self.__corpusIndex is not None:
+			index = self.__corpusIndex.get(name)
+			return None if index is None else openCorpus(self.__inputPath).record(index)
+		for path in (name, os.path.join(self.__inputPath or "", name)):
+			if os.path.isfile(path):
+				return readTextWorld(path)
+		return None
+
+
+def verify(logPath: str, inputPath: str = None) -> "tuple":
+	""" Replay every game of a log, returning (games, list of (name, problem)) """
+	finder = WorldFinder(inputPath)
+	games = 0
+	problems = []
+	for game in readGames(logPath):
+		games += 1
+		record = finder.find(game.name)
+		if record is None:
+			problems.append((game.name, "world not found"))
+			continue
+		if (record.rows, record.cols, record.totalMines) != (game.rows, game.cols, game.totalMines):
+			problems.append((game.name, "world does not match the logged dimensions"))
+			continue
+		score, error = replay(game, record.mines, record.startX, record.startY)
+		if score != game.score:
+			problems.append((game.name, "replay scores {}, log says {}".format(score, game.score)))
+		elif error:
+			problems.append((game.name, error))
+	return games, problems
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Re-score replay logs without running any agent", prog="ReplayLog.py")
+	parser.add_argument("log", help="replay log written with Main.py -p")
+	parser.add_argument("-f", help="directory of world files or packed corpus the games were played on")
+	args = parser.parse_args()
+
+	start = time.perf_counter()
+	try:
+		games, problems = verify(args.log, args.f)
+	except (OSError, ValueError) as e:
+		print("ERROR: " + str(e))
+		sys.exit(1)
+	for name, problem in problems:
+		print("DIVERGED: " + name + ": " + problem)
+	print("Replayed {} games in {:.2f}s, {} diverged".format(games, time.perf_counter() - start, len(problems)))
+	sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+	main()
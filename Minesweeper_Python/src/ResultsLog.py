@@ -0,0 +1,60 @@
+# Per-world results as JSON Lines: one object per finished world, written
+# and flushed as soon as the world is done, so a run that dies partway
+# still leaves the results of every world it finished.
+#
+# Records are handed to a background thread through a bounded queue; the
+# loop collecting results from the workers only waits if the thread falls
+# more than QUEUE_SIZE records behind.
+
+import json
+import threading
+from queue import Queue
+from Checkpoint import hasTornLine
+
+QUEUE_SIZE = 1024
+# Fields of a runWorld result written for each world, in this order
+FIELDS = ("world", "rows", "cols", "mines", "won", "score", "moves", "guesses", "seconds")
+
+
+class ResultsLog():
+
+	def __init__(self, path: str, append: bool = False):
+		""" Open the log, appending to its records when resuming an interrupted run and truncating it otherwise """
+		self.__file = open(path, "a" if append else "w")
+		# Terminate a line torn by an interrupted run so the next record starts on its own line
+		if append and hasTornLine(path):
+			self.__file.write("\n")
+		self.__queue = Queue(maxsize=QUEUE_SIZE)
+		self.__thread = threading.Thread(target=self.__writeLoop, daemon=True)
+		self.__thread.start()
+
+
+	def write(self, result: dict) -> None:
+		""" Queue the record of one finished world """
+		self.__queue.put({field: result.get(field) for field in FIELDS})
+
+
+	def close(self) -> None:
+		""" Write every queued record and close the file """
+		self.__queue.put(None)
+		self.__thread.join()
+		self.__file.close()
+
+
+	def __enter__(self) -> "ResultsLog":
+		return self
+
+
+	def __exit__(self, *exc) -> None:
+		self.close()
+
+
+	def __writeLoop(self) -> None:
+		while True:
+			record = self.__queue.get()
+			if record is None:
+				return
+			self.__file.write(json.dumps(record) + "\n")
+			# Only flush once the queue is drained, so bursts cost one flush
+			if self.__queue.empty():
+				self.__file.flush()
@@ -0,0 +1,29 @@
+# Scores of the tournament: a world is worth points only if every safe
+# tile was uncovered, and how many depends on the board size. World,
+# BatchWorld, ReplayLog and Evaluation all score through this module so
+# that they can't disagree.
+
+# Points of a won world by (rows, cols); any other size is worth 1
+BOARD_VALUES = {(8, 8): 1, (16, 16): 2, (16, 30): 3}
+# Difficulty of a board worth 1, 2 or 3 points
+DIFFICULTY_NAMES = ("Beginner", "Intermediate", "Expert")
+
+
+def boardValue(rows: int, cols: int) -> int:
+	""" Points a won world of this size scores """
+	return BOARD_VALUES.get((rows, cols), 1)
+
+
+def worldScore(rows: int, cols: int, totalMines: int, uncovered: int) -> int:
+	""" Score of a game that uncovered this many safe tiles """
+	if uncovered != rows * cols - totalMines:
+		return 0
+	return boardValue(rows, cols)
+
+
+def difficultyName(rows: int, cols: int) -> str:
+	""" Beginner, Intermediate or Expert for the tournament sizes, RxC for any other """
+	value = BOARD_VALUES.get((rows, cols))
+	if value is None:
+		return "{}x{}".format(rows, cols)
+	return DIFFICULTY_NAMES[value - 1]
@@ -12,30 +12,51 @@
 # ==============================CS-199==================================
 
 import random
+import sys
+from array import array
+try:
+	import numpy
+except ImportError:
+	numpy = None
 from ManualAI import ManualAI
 from RandomAI import RandomAI
 from MyAI import MyAI
+from BitboardAI import BitboardAI
 from AI import AI
+from Neighbours import flatNeighbourTable
+from ReplayLog import MAX_TILES, actionCode
+from Scoring import worldScore
 
 
 class World():
 
-	# Tile class
-	class __Tile():
-		mine = False
-		covered = True
-		flag = False
-		number = 0
-		
+	# The board is stored as flat byte planes, one byte per tile, with the
+	# tile at column c and row r found at index c * rowDimension + r:
+	#	__mines		1 if the tile holds a mine
+	#	__covered	1 while the tile is covered
+	#	__flags		1 if the tile is flagged
+	#	__numbers	hint number of the tile
+
+	# Boards with at least this many tiles are built with NumPy when it is
+	# installed; below it the per-call overhead outweighs the plain loops
+	VECTORIZE_MIN_TILES = 256
 
-	def __init__(self, filename=None, aiType="myai", verbose=False, debug=False):
+	def __init__(self, filename=None, aiType="myai", verbose=False, debug=False, headless=False, floodFill=False,
+				 batchActions=False, record=None, collectStats=False, recordActions=False):
 		self.__verbose = verbose
 		self.__debug = debug
+		self.__headless = headless and not debug
+		self.__floodFill = False
+		self.__batchActions = batchActions
+		self.__pendingReveals = []
 
 		self.__colDimension = 0
 		self.__rowDimension = 0
 		self.__score = 0
-		self.__board = None
+		self.__mines = None
+		self.__covered = None
+		self.__flags = None
+		self.__numbers = None
 		self.__totalMines = 0
 		self.__flagsLeft = 0
 		self.__coveredTiles = 0
@@ -59,7 +80,21 @@ class World():
 					self.__uncoverTile(firstMoveCoords[0], firstMoveCoords[1])
 					self.__lastTile = (firstMoveCoords[0]+1, firstMoveCoords[1]+1)
 					self.__lastAction = "UNCOVER"
-					
+
+		# If a record is provided (e.g. from a packed corpus), construct board from it
+			elif record != None:
+				self.__createBoardFromRecord(record)
+				firstMoveCoords = (record.startX, record.startY)
+				if not self.__isInBounds(firstMoveCoords[0], firstMoveCoords[1]):
+					raise ValueError('First move coordinates are invalid')
+				self.__addNumbers()
+				self.__coveredTiles = self.__colDimension * self.__rowDimension
+				self.__flagsLeft = self.__totalMines
+				self.__uncoverTile(firstMoveCoords[0], firstMoveCoords[1])
+				self.__lastTile = (firstMoveCoords[0]+1, firstMoveCoords[1]+1)
+				self.__lastAction = "UNCOVER"
+				filename = record.name
+
 		# If file not provided, construct board using defaults
 			else:
 				self.__createBoard()
@@ -81,13 +116,92 @@ class World():
 			self.__ai = RandomAI(self.__rowDimension, self.__colDimension, self.__totalMines, firstMoveCoords[0], firstMoveCoords[1])
 		elif aiType == "myai":
 			self.__ai = MyAI(self.__rowDimension, self.__colDimension, self.__totalMines, firstMoveCoords[0], firstMoveCoords[1])
-
+		elif aiType == "bitboard":
+			self.__ai = BitboardAI(self.__rowDimension, self.__colDimension, self.__totalMines, firstMoveCoords[0], firstMoveCoords[1])
+		elif isinstance(aiType, type):
+			# Any agent class taking MyAI's constructor arguments, e.g. an older MyAI to compare against
+			self.__ai = aiType(self.__rowDimension, self.__colDimension, self.__totalMines, firstMoveCoords[0], firstMoveCoords[1])
+		elif aiType == None:
+			# The agent is driven from outside, through getPercept() and step() (see Referee.py)
+			self.__ai = None
+
+		if collectStats and hasattr(self.__ai, "enableStats"):
+			self.__ai.enableStats()
+
+		# Zero regions are only flood-filled for agents that can take the revealed tiles as a batch
+		if floodFill and hasattr(self.__ai, "revealBatch"):
+			self.__floodFill = True
+			start = firstMoveCoords[0] * self.__rowDimension + firstMoveCoords[1]
+			if self.__numbers[start] == 0:
+				self.__floodFrom(start)
+
+		# Every applied action as a uint16 code for a replay log (see ReplayLog.py)
+		self.__actionLog = None
+		if recordActions:
+			if self.__colDimension * self.__rowDimension > MAX_TILES:
+				raise ValueError("Boards of more than " + str(MAX_TILES) + " tiles can't be logged for replay")
+			self.__actionLog = array("H")
+
+		self.__name = filename
 		if (self.__verbose and filename):
 			print("Running on world: " + filename)
 
 
+	def getName(self) -> str:
+		""" File name or record name of the world, None for the default random world """
+		return self.__name
+
+
+	def getRowDimension(self) -> int:
+		return self.__rowDimension
+
+
+	def getColDimension(self) -> int:
+		return self.__colDimension
+
+
+	def getTotalMines(self) -> int:
+		return self.__totalMines
+
+
+	def getMovesMade(self) -> int:
+		return self.__movesMade
+
+
+	def getGuesses(self) -> int:
+		""" Number of guesses the agent made, None for agents that don't count them """
+		return getattr(self.__ai, "guesses", None)
+
+
+	def getFloodFill(self) -> bool:
+		""" True if zero regions are flood-filled in this game """
+		return self.__floodFill
+
+
+	def getActionLog(self) -> bytes:
+		""" Applied actions as little-endian uint16 codes, None unless recordActions was set """
+		if self.__actionLog is None:
+			return None
+		log = array("H", self.__actionLog)
+		if sys.byteorder != "little":
+			log.byteswap()
+		return log.tobytes()
+
+
+	def getAgentStats(self) -> dict:
+		""" Per-phase stats of the agent for this game, None unless collectStats was set and supported """
+		if hasattr(self.__ai, "getStats"):
+			return self.__ai.getStats()
+		return None
+
+
 	def run(self) -> int:
 		""" Engine of the game """
+		if self.__headless and type(self.__ai) != ManualAI:
+			if self.__batchActions and hasattr(self.__ai, "getActionBatch"):
+				return self.__runBatched()
+			return self.__runHeadless()
+
 		while (True):
 			if type(self.__ai) == ManualAI or self.__debug:
 				self.__printWorld()
@@ -95,8 +209,12 @@ class World():
 				break;
 
 			try: 
+				if self.__pendingReveals:
+					self.__deliverReveals()
 				action = self.__ai.getAction(self.__perceptNumber)
 				if self.__checkValidAction(action):
+					if self.__actionLog is not None:
+						self.__logAction(action)
 					if self.__doMove(action):
 						break
 			except ValueError:
@@ -106,22 +224,144 @@ class World():
 
 			if self.__debug and type(self.__ai) != ManualAI:
 				input("Press ENTER to continue...")
-		self.__handleGameover()
+		result = self.__handleGameover()
 		self.__uncoverAll()
 		if type(self.__ai) == ManualAI or self.__debug:
 			self.__printWorld()
+		return result
 
-		if self.__score == (self.__colDimension * self.__rowDimension) - self.__totalMines:
-			if self.__rowDimension == 8 and self.__colDimension == 8:
-				return 1
-			elif self.__rowDimension == 16 and self.__colDimension == 16:
-				return 2
-			elif self.__rowDimension == 16 and self.__colDimension == 30:
-				return 3
-			else:
-				return 1
-		else:
-			return 0
+
+	def getPercept(self) -> int:
+		""" Number the agent perceives after its last action, for agents driven through step() """
+		return self.__perceptNumber
+
+
+	def step(self, actionObj: "Action Object") -> bool:
+		""" Apply one action of an agent driven from outside run(), returning True once the game is over """
+		""" Invalid actions are skipped without counting as a move, exactly like run() """
+		if self.__movesMade > self.__movesLimit:
+			return True
+		try:
+			if not self.__checkValidAction(actionObj):
+				return False
+		except (ValueError, IndexError):
+			return False
+		if self.__actionLog is not None:
+			self.__logAction(actionObj)
+		return self.__doMove(actionObj) or self.__movesMade > self.__movesLimit
+
+
+	def getScore(self) -> int:
+		""" Score of the game so far, as run() would return it """
+		return self.__handleGameover()
+
+
+	def __runHeadless(self) -> int:
+		""" Engine of the game for batch runs: no display, no exceptions, O(1) gameover """
+		""" Invalid actions are skipped without counting as a move, exactly like run() """
+		ai = self.__ai
+		mines = self.__mines
+		cols = self.__colDimension
+		rows = self.__rowDimension
+		movesLimit = self.__movesLimit
+		UNCOVER = AI.Action.UNCOVER
+		FLAG = AI.Action.FLAG
+		UNFLAG = AI.Action.UNFLAG
+		LEAVE = AI.Action.LEAVE
+		actionLog = self.__actionLog
+
+		while self.__movesMade <= movesLimit:
+			if self.__pendingReveals:
+				self.__deliverReveals()
+			action = ai.getAction(self.__perceptNumber)
+			move = action.getMove()
+			X = action.getX()
+			Y = action.getY()
+			if not (0 <= X < cols and 0 <= Y < rows):
+				continue
+			if actionLog is not None and isinstance(move, AI.Action):
+				actionLog.append(actionCode(move, X, Y, rows))
+			if move is UNCOVER:
+				self.__movesMade += 1
+				if mines[X * rows + Y]:
+					break
+				self.__uncoverTile(X, Y)
+			elif move is FLAG:
+				self.__movesMade += 1
+				self.__flagTile(X, Y)
+			elif move is UNFLAG:
+				self.__movesMade += 1
+				self.__unflagTile(X, Y)
+			elif move is LEAVE:
+				self.__movesMade += 1
+				break
+		return self.__handleGameover()
+
+
+	def __runBatched(self) -> int:
+		""" Headless engine for agents that hand over a list of actions per call """
+		""" The actions are applied in order and the agent gets one percept per action on its next """
+		""" call; a skipped invalid action gets None, and the rest of a batch is dropped at gameover """
+		""" With flood fill, uncovering a tile an earlier action of the batch already revealed is skipped the same way """
+		ai = self.__ai
+		mines = self.__mines
+		covered = self.__covered
+		cols = self.__colDimension
+		rows = self.__rowDimension
+		movesLimit = self.__movesLimit
+		UNCOVER = AI.Action.UNCOVER
+		FLAG = AI.Action.FLAG
+		UNFLAG = AI.Action.UNFLAG
+		LEAVE = AI.Action.LEAVE
+		actionLog = self.__actionLog
+
+		percepts = [self.__perceptNumber]
+		while self.__movesMade <= movesLimit:
+			if self.__pendingReveals:
+				self.__deliverReveals()
+			actions = ai.getActionBatch(percepts)
+			percepts = []
+			# Tiles flood-filled by this batch so far, built from the reveals still pending for the agent
+			flooded = set()
+			floodedSeen = 0
+			for action in actions:
+				if self.__movesMade > movesLimit:
+					return self.__handleGameover()
+				move = action.getMove()
+				X = action.getX()
+				Y = action.getY()
+				if not (0 <= X < cols and 0 <= Y < rows):
+					percepts.append(None)
+					continue
+				if move is UNCOVER and not covered[X * rows + Y] and self.__pendingReveals:
+					reveals = self.__pendingReveals
+					if len(reveals) > floodedSeen:
+						flooded.update(x * rows + y for x, y, _ in reveals[floodedSeen:])
+						floodedSeen = len(reveals)
+					if X * rows + Y in flooded:
+						percepts.append(None)
+						continue
+				if actionLog is not None and isinstance(move, AI.Action):
+					actionLog.append(actionCode(move, X, Y, rows))
+				if move is UNCOVER:
+					self.__movesMade += 1
+					if mines[X * rows + Y]:
+						return self.__handleGameover()
+					self.__uncoverTile(X, Y)
+				elif move is FLAG:
+					self.__movesMade += 1
+					self.__flagTile(X, Y)
+				elif move is UNFLAG:
+					self.__movesMade += 1
+					self.__unflagTile(X, Y)
+				elif move is LEAVE:
+					self.__movesMade += 1
+					return self.__handleGameover()
+				else:
+					percepts.append(None)
+					continue
+				percepts.append(self.__perceptNumber)
+		return self.__handleGameover()
 
 
 	###############################################
@@ -139,6 +379,11 @@ class World():
 		raise ValueError
 
 
+	def __logAction(self, actionObj: "Action Object") -> None:
+		""" Append a valid action to the replay log """
+		self.__actionLog.append(actionCode(actionObj.getMove(), actionObj.getX(), actionObj.getY(), self.__rowDimension))
+
+
 	def __doMove(self, actionObj: "Action Object") -> bool:
 		""" Perform a move on the game board based on given action and x, y coords """
 		""" Return True when game is over, False otherwise """
@@ -164,7 +409,7 @@ class World():
 			return True 							# Agent decides to leave game
 		# UNCOVER
 		elif move == AI.Action.UNCOVER:
-			if self.__board[X][Y].mine:
+			if self.__mines[X * self.__rowDimension + Y]:
 				if type(self.__ai) == ManualAI or self.__debug:
 					print("Gameover! Uncovered a mine! " + str(X+1), str(Y+1))
 				return True 						# Agent uncovered a mine
@@ -191,16 +436,34 @@ class World():
 		""" Creates 2D tile array from first line of file and instantiates board instance variable """
 		if inputStream:
 			self.__rowDimension, self.__colDimension = [int(x) for x in inputStream.readline().split()]
-			self.__board = [[self.__Tile() for i in range(self.__rowDimension)] for j in range(self.__colDimension)]
 		else:
 			self.__colDimension = 8		# Default sizes
 			self.__rowDimension = 8		# Default size
 
-			self.__board = [[self.__Tile() for i in range(self.__rowDimension)] for j in range(self.__colDimension)]
-		
+		size = self.__colDimension * self.__rowDimension
+		self.__mines = bytearray(size)
+		self.__covered = bytearray(b"\x01") * size
+		self.__flags = bytearray(size)
+		self.__numbers = bytearray(size)
+
 		self.__movesLimit = self.__colDimension * self.__rowDimension * 2
 
 
+	def __createBoardFromRecord(self, record: "WorldRecord") -> None:
+		""" Instantiates the board and its mines from an already parsed world record """
+		self.__rowDimension = record.rows
+		self.__colDimension = record.cols
+		size = self.__colDimension * self.__rowDimension
+		if len(record.mines) != size:
+			raise ValueError('Mine grid does not match the board dimensions')
+		self.__mines = bytearray(record.mines)
+		self.__covered = bytearray(b"\x01") * size
+		self.__flags = bytearray(size)
+		self.__numbers = bytearray(size)
+		self.__totalMines = record.totalMines
+		self.__movesLimit = size * 2
+
+
 	def __getFirstMove(self, inputStream: "filePointer" = None) -> "tuple of ints": 
 		""" Find the first move to be given to the agent, must be a "0" tile """
 		if inputStream:
@@ -210,7 +473,7 @@ class World():
 		else:
 			startX = self.__randomInt(self.__colDimension)
 			startY = self.__randomInt(self.__rowDimension)
-			while (self.__board[startX][startY].number != 0 or self.__board[startX][startY].mine):
+			while (self.__numbers[startX * self.__rowDimension + startY] != 0 or self.__mines[startX * self.__rowDimension + startY]):
 				startX = self.__randomInt(self.__colDimension)
 				startY = self.__randomInt(self.__rowDimension)
 		return (startX, startY)
@@ -219,7 +482,10 @@ class World():
 	def __addMines(self, inputStream: "filePointer" = None) -> None:
 		""" Add mines to the game board""" 
 		if inputStream:
-			for r, line in zip(range(self.__rowDimension - 1, -1, -1), inputStream.readlines()):
+			lines = inputStream.readlines()
+			if self.__useNumpy() and self.__addMinesVectorized(lines):
+				return
+			for r, line in zip(range(self.__rowDimension - 1, -1, -1), lines):
 				for c, tile in zip(range(self.__colDimension), line.split()):
 					if tile == "1":
 						self.__addMine(c, r)
@@ -228,58 +494,115 @@ class World():
 			while currentMines < 10:	# Default number of mines is 10
 				r = self.__randomInt(self.__rowDimension)
 				c = self.__randomInt(self.__colDimension)
-				if not self.__board[c][r].mine:
+				if not self.__mines[c * self.__rowDimension + r]:
 					self.__addMine(c, r)
 					currentMines += 1
 
 					
+	def __addMinesVectorized(self, lines: "list of strings") -> bool:
+		""" Parse the whole mine grid in one go, returning False if it is not a plain 0/1 grid """
+		rows = self.__rowDimension
+		cols = self.__colDimension
+		tokens = "".join(lines[:rows]).split()
+		cells = "".join(tokens)
+		if len(tokens) != rows * cols or len(cells) != rows * cols:
+			return False
+		grid = numpy.frombuffer(cells.encode(), dtype=numpy.uint8).reshape(rows, cols) == ord("1")
+		# File rows run from the top row down; the planes are indexed [c][r]
+		mines = numpy.ascontiguousarray(grid[::-1].T, dtype=numpy.uint8)
+		self.__mines = bytearray(mines.tobytes())
+		self.__totalMines += int(mines.sum())
+		return True
+
+
 	def __addMine(self, c: int, r: int) -> None:
-		""" Add mine to tile located at (c, r) and update the Tile.mine attrbute """
-		self.__board[c][r].mine = True
+		""" Add mine to tile located at (c, r) and update the mine plane """
+		self.__mines[c * self.__rowDimension + r] = 1
 		self.__totalMines += 1		
 
 
 	def __addNumbers(self) -> None:
 		""" Iterate the board and add hint numbers for each mine """
-		for r in range(self.__rowDimension):
-			for c in range(self.__colDimension):
-				if self.__board[c][r].mine:
-					self.__addHintNumber(c, r+1)
-					self.__addHintNumber(c, r-1)
-					self.__addHintNumber(c+1, r)
-					self.__addHintNumber(c-1, r)
-					self.__addHintNumber(c-1, r+1)
-					self.__addHintNumber(c+1, r+1)
-					self.__addHintNumber(c-1, r-1)
-					self.__addHintNumber(c+1, r-1)
-
-
-	def __addHintNumber(self, c: int, r: int) -> None:
-		""" Increment the hint number of a tile """
-		if self.__isInBounds(c, r):
-			self.__board[c][r].number += 1
+		if self.__useNumpy():
+			self.__addNumbersVectorized()
+			return
+		neighbours = flatNeighbourTable(self.__colDimension, self.__rowDimension)
+		numbers = self.__numbers
+		for i, mine in enumerate(self.__mines):
+			if mine:
+				for n in neighbours[i]:
+					numbers[n] += 1
+
+
+	def __addNumbersVectorized(self) -> None:
+		""" Compute every hint number at once as a 3x3 neighbourhood sum of the mine plane """
+		rows = self.__rowDimension
+		cols = self.__colDimension
+		mines = numpy.frombuffer(bytes(self.__mines), dtype=numpy.uint8).reshape(cols, rows)
+		padded = numpy.pad(mines, 1)
+		numbers = -mines.astype(numpy.int8)
+		for dc in range(3):
+			for dr in range(3):
+				numbers = numbers + padded[dc:dc+cols, dr:dr+rows]
+		self.__numbers = bytearray(numbers.astype(numpy.uint8).tobytes())
 
 
 	def __uncoverTile(self, c: int, r: int) -> None:
-		""" Uncovers a tile """
-		if self.__board[c][r].covered:
-			self.__board[c][r].covered = False
+		""" Uncovers a tile, keeping the count of uncovered safe tiles (the score) up to date """
+		i = c * self.__rowDimension + r
+		if self.__covered[i]:
+			self.__covered[i] = 0
 			self.__coveredTiles -= 1
-		self.__perceptNumber = self.__board[c][r].number
+			if not self.__mines[i]:
+				self.__score += 1
+			if self.__floodFill and self.__numbers[i] == 0:
+				self.__floodFrom(i)
+		self.__perceptNumber = self.__numbers[i]
+
+
+	def __floodFrom(self, start: int) -> None:
+		""" Uncover the whole zero region around an uncovered 0 tile and its numbered border """
+		""" The tiles revealed besides the start tile are queued for the agent as (x, y, number) """
+		""" Only 0 tiles are expanded and mines are never uncovered, so a numbered start does nothing """
+		rows = self.__rowDimension
+		neighbours = flatNeighbourTable(self.__colDimension, rows)
+		mines = self.__mines
+		covered = self.__covered
+		flags = self.__flags
+		numbers = self.__numbers
+		reveals = self.__pendingReveals
+		if numbers[start] != 0 or mines[start]:
+			return
+		stack = [start]
+		while stack:
+			for n in neighbours[stack.pop()]:
+				if covered[n] and not flags[n] and not mines[n]:
+					covered[n] = 0
+					self.__coveredTiles -= 1
+					self.__score += 1
+					reveals.append((n // rows, n % rows, numbers[n]))
+					if numbers[n] == 0:
+						stack.append(n)
+
+
+	def __deliverReveals(self) -> None:
+		""" Hand the tiles uncovered by flood fill since the last action to the agent """
+		reveals = self.__pendingReveals
+		self.__pendingReveals = []
+		self.__ai.revealBatch(reveals)
 
 
 	def __uncoverAll(self) -> None:
-		""" Uncovers all tiles """
-		for r in range(self.__rowDimension):
-			for c in range(self.__colDimension):
-				self.__uncoverTile(c, r)
+		""" Uncovers all tiles for the final display, without touching the score """
+		self.__covered = bytearray(len(self.__covered))
 		self.__coveredTiles = 0
 
 
 	def __flagTile(self, c: int, r: int) -> None:
 		""" Flag a tile, coordinates adjusted to fix indexing """
-		if self.__board[c][r].covered and not self.__board[c][r].flag and self.__flagsLeft > 0:
-			self.__board[c][r].flag = True
+		i = c * self.__rowDimension + r
+		if self.__covered[i] and not self.__flags[i] and self.__flagsLeft > 0:
+			self.__flags[i] = 1
 			self.__flagsLeft -= 1
 		if self.__flagsLeft < 0:
 			self.__flagsLeft = 0
@@ -288,21 +611,19 @@ class World():
 
 	def __unflagTile(self, c: int, r: int) -> None:
 		""" Unflag a tile, coordinates adjusted to fix indexing """
-		if self.__board[c][r].covered and self.__board[c][r].flag:
-			self.__board[c][r].flag = False
+		i = c * self.__rowDimension + r
+		if self.__covered[i] and self.__flags[i]:
+			self.__flags[i] = 0
 			self.__flagsLeft += 1
 		if self.__flagsLeft > 10:
 			self.__flagsLeft = 10
 		self.__perceptNumber = -1
 
 
-	def __handleGameover(self) -> None:
-		""" Check game board for completion after AI is done """
-		for r in range(self.__rowDimension):
-			for c in range(self.__colDimension):
-				# If all safe tiles are uncovered
-				if not self.__board[c][r].covered and not self.__board[c][r].mine:
-					self.__score += 1
+	def __handleGameover(self) -> int:
+		""" Check game board for completion after AI is done and return the world's score """
+		""" The score is kept incrementally by __uncoverTile, so this is O(1) """
+		return worldScore(self.__rowDimension, self.__colDimension, self.__totalMines, self.__score)
 
 
 	#############################################
@@ -352,13 +673,14 @@ class World():
 
 	def __printTileInfo(self, c: int, r: int) -> None:
 		""" Checks tile attributes and prints accordingly """
-		if not self.__board[c][r].covered and self.__board[c][r].mine:
+		i = c * self.__rowDimension + r
+		if not self.__covered[i] and self.__mines[i]:
 			print('B ', end=" ")
-		elif not self.__board[c][r].covered:
-			print(str(self.__board[c][r].number) + ' ', end=" ")
-		elif self.__board[c][r].flag:
+		elif not self.__covered[i]:
+			print(str(self.__numbers[i]) + ' ', end=" ")
+		elif self.__flags[i]:
 			print('? ', end=" ")
-		elif self.__board[c][r].covered:
+		elif self.__covered[i]:
 			print('. ', end=" ")
 		
 
@@ -370,6 +692,11 @@ class World():
 		return random.randrange(limit)
 
 
+	def __useNumpy(self) -> bool:
+		""" Returns true if the board should be built with the vectorized NumPy path """
+		return numpy is not None and self.__colDimension * self.__rowDimension >= self.VECTORIZE_MIN_TILES
+
+
 	def __isInBounds(self, c: int, r: int) -> bool:
 		""" Returns true if given coordinates are within the boundaries of the game board """
 		if c < self.__colDimension and c >= 0 and r < self.__rowDimension and r >= 0:
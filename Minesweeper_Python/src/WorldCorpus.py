@@ -0,0 +1,181 @@
+# Packed world corpus: many Minesweeper worlds in one file.
+#
+# Layout (little endian):
+#	header		magic "MSWC", version (uint16), reserved (uint16),
+#				world count (uint32), index offset (uint64)
+#	worlds		one after the other, each a fixed-width header
+#					rows, cols, startX, startY (uint16, 0-based start),
+#					mine count (uint32), name length (uint16)
+#				followed by the name (utf-8) and the mine grid packed
+#				one bit per tile, LSB first, tile (c, r) at bit c*rows + r
+#	index		world count uint64 offsets of the worlds
+#
+# The reader maps the file with mmap and unpacks a world only when it is
+# asked for by index, so running a corpus opens one file per process.
+#
+# Converter:	python3 WorldCorpus.py [InputPath] [OutputFile]
+#				packs a text world file, or every world file under a
+#				directory (in os.walk order), into OutputFile.
+
+import mmap
+import os
+import struct
+import sys
+from collections import namedtuple
+from functools import lru_cache
+
+MAGIC = b"MSWC"
+VERSION = 1
+FILE_HEADER = struct.Struct("<4sHHIQ")
+WORLD_HEADER = struct.Struct("<HHHHIH")
+OFFSET = struct.Struct("<Q")
+
+# A world ready to be handed to World(record=...); mines is a bytearray plane
+# with one byte per tile at index c * rows + r
+WorldRecord = namedtuple("WorldRecord", ["name", "rows", "cols", "startX", "startY", "totalMines", "mines"])
+
+# Byte value -> the 8 tiles it packs, one byte per tile
+__UNPACKED = [bytes((b >> bit) & 1 for bit in range(8)) for b in range(256)]
+# Tile byte -> binary digit ("1" for any mine value)
+__DIGITS = bytes.maketrans(bytes(range(256)), b"0" + b"1" * 255)
+
+
+def isCorpus(path: str) -> bool:
+	""" Returns true if path is a packed corpus file rather than a text world file """
+	try:
+		with open(path, "rb") as file:
+			return file.read(len(MAGIC)) == MAGIC
+	except OSError:
+		return False
+
+
+@lru_cache(maxsize=None)
+def openCorpus(path: str) -> "WorldCorpus":
+	""" Open a corpus once per process and share it between all worlds loaded from it """
+	return WorldCorpus(path)
+
+
+def packMines(mines: "bytes-like") -> bytes:
+	""" Pack a one-byte-per-tile mine plane into bits """
+	# Tile i is bit i of a little-endian integer, so read the plane back to front as a binary number
+	digits = bytes(mines).translate(__DIGITS)[::-1]
+	return int(digits or b"0", 2).to_bytes((len(mines) + 7) // 8, "little")
+
+
+def unpackMines(packed: "bytes-like", size: int) -> bytearray:
+	""" Unpack a bit-packed mine grid into a one-byte-per-tile plane """
+	return bytearray(b"".join([__UNPACKED[b] for b in packed]))[:size]
+
+
+def readTextWorld(path: str, name: str = None) -> WorldRecord:
+	""" Parse a text world file (the format written by WorldGenerator) into a record """
+	with open(path, "r") as file:
+		rows, cols = [int(x) for x in file.readline().split()]
+		startX, startY = [int(x) - 1 for x in file.readline().split()]
+		mines = bytearray(rows * cols)
+		for r, line in zip(range(rows - 1, -1, -1), file.readlines()):
+			for c, tile in zip(range(cols), line.split()):
+				if tile == "1":
+					mines[c * rows + r] = 1
+	return WorldRecord(name or path, rows, cols, startX, startY, sum(mines), mines)
+
+
+class WorldCorpus():
+
+	def __init__(self, path: str):
+		self.__path = path
+		self.__file = open(path, "rb")
+		self.__map = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+		magic, version, _, self.__count, self.__indexOffset = FILE_HEADER.unpack_from(self.__map, 0)
+		if magic != MAGIC or version != VERSION:
+			raise ValueError("Not a version " + str(VERSION) + " world corpus: " + path)
+
+
+	def __len__(self) -> int:
+		return self.__count
+
+
+	def getPath(self) -> str:
+		""" Allow private variable path to be publicly accessible """
+		return self.__path
+
+
+	def record(self, index: int) -> WorldRecord:
+		""" Load the world at index without reading any other world """
+		if not 0 <= index < self.__count:
+			raise IndexError("World index out of range: " + str(index))
+		offset = OFFSET.unpack_from(self.__map, self.__indexOffset + index * OFFSET.size)[0]
+		rows, cols, startX, startY, totalMines, nameLength = WORLD_HEADER.unpack_from(self.__map, offset)
+		offset += WORLD_HEADER.size
+		name = self.__map[offset:offset + nameLength].decode("utf-8")
+		offset += nameLength
+		packed = self.__map[offset:offset + (rows * cols + 7) // 8]
+		return WorldRecord(name, rows, cols, startX, startY, totalMines, unpackMines(packed, rows * cols))
+
+
+	def close(self) -> None:
+		self.__map.close()
+		self.__file.close()
+
+
+class CorpusWriter():
+
+	def __init__(self, path: str):
+		self.__file = open(path, "wb")
+		self.__offsets = []
+		self.__file.write(FILE_HEADER.pack(MAGIC, VERSION, 0, 0, 0))
+
+
+	def add(self, record: WorldRecord) -> None:
+		""" Append one world to the corpus """
+		name = record.name.encode("utf-8")
+		self.__offsets.append(self.__file.tell())
+		self.__file.write(WORLD_HEADER.pack(record.rows, record.cols, record.startX, record.startY,
+											record.totalMines, len(name)))
+		self.__file.write(name)
+		self.__file.write(packMines(record.mines))
+
+
+	def close(self) -> None:
+		""" Write the offset index and the final header """
+		indexOffset = self.__file.tell()
+		self.__file.write(b"".join(OFFSET.pack(offset) for offset in self.__offsets))
+		self.__file.seek(0)
+		self.__file.write(FILE_HEADER.pack(MAGIC, VERSION, 0, len(self.__offsets), indexOffset))
+		self.__file.close()
+
+
+	def __enter__(self) -> "CorpusWriter":
+		return self
+
+
+	def __exit__(self, *exc) -> None:
+		self.close()
+
+
+def convert(inputPath: str, outputFile: str) -> int:
+	""" Pack a text world file or a directory of them into a corpus, returning the world count """
+	if os.path.isdir(inputPath):
+		paths = []
+		for dirpath, _, filenames in os.walk(inputPath):
+			for filename in filenames:
+				paths.append(os.path.join(dirpath, filename))
+	else:
+		paths = [inputPath]
+
+	with CorpusWriter(outputFile) as writer:
+		for path in paths:
+			writer.add(readTextWorld(path, os.path.relpath(path, inputPath) if path != inputPath else path))
+	return len(paths)
+
+
+def main():
+	if len(sys.argv) != 3:
+		print("Usage: python3 WorldCorpus.py [InputPath] [OutputFile]")
+		return
+	count = convert(sys.argv[1], sys.argv[2])
+	print("Packed " + str(count) + " worlds into " + sys.argv[2])
+
+
+if __name__ == "__main__":
+	main()
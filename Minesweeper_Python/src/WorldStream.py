@@ -0,0 +1,109 @@
+# Seeded in-memory world streams: worlds are generated on demand and handed
+# straight to World(record=...), without touching the disk.
+#
+# World number i (1-based) of a stream comes from its own RNG seeded with
+# (seed, i) and is placed by createWorld, which WorldGenerator.py uses as
+# well, so a stream and "WorldGenerator.py ... --seed SEED" describe the
+# very same worlds. Any world of a stream can be rebuilt on its own, in any
+# process.
+
+import os
+import random
+from collections import namedtuple
+from WorldCorpus import WorldRecord, isCorpus, openCorpus, readTextWorld
+
+StreamSpec = namedtuple("StreamSpec", ["rows", "cols", "mines", "count", "seed"])
+
+
+def worldSeed(baseSeed: int, index: int) -> int:
+	""" Seed of the RNG for world number index of a run with the given base seed """
+	return baseSeed * 1000003 + index
+
+
+def createWorld(rows: int, cols: int, mines: int, rng: "random.Random" = random) -> "tuple":
+	""" Randomly place the starting tile and the mines, returning (startX, startY, mineIndices) """
+	""" startX and startY are 1-based, as written to world files; mine (x, y) has index (x-1)*rows + (y-1) """
+	startX = rng.randrange(1, cols+1)
+	startY = rng.randrange(1, rows+1)
+	# The starting tile and its surrounding tiles can't hold a mine: sample among the other tiles by rank
+	# and shift each rank past the patch tiles below it, so a world costs O(mines) whatever the board size
+	startingPatch = sorted((x-1) * rows + (y-1)
+						   for x in range(startX-1, startX+2) for y in range(startY-1, startY+2)
+						   if 1 <= x <= cols and 1 <= y <= rows)
+	mineIndices = rng.sample(range(rows * cols - len(startingPatch)), mines)
+	for k, i in enumerate(mineIndices):
+		for tile in startingPatch:
+			if tile <= i:
+				i += 1
+		mineIndices[k] = i
+	return startX, startY, mineIndices
+
+
+def checkSpec(spec: StreamSpec) -> None:
+	""" Raise ValueError for streams WorldGenerator would refuse to generate """
+	if spec.rows < 4 or spec.cols < 4 or spec.mines < 1 or spec.mines > spec.rows * spec.cols - 9 or spec.count < 0:
+		raise ValueError("rows >= 4, cols >= 4, 1 <= mines <= (rows*cols - 9), count >= 0")
+
+
+def streamSpec(values: "list of ints") -> StreamSpec:
+	""" StreamSpec of the five -g values, raising ValueError with the message to print if it is invalid """
+	spec = StreamSpec(*values)
+	try:
+		checkSpec(spec)
+	except ValueError as e:
+		raise ValueError("Invalid world stream! \n\t" + str(e))
+	return spec
+
+
+def addWorldArguments(parser: "argparse.ArgumentParser") -> None:
+	""" Add the -f and -g options of a tool that plays a world file, directory, corpus or stream """
+	parser.add_argument("-f", help="world file, directory of world files or packed corpus")
+	parser.add_argument("-g", help="seeded in-memory stream of worlds", nargs=5, type=int,
+						metavar=("ROWS", "COLS", "MINES", "COUNT", "SEED"))
+
+
+def worldSource(args: "argparse.Namespace") -> StreamSpec:
+	""" StreamSpec of -g, None to play -f; raise ValueError with the message to print if neither is usable """
+	if args.g:
+		return streamSpec(args.g)
+	if not args.f or not os.path.exists(args.f):
+		raise ValueError("-f needs an existing world file, directory or corpus, or use -g!")
+	return None
+
+
+def streamName(spec: StreamSpec, index: int) -> str:
+	""" Name of world number index (1-based) of the stream """
+	return "stream:{}x{}x{}:{}#{}".format(spec.rows, spec.cols, spec.mines, spec.seed, index)
+
+
+def streamRecord(spec: StreamSpec, index: int) -> WorldRecord:
+	""" Build world number index (1-based) of the stream """
+	rows = spec.rows
+	cols = spec.cols
+	startX, startY, mineIndices = createWorld(rows, cols, spec.mines, random.Random(worldSeed(spec.seed, index)))
+	mines = bytearray(rows * cols)
+	for i in mineIndices:
+		mines[i] = 1
+	return WorldRecord(streamName(spec, index), rows, cols, startX-1, startY-1, spec.mines, mines)
+
+
+def streamWorlds(spec: StreamSpec) -> "iterator of WorldRecords":
+	""" Lazily yield every world of the stream in order """
+	for index in range(1, spec.count+1):
+		yield streamRecord(spec, index)
+
+
+def worldRecords(inputPath: str = None, spec: StreamSpec = None) -> "iterator of WorldRecords":
+	""" Worlds of a stream, a packed corpus, a directory of world files or a single world file """
+	if spec:
+		yield from streamWorlds(spec)
+	elif isCorpus(inputPath):
+		corpus = openCorpus(inputPath)
+		for index in range(len(corpus)):
+			yield corpus.record(index)
+	elif os.path.isdir(inputPath):
+		for dirpath, _, filenames in os.walk(inputPath):
+			for filename in filenames:
+				yield readTextWorld(os.path.join(dirpath, filename))
+	else:
+		yield readTextWorld(inputPath)
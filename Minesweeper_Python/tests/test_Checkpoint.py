@@ -0,0 +1,49 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+sys.path.insert(0, SOURCE)
+
+from Checkpoint import loadJournal
+
+
+def runMain(*args):
+	""" stdout of Main.py run on a seeded stream of six beginner worlds """
+	command = [sys.executable, os.path.join(SOURCE, "Main.py"), "-g", "8", "8", "10", "6", "1"] + list(args)
+	return subprocess.run(command, check=True, capture_output=True, text=True).stdout
+
+
+class ResumeTest(unittest.TestCase):
+
+	def testResumeAfterTornLine(self):
+		with tempfile.TemporaryDirectory() as directory:
+			journal = os.path.join(directory, "journal")
+			log = os.path.join(directory, "log")
+			complete = runMain("-c", journal)
+			scores = loadJournal(journal)
+			self.assertEqual(len(scores), 6)
+
+			# Cut the last entry in half, as an interrupted run would
+			with open(journal, "rb") as file:
+				lines = file.read().splitlines(keepends=True)
+			torn = json.loads(lines[-1])["task"]
+			with open(journal, "wb") as file:
+				file.write(b"".join(lines[:-1]) + lines[-1][:len(lines[-1]) // 2])
+
+			resumed = runMain("-c", journal, "--resume", "-l", log)
+			self.assertIn("Resuming: 5 worlds already done", resumed)
+			# Only the torn world is played again, and its entry is written whole
+			with open(log) as file:
+				self.assertEqual(len(file.readlines()), 1)
+			self.assertEqual(loadJournal(journal), scores)
+			with open(journal, "rb") as file:
+				self.assertEqual(json.loads(file.read().splitlines()[-1])["task"], torn)
+			self.assertEqual(resumed.splitlines()[-1], complete.splitlines()[-1])
+
+
+if __name__ == "__main__":
+	unittest.main()
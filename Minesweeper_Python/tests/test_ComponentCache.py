@@ -0,0 +1,36 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from ComponentCache import ComponentCache, SYMMETRIES
+from FrontierSolver import FrontierSolver
+
+# An asymmetric component, so any cell mapped back to the wrong place changes its probability
+COMPONENT = [(((0, 0), (1, 0), (2, 0)), 1), (((2, 0), (2, 1), (2, 2), (3, 2)), 2), (((3, 2), (4, 2)), 1)]
+
+
+def moved(constraints, symmetry, dx, dy):
+	""" constraints with every cell mapped through symmetry and shifted by (dx, dy) """
+	def move(cell):
+		x, y = symmetry(*cell)
+		return x + dx, y + dy
+	return [(tuple(move(cell) for cell in cells), mines) for cells, mines in constraints]
+
+
+class ComponentCacheTest(unittest.TestCase):
+
+	def testSymmetricCopiesMapBackToTheirCells(self):
+		for symmetry in SYMMETRIES:
+			cache = ComponentCache()
+			solver = FrontierSolver(cache=cache)
+			solver.global_probabilities(COMPONENT, 4, 10)
+			copy = moved(COMPONENT, symmetry, 7, 9)
+			cached = solver.global_probabilities(copy, 4, 10)
+			self.assertEqual(cache.statistics()["hits"], 1)
+			self.assertEqual(cached, FrontierSolver(cache=None).global_probabilities(copy, 4, 10))
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,99 @@
+import itertools
+import os
+import random
+import sys
+import unittest
+from math import comb
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from FrontierSolver import FrontierSolver
+
+
+def bruteForce(constraints, minesLeft, interior):
+	""" Probabilities of global_probabilities by trying every mine layout of the constrained cells """
+	cells = sorted({cell for cellsOf, _ in constraints for cell in cellsOf})
+	total = 0
+	mineWeights = dict.fromkeys(cells, 0)
+	interiorMines = 0
+	for layout in itertools.product((0, 1), repeat=len(cells)):
+		mines = dict(zip(cells, layout))
+		if any(sum(mines[cell] for cell in cellsOf) != need for cellsOf, need in constraints):
+			continue
+		rest = minesLeft - sum(layout)
+		if not 0 <= rest <= interior:
+			continue
+		weight = comb(interior, rest)
+		total += weight
+		interiorMines += weight * rest
+		for cell in cells:
+			mineWeights[cell] += weight * mines[cell]
+	probabilities = {cell: mineWeights[cell] / total for cell in cells}
+	return probabilities, interiorMines / (total * interior) if interior else None
+
+
+def randomBoard(rng):
+	""" Constraints of a random small board with a few uncovered tiles, mines left and interior size """
+	rows = rng.randrange(3, 6)
+	cols = rng.randrange(3, 6)
+	tiles = [(c, r) for c in range(cols) for r in range(rows)]
+	mines = set(rng.sample(tiles, rng.randrange(1, len(tiles) // 2)))
+	uncovered = set(rng.sample([tile for tile in tiles if tile not in mines], rng.randrange(1, 5)))
+	constraints = []
+	for c, r in uncovered:
+		around = [(c + dc, r + dr) for dc in (-1, 0, 1) for dr in (-1, 0, 1)
+				  if (dc or dr) and 0 <= c + dc < cols and 0 <= r + dr < rows]
+		covered = tuple(tile for tile in around if tile not in uncovered)
+		if covered:
+			constraints.append((covered, sum(tile in mines for tile in covered)))
+	constrained = {cell for cellsOf, _ in constraints for cell in cellsOf}
+	interior = [tile for tile in tiles if tile not in uncovered and tile not in constrained]
+	return constraints, len(mines), len(interior)
+
+
+class GlobalProbabilitiesTest(unittest.TestCase):
+
+	def assertMatchesBruteForce(self, constraints, minesLeft, interior):
+		probabilities, interiorProbability = FrontierSolver(cache=None).global_probabilities(constraints, minesLeft, interior)
+		expected, expectedInterior = bruteForce(constraints, minesLeft, interior)
+		self.assertEqual(probabilities.keys(), expected.keys())
+		for cell, probability in expected.items():
+			self.assertAlmostEqual(probabilities[cell], probability, places=12)
+		if expectedInterior is None:
+			self.assertIsNone(interiorProbability)
+		else:
+			self.assertAlmostEqual(interiorProbability, expectedInterior, places=12)
+
+
+	def testRandomBoards(self):
+		rng = random.Random(6)
+		for _ in range(300):
+			constraints, minesLeft, interior = randomBoard(rng)
+			# Keep the brute force small
+			if constraints and len({cell for cellsOf, _ in constraints for cell in cellsOf}) <= 12:
+				self.assertMatchesBruteForce(constraints, minesLeft, interior)
+
+
+	def testGlobalMineCount(self):
+		# One mine in a pair and one mine left: the interior is safe, although no hint touches it
+		self.assertMatchesBruteForce([(((0, 0), (0, 1)), 1)], 1, 5)
+		probabilities, interiorProbability = FrontierSolver(cache=None).global_probabilities([(((0, 0), (0, 1)), 1)], 1, 5)
+		self.assertEqual(interiorProbability, 0)
+		# Two separate pairs and two mines left for them and four interior cells
+		self.assertMatchesBruteForce([(((0, 0), (0, 1)), 1), (((0, 3), (0, 4), (1, 4)), 1)], 3, 4)
+
+
+	def testInfeasibleComponent(self):
+		# (5, 0) and (5, 1) can't hold three mines: that component falls back to the local average
+		infeasible = [(((5, 0), (5, 1)), 3)]
+		feasible = [(((0, 0), (0, 1)), 1)]
+		solver = FrontierSolver(cache=None)
+		probabilities, interiorProbability = solver.global_probabilities(infeasible + feasible, 4, 3)
+		self.assertEqual({cell: probabilities[cell] for cell in ((5, 0), (5, 1))}, solver.local_average(infeasible))
+		self.assertEqual(probabilities[(0, 0)], 0.5)
+		# Resting on the estimate, the interior probability is never certain
+		self.assertTrue(0 < interiorProbability < 1)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,51 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from AI import AI
+from Action import Action
+from MyAI import MyAI
+from World import World
+from WorldStream import StreamSpec, streamRecord
+
+
+def moves(actions):
+	return [(action.getMove().name, action.getX(), action.getY()) for action in actions]
+
+
+class InvalidFirstBatchAI(MyAI):
+	""" MyAI that slips an off-board action into its first batch """
+
+	def getActionBatch(self, percepts):
+		actions = super().getActionBatch(percepts)
+		if not hasattr(self, "invalidSent"):
+			self.invalidSent = True
+			actions.insert(0, Action(AI.Action.UNCOVER, -1, -1))
+			self.last_batch.insert(0, (-1, -1))
+		return actions
+
+
+class ActionBatchTest(unittest.TestCase):
+
+	def testInvalidActionInBatchIsSkipped(self):
+		for index in range(1, 11):
+			record = streamRecord(StreamSpec(8, 8, 10, 10, 1), index)
+			expected = World(record=record, aiType="myai", headless=True, batchActions=True).run()
+			world = World(record=record, aiType=InvalidFirstBatchAI, headless=True, batchActions=True)
+			self.assertEqual(world.run(), expected)
+
+
+	def testNonePerceptIsIgnored(self):
+		agent = MyAI(8, 8, 10, 0, 0)
+		actions = agent.getActionBatch([0])
+		self.assertEqual(moves(actions), [("UNCOVER", 0, 1), ("UNCOVER", 1, 0), ("UNCOVER", 1, 1)])
+		# (1, 0) was skipped: only the zeros at (0, 1) and (1, 1) open up their neighbours
+		actions = agent.getActionBatch([0, None, 0])
+		self.assertEqual(moves(actions), [("UNCOVER", 0, 2), ("UNCOVER", 1, 2), ("UNCOVER", 2, 0),
+										  ("UNCOVER", 2, 1), ("UNCOVER", 2, 2)])
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,52 @@
+import array
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from AI import AI
+from Action import Action
+from ReplayLog import Game, actionCode, replay
+from World import World
+from WorldStream import StreamSpec, streamRecord
+
+
+class FlagForeverAI(AI):
+	""" Flags and unflags the same tile until the world stops the game """
+
+	def __init__(self, rows, cols, totalMines, startX, startY):
+		self.flagged = False
+
+
+	def getAction(self, number):
+		self.flagged = not self.flagged
+		return Action(AI.Action.FLAG if self.flagged else AI.Action.UNFLAG, 0, 0)
+
+
+class ReplayTest(unittest.TestCase):
+
+	def setUp(self):
+		self.record = streamRecord(StreamSpec(8, 8, 10, 1, 1), 1)
+		world = World(record=self.record, aiType=FlagForeverAI, headless=True, recordActions=True)
+		self.score = world.run()
+		self.actions = array.array("H", world.getActionLog())
+
+
+	def replay(self, actions):
+		game = Game(self.record.name, 8, 8, 10, False, self.score, actions)
+		return replay(game, self.record.mines, self.record.startX, self.record.startY)
+
+
+	def testGameEndsAtTheMoveLimit(self):
+		self.assertEqual(len(self.actions), 8 * 8 * 2 + 1)
+		self.assertEqual(self.replay(self.actions), (self.score, None))
+
+
+	def testActionAfterTheMoveLimitDiverges(self):
+		self.actions.append(actionCode(AI.Action.FLAG, 0, 0, 8))
+		self.assertEqual(self.replay(self.actions)[1], "1 actions after the game ended")
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,75 @@
+import array
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from MyAI import MyAI
+from ReplayLog import Game, replay
+from World import World
+from WorldCorpus import WorldRecord
+
+
+def record(startX, startY):
+	""" 4x4 world with one mine in the corner (0, 0) """
+	mines = bytearray(16)
+	mines[0] = 1
+	return WorldRecord("corner", 4, 4, startX, startY, 1, mines)
+
+
+class RecordingAI(MyAI):
+	""" MyAI that keeps every tile flood fill hands it, and how many it had before its first move """
+	""" The agent World built last is kept as RecordingAI.last """
+
+	last = None
+
+	def __init__(self, *args):
+		super().__init__(*args)
+		self.reveals = []
+		self.revealsAtStart = None
+		RecordingAI.last = self
+
+
+	def revealBatch(self, reveals):
+		self.reveals.extend(reveals)
+		super().revealBatch(reveals)
+
+
+	def getAction(self, number):
+		if self.revealsAtStart is None:
+			self.revealsAtStart = len(self.reveals)
+		return super().getAction(number)
+
+
+class FloodFillTest(unittest.TestCase):
+
+	def testNumberedStartIsNotFlooded(self):
+		world = World(record=record(1, 1), aiType=RecordingAI, headless=True, floodFill=True)
+		self.assertEqual(world.getPercept(), 1)
+		self.assertEqual(world.getScore(), 0)
+		agent = RecordingAI.last
+		self.assertEqual(world.run(), 1)
+		self.assertEqual(agent.revealsAtStart, 0)
+		self.assertNotIn((0, 0), [(x, y) for x, y, _ in agent.reveals])
+
+
+	def testZeroStartFloodsAroundTheMine(self):
+		world = World(record=record(3, 3), aiType=RecordingAI, headless=True, floodFill=True)
+		# Every safe tile is uncovered before the first move
+		self.assertEqual(world.getScore(), 1)
+		self.assertEqual(world.getMovesMade(), 0)
+
+
+	def testReplayMatchesLiveGame(self):
+		for start in ((1, 1), (3, 3)):
+			rec = record(*start)
+			world = World(record=rec, aiType="myai", headless=True, floodFill=True, recordActions=True)
+			score = world.run()
+			actions = world.getActionLog()
+			game = Game(rec.name, 4, 4, 1, True, score, array.array("H", actions))
+			self.assertEqual(replay(game, rec.mines, *start), (score, None))
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -12,6 +12,15 @@
 #				- "rowDimension" = the number of rows
 #				- "colDimension" = the number of columns
 #				- "numMines" = the number of mines
+#				- "--packed FILE" = write every world into one packed
+#								   corpus FILE (see WorldCorpus.py in
+#								   Minesweeper_Python/src) instead of
+#								   one text file per world
+#				- "--seed N" = base seed; world i is generated from
+#							   its own RNG seeded with (N, i), so the
+#							   same seed always gives the same worlds
+#				- "--jobs N" = number of processes to generate with
+#				- "--verbose" = print every world file as it is written
 #
 #				- You can only generate worlds of the same dimensions
 #				  and same number of mines. In order to generate worlds
@@ -26,82 +35,113 @@
 
 import random
 import os
+import sys
 import argparse
+from multiprocessing import Pool, cpu_count
 
+# Worlds are seeded and placed by the same code as Main.py's in-memory streams
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Minesweeper_Python", "src"))
+from WorldStream import createWorld, worldSeed
 
-def generateWorlds(numWorlds: int, baseFileName: "string", rowDimension: int, colDimension: int, numMines: int) -> None:
-	""" Generates N random worlds of a specified difficulty """
-	""" Each generated world will be a text file with baseFileName followed by a number """
-	for i in range(1, numWorlds+1):
-		createWorldFile(baseFileName+str(i), rowDimension, colDimension, numMines)
+# Worlds handed to a worker process at a time
+CHUNK_SIZE = 500
 
 
-def createWorldFile(filename: "string", rowDimension: int, colDimension: int, numMines: int) -> None:
-	""" Create a single Minesweeper world file """
-	print("Creating world " + filename + "...")
+def generateWorlds(numWorlds: int, baseFileName: "string", rowDimension: int, colDimension: int, numMines: int,
+				   seed: int = None, jobs: int = 1, verbose: bool = False) -> int:
+	""" Generates N random worlds of a specified difficulty, returning how many could not be written """
+	""" Each generated world will be a text file with baseFileName followed by a number """
+	if seed is None:
+		seed = random.randrange(2**32)
+	directory_name = __worldDirectory(baseFileName)
+	tasks = [(directory_name, baseFileName, start, min(start + CHUNK_SIZE, numWorlds + 1),
+			  rowDimension, colDimension, numMines, seed, verbose)
+			 for start in range(1, numWorlds + 1, CHUNK_SIZE)]
+	failures = sum(__runChunks(writeChunk, tasks, jobs))
+	if failures:
+		print("ERROR: Failed to write " + str(failures) + " of " + str(numWorlds) + " worlds in " + directory_name)
+	else:
+		print("Created " + str(numWorlds) + " worlds in " + directory_name + " (seed " + str(seed) + ")")
+	return failures
+
+
+def generateCorpus(numWorlds: int, baseFileName: "string", rowDimension: int, colDimension: int, numMines: int,
+				   corpusFile: "string", seed: int = None, jobs: int = 1) -> None:
+	""" Generates N random worlds into a single packed corpus file (see WorldCorpus.py) """
+	""" Each world is named baseFileName followed by a number, as the text files would be """
+	from WorldCorpus import CorpusWriter, WorldRecord
+
+	if seed is None:
+		seed = random.randrange(2**32)
+	tasks = [(start, min(start + CHUNK_SIZE, numWorlds + 1), rowDimension, colDimension, numMines, seed)
+			 for start in range(1, numWorlds + 1, CHUNK_SIZE)]
+	with CorpusWriter(corpusFile) as writer:
+		index = 1
+		for chunk in __runChunks(createChunk, tasks, jobs):
+			for startX, startY, mineIndices in chunk:
+				mines = bytearray(rowDimension * colDimension)
+				for i in mineIndices:
+					mines[i] = 1
+				writer.add(WorldRecord(baseFileName+str(index), rowDimension, colDimension, startX-1, startY-1, numMines, mines))
+				index += 1
+	print("Created corpus " + corpusFile + " with " + str(numWorlds) + " worlds (seed " + str(seed) + ")")
+
+
+def createChunk(task: "tuple") -> "list of tuples":
+	""" Create worlds start..stop-1 of a seeded run in memory """
+	start, stop, rowDimension, colDimension, numMines, seed = task
+	return [createWorld(rowDimension, colDimension, numMines, random.Random(worldSeed(seed, i)))
+			for i in range(start, stop)]
+
+
+def writeChunk(task: "tuple") -> int:
+	""" Create worlds start..stop-1 of a seeded run and write each to its text file, returning the failed writes """
+	directory_name, baseFileName, start, stop, rowDimension, colDimension, numMines, seed, verbose = task
+	failures = 0
+	for i in range(start, stop):
+		startX, startY, mineIndices = createWorld(rowDimension, colDimension, numMines, random.Random(worldSeed(seed, i)))
+		file_path = os.path.join(directory_name, baseFileName+str(i)+".txt")
+		if verbose:
+			print(file_path)
+		try:
+			with open(file_path, 'w') as file:
+				file.write(worldText(rowDimension, colDimension, startX, startY, mineIndices))
+		except OSError:
+			print("ERROR: Failed to open file " + file_path)
+			failures += 1
+	return failures
+
+
+def worldText(rowDimension: int, colDimension: int, startX: int, startY: int, mineIndices: "list of ints") -> str:
+	""" Render a world in the text world file format """
+	# Grid lines run from the top row down, two characters ("0 " or "1 ") per tile
+	grid = bytearray(b"0 ") * (rowDimension * colDimension)
+	for i in mineIndices:
+		c, r = divmod(i, rowDimension)
+		grid[((rowDimension - 1 - r) * colDimension + c) * 2] = ord("1")
+	width = colDimension * 2
+	lines = [grid[k * width:(k + 1) * width].decode() for k in range(rowDimension)]
+	return str(rowDimension) + " " + str(colDimension) + "\n" + str(startX) + " " + str(startY) + "\n" + "\n".join(lines) + "\n"
+
+
+def __worldDirectory(filename: "string") -> "string":
+	""" Problems/<difficulty> if that folder exists for the file's prefix, else Problems """
 	dir_name = os.path.abspath("Problems")
-	
 	difficulty_name = filename.split("_", 1)[0]
 	if os.path.isdir(os.path.join(dir_name, difficulty_name)):
-	    directory_name = os.path.join(dir_name, difficulty_name)
+		return os.path.join(dir_name, difficulty_name)
+	return dir_name
+
+
+def __runChunks(function: "callable", tasks: "list", jobs: int) -> "iterator":
+	""" Map function over tasks in order, on a process pool when jobs > 1 """
+	if jobs > 1 and len(tasks) > 1:
+		with Pool(processes=min(jobs, len(tasks))) as pool:
+			for result in pool.imap(function, tasks):
+				yield result
 	else:
-	    directory_name = dir_name
-	
-	file_path = os.path.join(directory_name, filename+".txt")
-	print(file_path)
-
-	nRows = rowDimension
-	nCols = colDimension
-	nMines = numMines
-
-	# Randomly set the starting tile
-	startX = __randomInt(nCols+1)
-	startY = __randomInt(nRows+1)
-	startingPatch = [(startX, startY)]
-	# Surrounding tiles can't have a mine
-	for coord in [(-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1), (-1, 0)]:
-		if __isInBounds(startX+coord[0], startY+coord[1], nRows, nCols):
-			startingPatch.append((startX+coord[0], startY+coord[1]))
-	
-	# Randomly place mines that aren't in startingPatch
-	mineCoords = []
-	currentMines = 0
-	while currentMines < nMines:
-		x = __randomInt(nCols+1)
-		y = __randomInt(nRows+1)
-		if (x, y) not in startingPatch and (x, y) not in mineCoords:
-			mineCoords.append((x, y))
-			currentMines += 1
-
-	# Open file for writing
-	try:
-		with open(file_path, 'w') as file:
-			# Write dimensions
-			file.write(str(nRows) + " " + str(nCols) + "\n")
-			# Write starting square
-			file.write(str(startX) + " " + str(startY) + "\n")
-			# Write 2D grid
-			for y in range(nRows, 0, -1):
-				for x in range(1, nCols+1):
-					if (x, y) in mineCoords:
-						file.write("1 ")
-					elif (x, y) in startingPatch:
-						file.write("0 ")
-					else:
-						file.write("0 ")
-				file.write("\n")
-	except:
-		print("ERROR: Failed to open file")
-
-
-def __randomInt(limit: int) -> int:
-	""" Return a random between 1 and limit """
-	return random.randrange(1, limit)
-
-
-def __isInBounds(x: int, y: int, nRows: int, nCols: int) -> bool:
-	""" Check if x and y is within bounds """
-	return (x >= 1 and x <= nCols and y >= 1 and y <= nRows)
+		for task in tasks:
+			yield function(task)
 
 
 def main():
@@ -114,6 +154,10 @@ def main():
 	parser.add_argument("rowDimension", help="Number of rows", action="store", type=int)
 	parser.add_argument("colDimension", help="Number of columns", action="store", type=int)
 	parser.add_argument("numMines", help="Number of mines", action="store", type=int)
+	parser.add_argument("--packed", help="Write all worlds into this packed corpus file instead of text files", action="store")
+	parser.add_argument("--seed", help="Base seed, so the same seed always gives the same worlds", action="store", type=int)
+	parser.add_argument("--jobs", help="Number of processes to generate with (0 = one per core)", action="store", type=int, default=1)
+	parser.add_argument("--verbose", help="Print every world file as it is written", action="store_true")
 
 	args = parser.parse_args()
 
@@ -124,7 +168,12 @@ def main():
 	numMines = args.numMines
 	
 	if (rowDimension >= 4 and colDimension >= 4 and (numMines <= rowDimension*colDimension - 9) and numMines >= 1):
-		generateWorlds(numFiles, filename, rowDimension, colDimension, numMines)
+		jobs = args.jobs if args.jobs > 0 else cpu_count()
+		if args.packed:
+			generateCorpus(numFiles, filename, rowDimension, colDimension, numMines, args.packed, args.seed, jobs)
+		else:
+			if generateWorlds(numFiles, filename, rowDimension, colDimension, numMines, args.seed, jobs, args.verbose):
+				sys.exit(1)
 	else:
 		print("ERROR: Could not generate worlds! \n\trowDimension >= 4, colDimension >= 4, 1 <= numMines <= (rowDimension*colDimension - 9)")
 